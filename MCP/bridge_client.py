@@ -7,18 +7,183 @@ It provides a clean interface for all tool modules to communicate with Rhino.
 
 import os
 import json
+import asyncio
 import logging
+import tempfile
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Client
 from typing import Dict, Any, Optional
 
+# orjson is optional; it encodes/decodes large tool payloads several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# httpx ships with the mcp SDK; async tools use its pooled client when present
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # Configuration for Rhino Bridge Server
 BRIDGE_HOST = os.getenv('RHINO_BRIDGE_HOST', 'localhost')
 BRIDGE_PORT = int(os.getenv('RHINO_BRIDGE_PORT', '8080'))
 BRIDGE_URL = f"http://{BRIDGE_HOST}:{BRIDGE_PORT}"
+BRIDGE_MAX_WORKERS = int(os.getenv('RHINO_BRIDGE_MAX_WORKERS', '4'))
+
+# Transport for POST calls: 'http' (default) or 'pipe' (named pipe on Windows,
+# Unix domain socket elsewhere). GET /status and /info always use HTTP.
+BRIDGE_TRANSPORT = os.getenv('RHINO_BRIDGE_TRANSPORT', 'http').lower()
+BRIDGE_PIPE = os.getenv(
+    'RHINO_BRIDGE_PIPE',
+    r'\\.\pipe\rhino_mcp' if os.name == 'nt' else os.path.join(tempfile.gettempdir(), 'rhino_mcp.sock')
+)
+
+# Seconds to wait for the bridge to answer a request, on every transport
+BRIDGE_TIMEOUT = 10
+
+# Shared worker pool for blocking bridge calls made from async tools
+_bridge_executor = ThreadPoolExecutor(max_workers=BRIDGE_MAX_WORKERS, thread_name_prefix="rhino-bridge")
 
 logger = logging.getLogger(__name__)
 
+def dumps_json(data: Any) -> bytes:
+    """Serialize a request/response payload to UTF-8 JSON bytes"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles those
+            pass
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def loads_json(payload: bytes) -> Any:
+    """Parse UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload.decode('utf-8'))
+
+class BridgeTransport:
+    """Sends a single request to the Rhino Bridge Server and returns the decoded response"""
+
+    def send(self, endpoint: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class HttpTransport(BridgeTransport):
+    """JSON over HTTP to the bridge server's BaseHTTPRequestHandler"""
+
+    def send(self, endpoint: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return _call_bridge_http(endpoint, data)
+
+
+class PipeResponseError(Exception):
+    """
+    A pipe request reached the bridge but no usable reply came back.
+    The handler may already have run, so the request must not be resent.
+    """
+
+    def __init__(self, message: str, error_type: str):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+class PipeTransport(BridgeTransport):
+    """
+    Length-prefixed JSON over a persistent named pipe / Unix socket.
+
+    One connection is opened lazily and reused. A connection that fails before
+    the request is written is reopened once; once the request has been written,
+    failures raise PipeResponseError instead of retrying.
+    """
+
+    def __init__(self, address: str):
+        self.address = address
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def send(self, endpoint: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        payload = dumps_json({"endpoint": endpoint, "data": data})
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._conn is None:
+                        self._conn = Client(self.address)
+                    self._conn.send_bytes(payload)
+                    break
+                except (OSError, EOFError):
+                    # Nothing was delivered; reopen a stale connection once
+                    self.close()
+                    if attempt == 1:
+                        raise
+
+            try:
+                if not self._conn.poll(BRIDGE_TIMEOUT):
+                    # A late reply would answer the next request; drop the connection
+                    self.close()
+                    raise PipeResponseError(
+                        f"Request to Rhino Bridge Server timed out after {BRIDGE_TIMEOUT} seconds",
+                        "Timeout"
+                    )
+                return loads_json(self._conn.recv_bytes())
+            except (OSError, EOFError) as e:
+                self.close()
+                raise PipeResponseError(
+                    f"Pipe connection to Rhino Bridge Server closed after the request was sent ({type(e).__name__})",
+                    "ConnectionError"
+                ) from e
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+
+
+# Pooled keep-alive connections to the bridge, shared by synchronous HTTP calls
+_http_session = requests.Session()
+
+_http_transport = HttpTransport()
+_pipe_transport = PipeTransport(BRIDGE_PIPE) if BRIDGE_TRANSPORT == 'pipe' else None
+
 def call_bridge_api(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Call the Rhino Bridge Server over the configured transport.
+
+    POST calls go over the pipe transport when RHINO_BRIDGE_TRANSPORT=pipe,
+    falling back to HTTP only if the request could not be written to the pipe.
+
+    Args:
+        endpoint: API endpoint (e.g., '/draw_line')
+        data: Request payload dictionary
+
+    Returns:
+        Dict containing the API response
+    """
+    if _pipe_transport is not None and data is not None:
+        try:
+            return _pipe_transport.send(endpoint, data)
+        except PipeResponseError as e:
+            # The bridge may already have run the handler; resending could repeat it
+            logger.error(f"Pipe request to {endpoint} failed after sending: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "error_type": e.error_type,
+                "endpoint": endpoint,
+                "request_data": data
+            }
+        except (OSError, EOFError) as e:
+            logger.warning(f"Pipe transport to {BRIDGE_PIPE} failed ({e}); falling back to HTTP")
+
+    return _http_transport.send(endpoint, data)
+
+def _call_bridge_http(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Make HTTP call to the Rhino Bridge Server.
 
@@ -36,15 +201,15 @@ def call_bridge_api(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dic
         if data is None:
             # GET request
             logger.info(f"Making GET request to {url}")
-            response = requests.get(url, timeout=10)
+            response = _http_session.get(url, timeout=BRIDGE_TIMEOUT)
         else:
             # POST request
             logger.info(f"Making POST request to {url} with data: {data}")
-            response = requests.post(
+            response = _http_session.post(
                 url,
-                json=data,
+                data=dumps_json(data),
                 headers={'Content-Type': 'application/json'},
-                timeout=10
+                timeout=BRIDGE_TIMEOUT
             )
 
         # Log response details for debugging
@@ -52,7 +217,7 @@ def call_bridge_api(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dic
         logger.debug(f"Response headers: {dict(response.headers)}")
 
         response.raise_for_status()
-        return response.json()
+        return loads_json(response.content)
 
     except requests.exceptions.ConnectionError as e:
         error_msg = f"Cannot connect to Rhino Bridge Server at {BRIDGE_URL}. Make sure the bridge server is running in Rhino."
@@ -65,7 +230,7 @@ def call_bridge_api(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dic
             "bridge_url": BRIDGE_URL
         }
     except requests.exceptions.Timeout as e:
-        error_msg = f"Request to Rhino Bridge Server timed out after 10 seconds"
+        error_msg = f"Request to Rhino Bridge Server timed out after {BRIDGE_TIMEOUT} seconds"
         logger.error(f"Timeout error for {endpoint}: {e}")
         return {
             "success": False,
@@ -135,6 +300,159 @@ def call_bridge_api(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dic
             "debug_hint": "The bridge server returned a non-JSON response. This may indicate a Python error in the handler or the endpoint doesn't exist."
         }
 
+# Pooled async HTTP client, bound to the event loop that created it
+_async_client = None
+_async_client_loop = None
+# Close tasks for retired clients, held so they aren't garbage-collected mid-close
+_closing_tasks = set()
+
+async def _close_quietly(client):
+    """Close a retired async client, ignoring errors from connections it can no longer use"""
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug(f"Error closing retired async client: {e}")
+
+def _get_async_client():
+    """
+    Return the shared httpx.AsyncClient for the running loop, creating it on first use.
+    A client left over from another event loop is closed before it is replaced.
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        previous, previous_loop = _async_client, _async_client_loop
+        if previous is not None and not previous.is_closed:
+            # Close it on its own loop when that loop is still running, otherwise here
+            if previous_loop is not None and previous_loop.is_running() and not previous_loop.is_closed():
+                asyncio.run_coroutine_threadsafe(_close_quietly(previous), previous_loop)
+            else:
+                task = loop.create_task(_close_quietly(previous))
+                _closing_tasks.add(task)
+                task.add_done_callback(_closing_tasks.discard)
+
+        _async_client = httpx.AsyncClient(
+            base_url=BRIDGE_URL,
+            timeout=BRIDGE_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=BRIDGE_MAX_WORKERS,
+                max_keepalive_connections=BRIDGE_MAX_WORKERS
+            )
+        )
+        _async_client_loop = loop
+    return _async_client
+
+async def _call_bridge_http_async(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Make a non-blocking HTTP call to the Rhino Bridge Server over the pooled client.
+    Error responses mirror _call_bridge_http.
+
+    Args:
+        endpoint: API endpoint (e.g., '/draw_line')
+        data: Request payload dictionary
+
+    Returns:
+        Dict containing the API response
+    """
+    response = None
+    try:
+        client = _get_async_client()
+
+        if data is None:
+            # GET request
+            logger.info(f"Making async GET request to {BRIDGE_URL}{endpoint}")
+            response = await client.get(endpoint)
+        else:
+            # POST request
+            logger.info(f"Making async POST request to {BRIDGE_URL}{endpoint} with data: {data}")
+            response = await client.post(
+                endpoint,
+                content=dumps_json(data),
+                headers={'Content-Type': 'application/json'}
+            )
+
+        logger.debug(f"Response status code: {response.status_code}")
+
+        response.raise_for_status()
+        return loads_json(response.content)
+
+    except httpx.ConnectError as e:
+        logger.error(f"Connection error: {e}")
+        return {
+            "success": False,
+            "error": f"Cannot connect to Rhino Bridge Server at {BRIDGE_URL}. Make sure the bridge server is running in Rhino.",
+            "error_type": "ConnectionError",
+            "endpoint": endpoint,
+            "bridge_url": BRIDGE_URL
+        }
+    except httpx.TimeoutException as e:
+        logger.error(f"Timeout error for {endpoint}: {e}")
+        return {
+            "success": False,
+            "error": f"Request to Rhino Bridge Server timed out after {BRIDGE_TIMEOUT} seconds",
+            "error_type": "Timeout",
+            "endpoint": endpoint,
+            "request_data": data
+        }
+    except httpx.HTTPStatusError as e:
+        status_code = response.status_code
+        response_text = response.text
+        logger.error(f"HTTP error for {endpoint}: {e}")
+        logger.error(f"Response body: {response_text[:500]}")
+        return {
+            "success": False,
+            "error": f"HTTP {status_code} error from bridge server",
+            "error_type": "HTTPError",
+            "status_code": status_code,
+            "endpoint": endpoint,
+            "response_body": response_text[:1000],
+            "request_data": data
+        }
+    except httpx.HTTPError as e:
+        logger.error(f"Bridge API request failed for {endpoint}: {e}")
+        return {
+            "success": False,
+            "error": f"Bridge API request failed: {str(e)}",
+            "error_type": "RequestException",
+            "endpoint": endpoint,
+            "request_data": data
+        }
+    except json.JSONDecodeError as e:
+        response_text = response.text if response is not None else ""
+        logger.error(f"Failed to parse JSON response from {endpoint}: {e}")
+        return {
+            "success": False,
+            "error": f"Bridge API request failed: {str(e)}",
+            "error_type": "JSONDecodeError",
+            "endpoint": endpoint,
+            "request_data": data,
+            "response_status": response.status_code if response is not None else "unknown",
+            "response_body": response_text[:1000],
+            "debug_hint": "The bridge server returned a non-JSON response. This may indicate a Python error in the handler or the endpoint doesn't exist."
+        }
+
+async def call_bridge_api_async(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Awaitable version of call_bridge_api for use inside async MCP tools.
+
+    With httpx available (and the HTTP transport selected) the request goes
+    through a pooled async client. Otherwise the blocking round-trip runs on
+    a shared worker pool. Either way the event loop keeps serving other tool
+    calls while Rhino is busy.
+
+    Args:
+        endpoint: API endpoint (e.g., '/draw_line')
+        data: Request payload dictionary
+
+    Returns:
+        Dict containing the API response
+    """
+    if httpx is not None and _pipe_transport is None:
+        return await _call_bridge_http_async(endpoint, data)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bridge_executor, call_bridge_api, endpoint, data)
+
 def get_bridge_status() -> Dict[str, Any]:
     """
     Check the status of the Rhino Bridge Server.
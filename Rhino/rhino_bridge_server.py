@@ -17,12 +17,21 @@ to keep dependencies isolated from other Rhino scripts.
 """
 
 import json
+import types
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Listener
 import urllib.parse
+import tempfile
 import sys
 import os
 
+# orjson is optional inside Rhino; fall back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add Tools directory to path for dynamic handler discovery
 tools_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Tools'))
 if tools_path not in sys.path:
@@ -56,6 +65,12 @@ except Exception as e:
 
 print(f"Bridge Server Running with DEBUG_MODE: {DEBUG_MODE}")
 
+# Named pipe (Windows) / Unix socket address for the low-overhead transport
+PIPE_ADDRESS = os.environ.get(
+    'RHINO_BRIDGE_PIPE',
+    r'\\.\pipe\rhino_mcp' if os.name == 'nt' else os.path.join(tempfile.gettempdir(), 'rhino_mcp.sock')
+)
+
 # Try to import Rhino modules - these should be available inside Rhino
 try:
     import rhinoscriptsyntax
@@ -85,9 +100,10 @@ except ImportError as e:
     DYNAMIC_HANDLERS_AVAILABLE = False
     print(f"Warning: Dynamic handler system not available: {e}")
 
-# Initialize handlers at module level
+# Initialize handlers at module level. After discovery this becomes a
+# read-only endpoint -> handler table (exact-match lookup per request).
 _handlers_initialized = False
-_dynamic_handlers = {}
+_dynamic_handlers = types.MappingProxyType({})
 
 def initialize_dynamic_handlers():
     """Initialize dynamic handlers by discovering tools"""
@@ -103,7 +119,7 @@ def initialize_dynamic_handlers():
         # Get handlers from registry
         from tool_registry import get_bridge_handlers
         handlers = get_bridge_handlers()
-        _dynamic_handlers.update(handlers)
+        _dynamic_handlers = types.MappingProxyType(dict(handlers))
         
         print(f"Initialized {len(_dynamic_handlers)} dynamic handlers:")
         for endpoint in sorted(_dynamic_handlers.keys()):
@@ -115,9 +131,153 @@ def initialize_dynamic_handlers():
         print(f"Error initializing dynamic handlers: {e}")
         return _dynamic_handlers
 
+# Handlers run one at a time regardless of which transport delivered the request
+_dispatch_lock = threading.Lock()
+
+def dispatch_endpoint(endpoint, request_data):
+    """
+    Run the dynamic handler registered for endpoint.
+
+    Returns:
+        (response_data, status_code) tuple
+    """
+    import traceback
+
+    if not _handlers_initialized:
+        initialize_dynamic_handlers()
+
+    handler_func = _dynamic_handlers.get(endpoint)
+    if handler_func is not None:
+        try:
+            with _dispatch_lock:
+                return handler_func(request_data), 200
+        except Exception as e:
+            # Detailed error logging for handler failures
+            error_traceback = traceback.format_exc()
+            print(f"ERROR: Handler exception for {endpoint}")
+            print(f"Exception type: {type(e).__name__}")
+            print(f"Exception message: {str(e)}")
+            print(f"Request data: {request_data}")
+            print(f"Full traceback:\n{error_traceback}")
+
+            error_response = {
+                "success": False,
+                "error": f"Handler error: {str(e)}",
+                "error_type": type(e).__name__,
+                "endpoint": endpoint,
+                "traceback": error_traceback,
+                "request_data": request_data,
+                "debug_hint": "An exception occurred in the Rhino bridge handler. Check the Rhino Python console for full traceback."
+            }
+            return error_response, 500
+
+    # If no dynamic handler found, return 404
+    available_endpoints = sorted(_dynamic_handlers.keys())
+    error_response = {
+        "success": False,
+        "error": f"Unknown endpoint: {endpoint}",
+        "error_type": "EndpointNotFound",
+        "endpoint": endpoint,
+        "available_endpoints": available_endpoints,
+        "debug_hint": f"The endpoint '{endpoint}' is not registered. Check if the handler is properly decorated with @bridge_handler."
+    }
+    return error_response, 404
+
+def _json_default(obj):
+    """Encode values orjson has no native support for: NamedTuples as dicts, anything else (e.g. .NET values) as str"""
+    if hasattr(obj, '_asdict'):
+        return obj._asdict()
+    return str(obj)
+
+def encode_response(data):
+    """Encode a response dict as JSON bytes, reusing a handler's pre-serialized body if present"""
+    response_bytes = getattr(data, 'json_bytes', None)
+    if response_bytes is None and orjson is not None:
+        try:
+            response_bytes = orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson still rejects (e.g. integers wider than 64 bits) go through json below
+            pass
+    if response_bytes is None:
+        # Compact output: indentation roughly doubles large component/slider payloads
+        response_bytes = json.dumps(data, separators=(',', ':'), default=_json_default).encode('utf-8')
+    return response_bytes
+
+def decode_request(payload):
+    """Parse a UTF-8 JSON request body"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload.decode('utf-8'))
+
+class PipeBridgeListener:
+    """
+    Serves bridge requests over a named pipe (Windows) or Unix socket.
+
+    Each message is a length-prefixed JSON object {"endpoint": ..., "data": ...};
+    the reply is the handler's JSON response. Connections are persistent.
+    """
+
+    def __init__(self, address=PIPE_ADDRESS):
+        self.address = address
+        self.listener = None
+
+    def start(self):
+        """Open the listener and accept connections on a background thread"""
+        if os.name != 'nt' and os.path.exists(self.address):
+            os.remove(self.address)  # Stale socket from a previous run
+        self.listener = Listener(self.address)
+        accept_thread = threading.Thread(target=self._accept_loop)
+        accept_thread.daemon = True
+        accept_thread.start()
+
+    def stop(self):
+        """Close the listener"""
+        if self.listener:
+            self.listener.close()
+            self.listener = None
+
+    def _accept_loop(self):
+        while self.listener:
+            try:
+                conn = self.listener.accept()
+            except (OSError, EOFError):
+                break
+            conn_thread = threading.Thread(target=self._serve, args=(conn,))
+            conn_thread.daemon = True
+            conn_thread.start()
+
+    def _serve(self, conn):
+        with conn:
+            while True:
+                try:
+                    payload = conn.recv_bytes()
+                except (OSError, EOFError):
+                    return
+
+                try:
+                    request = decode_request(payload)
+                    result, _ = dispatch_endpoint(request.get('endpoint', 'unknown'), request.get('data') or {})
+                except ValueError as e:
+                    result = {
+                        "success": False,
+                        "error": "Invalid JSON in request body",
+                        "error_type": "JSONDecodeError",
+                        "error_details": str(e),
+                        "debug_hint": "The request body is not valid JSON. Check the request formatting."
+                    }
+
+                try:
+                    conn.send_bytes(encode_response(result))
+                except (OSError, EOFError):
+                    return
+
 class RhinoBridgeHandler(BaseHTTPRequestHandler):
     """HTTP request handler for Rhino operations"""
     
+    # Keep-alive: clients reuse one TCP connection across tool calls instead of
+    # reconnecting per request. Every response must carry Content-Length.
+    protocol_version = "HTTP/1.1"
+    
     def log_message(self, format, *args):
         """Override to customize logging"""
         print(f"[Bridge] {format % args}")
@@ -138,10 +298,6 @@ class RhinoBridgeHandler(BaseHTTPRequestHandler):
         request_data = None
 
         try:
-            # Initialize dynamic handlers if not done yet
-            if not _handlers_initialized:
-                initialize_dynamic_handlers()
-
             # Parse the request path
             parsed_path = urllib.parse.urlparse(self.path)
             endpoint = parsed_path.path
@@ -150,49 +306,12 @@ class RhinoBridgeHandler(BaseHTTPRequestHandler):
             content_length = int(self.headers.get('Content-Length', 0))
             if content_length > 0:
                 post_data = self.rfile.read(content_length)
-                request_data = json.loads(post_data.decode('utf-8'))
+                request_data = decode_request(post_data)
             else:
                 request_data = {}
 
-            # Try dynamic handler
-            if endpoint in _dynamic_handlers:
-                try:
-                    handler_func = _dynamic_handlers[endpoint]
-                    result = handler_func(request_data)
-                    self.send_json_response(result)
-                    return
-                except Exception as e:
-                    # Detailed error logging for handler failures
-                    error_traceback = traceback.format_exc()
-                    print(f"ERROR: Handler exception for {endpoint}")
-                    print(f"Exception type: {type(e).__name__}")
-                    print(f"Exception message: {str(e)}")
-                    print(f"Request data: {request_data}")
-                    print(f"Full traceback:\n{error_traceback}")
-
-                    error_response = {
-                        "success": False,
-                        "error": f"Handler error: {str(e)}",
-                        "error_type": type(e).__name__,
-                        "endpoint": endpoint,
-                        "traceback": error_traceback,
-                        "request_data": request_data,
-                        "debug_hint": "An exception occurred in the Rhino bridge handler. Check the Rhino Python console for full traceback."
-                    }
-                    self.send_json_response(error_response, 500)
-                    return
-
-            # If no dynamic handler found, return 404
-            available_endpoints = sorted(_dynamic_handlers.keys())
-            error_response = {
-                "success": False,
-                "error": f"Unknown endpoint: {endpoint}",
-                "error_type": "EndpointNotFound",
-                "endpoint": endpoint,
-                "available_endpoints": available_endpoints,
-                "debug_hint": f"The endpoint '{endpoint}' is not registered. Check if the handler is properly decorated with @bridge_handler."
-            }
-            self.send_json_response(error_response, 404)
+            result, status_code = dispatch_endpoint(endpoint, request_data)
+            self.send_json_response(result, status_code)
 
         except json.JSONDecodeError as e:
             error_traceback = traceback.format_exc()
@@ -268,15 +387,18 @@ class RhinoBridgeHandler(BaseHTTPRequestHandler):
     
     def send_json_response(self, data, status_code=200):
         """Send JSON response"""
+        # Handlers may hand back a pre-serialized body (e.g. cached list_gh_files)
+        body = encode_response(data)
+        
         self.send_response(status_code)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')  # Enable CORS
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
         
-        response_json = json.dumps(data, indent=2)
-        self.wfile.write(response_json.encode('utf-8'))
+        self.wfile.write(body)
     
     def send_error_response(self, status_code, message):
         """Send error response"""
@@ -293,6 +415,7 @@ class RhinoBridgeHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
 class RhinoBridgeServer:
@@ -303,6 +426,7 @@ class RhinoBridgeServer:
         self.port = port
         self.server = None
         self.server_thread = None
+        self.pipe_listener = None
     
     def start(self):
         """Start the HTTP server"""
@@ -310,12 +434,23 @@ class RhinoBridgeServer:
             # Initialize dynamic handlers before starting
             initialize_dynamic_handlers()
             
-            self.server = HTTPServer((self.host, self.port), RhinoBridgeHandler)
+            # One thread per connection, so an idle keep-alive client can't block others
+            self.server = ThreadingHTTPServer((self.host, self.port), RhinoBridgeHandler)
+            self.server.daemon_threads = True
             self.server_thread = threading.Thread(target=self.server.serve_forever)
             self.server_thread.daemon = True
             self.server_thread.start()
             
             print(f"Rhino Bridge Server started on http://{self.host}:{self.port}")
+
+            # Pipe transport is optional; HTTP keeps working if it can't start
+            try:
+                self.pipe_listener = PipeBridgeListener()
+                self.pipe_listener.start()
+                print(f"Pipe transport listening on {self.pipe_listener.address}")
+            except Exception as e:
+                self.pipe_listener = None
+                print(f"Pipe transport not available: {e}")
             print("Available endpoints:")
             print("  GET  /status       - Server status")
             print("  GET  /info         - Server information")
@@ -335,6 +470,9 @@ class RhinoBridgeServer:
     
     def stop(self):
         """Stop the HTTP server"""
+        if self.pipe_listener:
+            self.pipe_listener.stop()
+            self.pipe_listener = None
         if self.server:
             self.server.shutdown()
             self.server.server_close()
@@ -9,11 +9,27 @@ Tools are automatically registered using the @gh_tool decorator.
 
 import sys
 import os
-from typing import Dict, Any
+import re
+import asyncio
+import logging
+import threading
+import heapq
+import itertools
+import traceback
+from collections import Counter, defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps, lru_cache
+from typing import Dict, Any, NamedTuple
+
+# orjson is optional inside Rhino; fall back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import bridge_client from MCP directory
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'MCP'))
-from bridge_client import call_bridge_api
+from bridge_client import call_bridge_api_async
 
 # Import the decorator system
 try:
@@ -22,6 +38,30 @@ except ImportError:
     # Fallback for direct import
     from tool_registry import gh_tool, bridge_handler
 
+# Grasshopper/Rhino assemblies are only present inside Rhino; resolve them once
+# so handlers don't repeat clr.AddReference and the imports on every bridge call
+try:
+    import clr
+    clr.AddReference('Grasshopper')
+    clr.AddReference('RhinoCommon')
+    clr.AddReference('GH_IO')
+    import Grasshopper
+    import Rhino
+    import System
+    from GH_IO.Serialization import GH_Archive
+    GH_NumberSlider = Grasshopper.Kernel.Special.GH_NumberSlider
+    GH_Panel = Grasshopper.Kernel.Special.GH_Panel
+    GH_BooleanToggle = Grasshopper.Kernel.Special.GH_BooleanToggle
+    GH_ValueList = Grasshopper.Kernel.Special.GH_ValueList
+    _GH_IMPORT_ERROR = None
+except Exception as e:
+    clr = sys.modules.get('clr')
+    Grasshopper = Rhino = System = GH_Archive = None
+    GH_NumberSlider = GH_Panel = GH_BooleanToggle = GH_ValueList = None
+    _GH_IMPORT_ERROR = str(e)
+
+logger = logging.getLogger(__name__)
+
 # Get DEBUG_MODE from environment or bridge server
 DEBUG_MODE = False
 try:
@@ -43,6 +83,17 @@ try:
 except:
     DEBUG_MODE = False
 
+# Grasshopper File Library locations, resolved once at import
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_LIBRARY_PATH = os.path.join(_SCRIPT_DIR, "Grasshopper File Library")
+_METADATA_PATH = os.path.join(_LIBRARY_PATH, "metadata.json")
+
+# Directories never descended into when scanning the library
+_SKIP_DIRS = frozenset({'__pycache__', 'node_modules', '.git', '.svn', '.hg'})
+
+# Last list_gh_files snapshot, keyed on the library's file sizes/mtimes
+_LIST_CACHE = {"signature": None, "result": None}
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -94,6 +145,329 @@ def filter_debug_response(response: Dict[str, Any]) -> Dict[str, Any]:
     return filtered
 
 
+# Last exception recorded by handlers that report errors without a traceback.
+# Kept as a TracebackException (no live frames); get_last_traceback formats it only if asked.
+_LAST_EXCEPTION = None
+
+def remember_exception(e):
+    """Record an exception for get_last_traceback instead of formatting it now"""
+    global _LAST_EXCEPTION
+    _LAST_EXCEPTION = traceback.TracebackException(
+        type(e), e, e.__traceback__, capture_locals=False
+    )
+
+def error_traceback(e):
+    """
+    Traceback for an error response: formatted in DEBUG_MODE, otherwise only
+    recorded for get_last_traceback and reported as None.
+    """
+    if DEBUG_MODE:
+        return traceback.format_exc()
+    remember_exception(e)
+    return None
+
+def error_response(error, **context):
+    """Failed-request payload: success False, the error message, then any request context to echo back"""
+    response = {"success": False, "error": error}
+    response.update(context)
+    return response
+
+_GH_PLUGIN = None
+
+# Serializes handlers that switch, save or modify the active document.
+# Re-entrant because handlers call each other (e.g. ensure_file_is_active).
+_GH_DOC_LOCK = threading.RLock()
+
+def holds_doc_lock(func):
+    """Run a bridge handler while holding the Grasshopper document lock"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with _GH_DOC_LOCK:
+            return func(*args, **kwargs)
+    return wrapper
+
+def run_on_ui_thread(func, timeout=5.0):
+    """
+    Run func on Rhino's UI thread in a single hop and return its result.
+    Called directly when already on the UI thread (or outside Rhino).
+
+    If the UI thread hasn't picked func up within timeout, the call is
+    cancelled: func will never run, and TimeoutError tells the caller nothing
+    was applied. Once func has started, it is always waited for, so it never
+    runs after the caller has returned (and released any lock it holds).
+
+    Args:
+        func: Callable taking no arguments
+        timeout: Seconds to wait for the UI thread to start func before giving up
+    """
+    if Rhino is None or not Rhino.RhinoApp.InvokeRequired:
+        return func()
+
+    outcome = {}
+    state = {"started": False, "cancelled": False}
+    state_lock = threading.Lock()
+    done = threading.Event()
+
+    def invoke():
+        with state_lock:
+            if state["cancelled"]:
+                return
+            state["started"] = True
+        try:
+            outcome["result"] = func()
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    Rhino.RhinoApp.InvokeOnUiThread(System.Action(invoke))
+    if not done.wait(timeout):
+        with state_lock:
+            if not state["started"]:
+                state["cancelled"] = True
+                raise TimeoutError(
+                    f"Rhino UI thread was busy for {timeout} seconds; the update was not applied"
+                )
+        done.wait()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+def requires_grasshopper(func):
+    """
+    Answer a bridge request with an error up front when the Grasshopper/Rhino
+    assemblies failed to load at import, instead of failing inside the handler.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _GH_IMPORT_ERROR is not None:
+            return {
+                "success": False,
+                "error": f"Grasshopper not available: {_GH_IMPORT_ERROR}"
+            }
+        return func(*args, **kwargs)
+    return wrapper
+
+def get_gh_plugin():
+    """
+    Return the Grasshopper plugin object, cached after the first successful lookup.
+
+    Returns:
+        The Grasshopper plugin object, or None if it is not loaded
+    """
+    global _GH_PLUGIN
+    if _GH_PLUGIN is None and Rhino is not None:
+        _GH_PLUGIN = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
+    return _GH_PLUGIN
+
+
+# Background writer for document saves; save_id -> (file_path, future), oldest first
+_WRITE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gh-writer")
+_SAVE_FUTURES = {}
+_SAVE_FUTURES_MAX = 64
+_save_ids = itertools.count(1)
+
+# Read-only document traversals that can be split across threads
+_READ_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="gh-reader")
+
+def _log_failed_save(file_path, future):
+    """Done-callback so a failed background save is visible even if nobody polls it"""
+    error = future.exception()
+    if error is not None or not future.result():
+        logger.error(f"Background save of '{file_path}' failed: {error or 'Write returned False'}")
+
+def submit_document_write(doc, file_path: str):
+    """
+    Serialize doc now and queue only the file write on the writer pool.
+
+    The document is archived on the calling thread, so the caller may close or
+    keep editing it as soon as this returns without affecting what is written.
+
+    Args:
+        doc: The GH_Document to save
+        file_path: Destination path, snapshotted by the caller
+
+    Returns:
+        (save_id, future) tuple; the future resolves to the write's boolean result
+    """
+    archive = GH_Archive()
+    if not archive.AppendObject(doc, "Definition"):
+        raise RuntimeError(f"Could not serialize '{file_path}'")
+
+    # Finished saves nobody polled are dropped, oldest first, once the table is full
+    if len(_SAVE_FUTURES) >= _SAVE_FUTURES_MAX:
+        for done_id in [k for k, (_, f) in _SAVE_FUTURES.items() if f.done()]:
+            if len(_SAVE_FUTURES) < _SAVE_FUTURES_MAX:
+                break
+            del _SAVE_FUTURES[done_id]
+
+    save_id = f"save-{next(_save_ids)}"
+    future = _WRITE_POOL.submit(archive.WriteToFile, file_path, True, False)
+    future.add_done_callback(lambda f: _log_failed_save(file_path, f))
+    _SAVE_FUTURES[save_id] = (file_path, future)
+    return save_id, future
+
+
+# basename.lower() -> GH_Document for every open document; None = rebuild on next use
+_OPEN_DOCS = None
+_open_docs_hooked = False
+
+# DocumentID -> [(event name, handler)] this module hooked on that document
+_DOC_EVENT_HOOKS = {}
+
+def _invalidate_open_docs(sender=None, e=None):
+    """Drop the open-document index (DocumentServer add event handler)"""
+    global _OPEN_DOCS
+    _OPEN_DOCS = None
+
+def _on_document_removed(sender, doc):
+    """DocumentServer remove event handler: drop the index and the document's caches"""
+    _invalidate_open_docs()
+    forget_document(doc)
+
+def _hook_document_event(gh_doc, event_name, handler):
+    """Subscribe handler to one of gh_doc's events and remember it for forget_document"""
+    event = getattr(gh_doc, event_name)
+    event += handler
+    _DOC_EVENT_HOOKS.setdefault(str(gh_doc.DocumentID), []).append((event_name, handler))
+
+def forget_document(gh_doc):
+    """
+    Unhook this module's event handlers from a closed document and drop every
+    per-DocumentID cache entry, so closed documents (and the objects the caches
+    reference) can be collected.
+
+    Args:
+        gh_doc: The GH_Document being closed or removed
+    """
+    global _LAST_ACTIVE
+    if gh_doc is None:
+        return
+    doc_key = str(gh_doc.DocumentID)
+
+    for event_name, handler in _DOC_EVENT_HOOKS.pop(doc_key, []):
+        try:
+            event = getattr(gh_doc, event_name)
+            event -= handler
+        except Exception:
+            logger.debug("Could not unhook %s from document %s", event_name, doc_key)
+
+    for cache in (_NAME_INDEX_CACHE, _STRUCTURE_SERIALS, _SPECIAL_OBJECTS_CACHE,
+                  _SOLUTION_SERIALS, _EML_SCAN_CACHE):
+        cache.pop(doc_key, None)
+    for cache_key in [k for k in _SPECIAL_INDEX_CACHE if k[0] == doc_key]:
+        _SPECIAL_INDEX_CACHE.pop(cache_key, None)
+    _PENDING_RECOMPUTE.discard(doc_key)
+    if _LAST_ACTIVE is not None and _LAST_ACTIVE[1] == doc_key:
+        _LAST_ACTIVE = None
+
+def get_open_docs() -> Dict[str, Any]:
+    """
+    Return the open Grasshopper documents indexed by lowercase file name.
+
+    The index is rebuilt lazily and dropped whenever the DocumentServer adds or
+    removes a document, so lookups between changes are a single dict access.
+
+    Returns:
+        Dict mapping lowercase basename to GH_Document
+    """
+    global _OPEN_DOCS, _open_docs_hooked
+    if _OPEN_DOCS is not None:
+        return _OPEN_DOCS
+
+    doc_server = Grasshopper.Instances.DocumentServer if Grasshopper is not None else None
+    if not doc_server:
+        return {}
+
+    open_docs = {}
+    for doc in doc_server:
+        if doc and doc.FilePath:
+            open_docs[os.path.basename(str(doc.FilePath)).lower()] = doc
+
+    if not _open_docs_hooked:
+        try:
+            doc_server.DocumentAdded += _invalidate_open_docs
+            doc_server.DocumentRemoved += _on_document_removed
+            _open_docs_hooked = True
+        except Exception:
+            # Without change events the index can't be trusted; rebuild every call
+            return open_docs
+
+    _OPEN_DOCS = open_docs
+    return open_docs
+
+
+def close_gh_document(doc) -> str:
+    """
+    Close a Grasshopper document through the DocumentServer API, bypassing
+    Rhino's command parser. Falls back to the _GrasshopperClose command on
+    Grasshopper versions without a DocumentServer. The canvas and the
+    DocumentServer are only touched on Rhino's UI thread.
+
+    Args:
+        doc: The GH_Document to close (must be the active one for the fallback)
+
+    Returns:
+        Name of the method used ("DocumentServer" or "RunScript")
+    """
+    def close():
+        _invalidate_open_docs()
+        forget_document(doc)
+        doc_server = getattr(Grasshopper.Instances, 'DocumentServer', None)
+        if doc_server is None:
+            Rhino.RhinoApp.RunScript("_GrasshopperClose", False)
+            return "RunScript"
+
+        # Detach from the canvas first so it doesn't keep drawing a removed document
+        canvas = Grasshopper.Instances.ActiveCanvas
+        if canvas and canvas.Document == doc:
+            canvas.Document = None
+        doc_server.RemoveDocument(doc)
+        return "DocumentServer"
+
+    return run_on_ui_thread(close)
+
+
+class PreSerialized(dict):
+    """
+    Response dict that also carries its already-encoded JSON body.
+    The bridge server sends json_bytes as-is instead of re-serializing.
+    """
+    __slots__ = ('json_bytes',)
+
+    def encode(self):
+        """Serialize the dict into json_bytes the way the bridge server encodes responses (compact)"""
+        if orjson is not None:
+            try:
+                self.json_bytes = orjson.dumps(self, default=str, option=orjson.OPT_NON_STR_KEYS)
+                return self
+            except TypeError:
+                # Values orjson rejects go through json below
+                pass
+        import json
+        self.json_bytes = json.dumps(self, separators=(',', ':'), default=str).encode('utf-8')
+        return self
+
+
+def walk_library(library_path: str = _LIBRARY_PATH):
+    """
+    Walk the Grasshopper File Library like os.walk, skipping hidden and
+    tooling directories (.git, __pycache__, Rhino scratch dirs, etc.).
+
+    Args:
+        library_path: Root folder to scan
+
+    Yields:
+        (root, dirs, files) tuples, as produced by os.walk
+    """
+    for root, dirs, files in os.walk(library_path):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in _SKIP_DIRS]
+        yield root, dirs, files
+
+
+# (lowercase file name, DocumentID) of the last file ensure_file_is_active confirmed
+_LAST_ACTIVE = None
+
 def ensure_file_is_active(file_name: str) -> Dict[str, Any]:
     """
     Helper function to ensure a specific Grasshopper file is active before performing operations.
@@ -105,25 +479,31 @@ def ensure_file_is_active(file_name: str) -> Dict[str, Any]:
     Returns:
         Dict with 'success' boolean and optional 'error' message
     """
+    global _LAST_ACTIVE
     if not file_name:
         return {"success": True}  # No specific file requested, use whatever is active
 
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import os
+        requested = file_name.lower()
 
         # Check if requested file is already active
         if Grasshopper.Instances.ActiveCanvas and Grasshopper.Instances.ActiveCanvas.Document:
             active_doc = Grasshopper.Instances.ActiveCanvas.Document
+            active_id = str(active_doc.DocumentID)
+
+            # Repeat request for the document confirmed last time (e.g. a slider drag)
+            if _LAST_ACTIVE == (requested, active_id):
+                return {"success": True}
+
             if active_doc.FilePath:
                 active_file_name = os.path.basename(str(active_doc.FilePath))
-                if active_file_name.lower() == file_name.lower():
+                if active_file_name.lower() == requested:
+                    _LAST_ACTIVE = (requested, active_id)
                     return {"success": True}  # Already active
 
         # Need to switch to the requested file
         # Call the set_active_gh_file handler directly
+        _LAST_ACTIVE = None
         result = handle_set_active_gh_file({"file_name": file_name})
 
         if not result.get("success", False):
@@ -135,13 +515,37 @@ def ensure_file_is_active(file_name: str) -> Dict[str, Any]:
         return {"success": True}
 
     except Exception as e:
-        import traceback
+        _LAST_ACTIVE = None
         return {
             "success": False,
             "error": f"Error ensuring file is active: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
+def get_active_gh_doc(file_name: str = None):
+    """
+    Activate the requested file if given and return the active Grasshopper document.
+
+    Args:
+        file_name: Name of the .gh file that should be active, or None to use the current one
+
+    Returns:
+        Tuple of (gh_doc, None) on success, or (None, error message)
+    """
+    if file_name is not None:
+        activation_result = ensure_file_is_active(file_name)
+        if not activation_result.get("success", False):
+            return None, activation_result.get("error", "Failed to activate file")
+
+    if not get_gh_plugin():
+        return None, "Grasshopper plugin not available"
+
+    canvas = Grasshopper.Instances.ActiveCanvas
+    gh_doc = canvas.Document if canvas else None
+    if not gh_doc:
+        return None, "No active Grasshopper document found"
+    return gh_doc, None
+
 # ============================================================================
 # FILE MANAGEMENT TOOLS
 # ============================================================================
@@ -165,7 +569,7 @@ async def list_gh_files() -> Dict[str, Any]:
     Returns:
         Dict containing available files information and metadata
     """
-    return call_bridge_api("/list_gh_files", {})
+    return await call_bridge_api_async("/list_gh_files", {})
 
 @bridge_handler("/list_gh_files")
 def handle_list_gh_files(data):
@@ -175,8 +579,7 @@ def handle_list_gh_files(data):
         import json
 
         # Get the library path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        library_path = os.path.join(script_dir, "Grasshopper File Library")
+        library_path = _LIBRARY_PATH
 
         if not os.path.exists(library_path):
             return {
@@ -185,12 +588,27 @@ def handle_list_gh_files(data):
                 "files": []
             }
 
+        # Find all .gh files recursively
+        found_files = []
+        for root, dirs, files in walk_library(library_path):
+            for file in files:
+                if file.lower().endswith('.gh'):
+                    full_path = os.path.join(root, file)
+                    stat = os.stat(full_path)
+                    found_files.append((file, full_path, stat.st_size, stat.st_mtime))
+
+        # Reuse the cached snapshot (and its encoded JSON) if nothing changed
+        metadata_path = _METADATA_PATH
+        metadata_mtime = os.path.getmtime(metadata_path) if os.path.exists(metadata_path) else None
+        signature = (tuple(found_files), metadata_mtime)
+        if _LIST_CACHE["signature"] == signature:
+            return _LIST_CACHE["result"]
+
         # Load metadata if available
-        metadata_path = os.path.join(library_path, "metadata.json")
         metadata = None
         metadata_files = {}
 
-        if os.path.exists(metadata_path):
+        if metadata_mtime is not None:
             try:
                 with open(metadata_path, 'r', encoding='utf-8') as f:
                     metadata = json.load(f)
@@ -202,41 +620,37 @@ def handle_list_gh_files(data):
                 # If metadata fails to load, continue without it
                 pass
 
-        # Find all .gh files recursively
         gh_files = []
-        for root, dirs, files in os.walk(library_path):
-            for file in files:
-                if file.lower().endswith('.gh'):
-                    full_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(full_path, library_path)
-
-                    file_info = {
-                        "name": file,
-                        "relative_path": relative_path,
-                        "full_path": full_path,
-                        "size_bytes": os.path.getsize(full_path)
-                    }
+        for file, full_path, size_bytes, _ in found_files:
+            relative_path = os.path.relpath(full_path, library_path)
+
+            file_info = {
+                "name": file,
+                "relative_path": relative_path,
+                "full_path": full_path,
+                "size_bytes": size_bytes
+            }
 
-                    # Add metadata if available
-                    if file in metadata_files:
-                        file_meta = metadata_files[file]
-                        file_info["description"] = file_meta.get("description", "")
-                        file_info["category"] = file_meta.get("category", "")
-                        file_info["tags"] = file_meta.get("tags", [])
-                        file_info["inputs"] = file_meta.get("inputs", [])
-                        file_info["outputs"] = file_meta.get("outputs", [])
-                        file_info["workflow_position"] = file_meta.get("workflow_position")
-                        file_info["dependencies"] = file_meta.get("dependencies", [])
+            # Add metadata if available
+            if file in metadata_files:
+                file_meta = metadata_files[file]
+                file_info["description"] = file_meta.get("description", "")
+                file_info["category"] = file_meta.get("category", "")
+                file_info["tags"] = file_meta.get("tags", [])
+                file_info["inputs"] = file_meta.get("inputs", [])
+                file_info["outputs"] = file_meta.get("outputs", [])
+                file_info["workflow_position"] = file_meta.get("workflow_position")
+                file_info["dependencies"] = file_meta.get("dependencies", [])
 
-                    gh_files.append(file_info)
+            gh_files.append(file_info)
 
-        result = {
+        result = PreSerialized({
             "success": True,
             "files": gh_files,
             "count": len(gh_files),
             "library_path": library_path,
             "message": f"Found {len(gh_files)} Grasshopper file(s) in library"
-        }
+        })
 
         # Include library info and workflows if metadata exists
         if metadata:
@@ -246,14 +660,18 @@ def handle_list_gh_files(data):
                 result["workflows"] = metadata["workflows"]
                 result["workflow_count"] = len(metadata["workflows"])
 
+        # Serialize once; the bridge server sends these bytes as-is
+        result.encode()
+        _LIST_CACHE["signature"] = signature
+        _LIST_CACHE["result"] = result
+
         return result
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error listing .gh files: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": error_traceback(e),
             "files": []
         }
 
@@ -287,28 +705,24 @@ async def open_gh_file(file_name: str, open_multiple: bool = False) -> Dict[str,
         "open_multiple": open_multiple
     }
 
-    return call_bridge_api("/open_gh_file", request_data)
+    return await call_bridge_api_async("/open_gh_file", request_data)
 
 @bridge_handler("/open_gh_file")
+@holds_doc_lock
 def handle_open_gh_file(data):
     """Bridge handler for opening .gh files"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
         import os
 
         file_name = data.get('file_name', '')
         open_multiple = data.get('open_multiple', False)
 
         # Get the library path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        library_path = os.path.join(script_dir, "Grasshopper File Library")
+        library_path = _LIBRARY_PATH
 
         # Find the file
         target_file = None
-        for root, dirs, files in os.walk(library_path):
+        for root, dirs, files in walk_library(library_path):
             for file in files:
                 if file == file_name or file.lower() == file_name.lower():
                     target_file = os.path.join(root, file)
@@ -460,9 +874,10 @@ def handle_open_gh_file(data):
             return filter_debug_response(result)
 
         except Exception as e:
-            import traceback
             debug_log.append(f"Exception during opening: {str(e)}")
-            debug_log.append(f"Traceback: {traceback.format_exc()[:500]}")
+            tb = error_traceback(e)
+            if tb:
+                debug_log.append(f"Traceback: {tb[:500]}")
 
             result = {
                 "success": False,
@@ -470,16 +885,15 @@ def handle_open_gh_file(data):
                 "file_name": file_name,
                 "file_path": target_file,
                 "debug_log": debug_log,
-                "traceback": traceback.format_exc()
+                "traceback": error_traceback(e)
             }
             return filter_debug_response(result)
 
     except Exception as e:
-        import traceback
         result = {
             "success": False,
             "error": f"Error opening .gh file: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": error_traceback(e),
             "file_name": data.get('file_name', 'unknown')
         }
         return filter_debug_response(result)
@@ -501,16 +915,12 @@ async def get_active_gh_files() -> Dict[str, Any]:
     Returns:
         Dict containing information about open files
     """
-    return call_bridge_api("/get_active_gh_files", {})
+    return await call_bridge_api_async("/get_active_gh_files", {})
 
 @bridge_handler("/get_active_gh_files")
 def handle_get_active_gh_files(data):
     """Bridge handler for getting active .gh files"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
         import os
 
         # Get the Grasshopper plugin
@@ -566,11 +976,10 @@ def handle_get_active_gh_files(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error getting active files: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": error_traceback(e),
             "open_files": []
         }
 
@@ -599,16 +1008,13 @@ async def set_active_gh_file(file_name: str) -> Dict[str, Any]:
         "file_name": file_name
     }
 
-    return call_bridge_api("/set_active_gh_file", request_data)
+    return await call_bridge_api_async("/set_active_gh_file", request_data)
 
 @bridge_handler("/set_active_gh_file")
+@holds_doc_lock
 def handle_set_active_gh_file(data):
     """Bridge handler for setting active .gh file - using simple OpenDocument approach"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
         import os
         import time
 
@@ -687,21 +1093,19 @@ def handle_set_active_gh_file(data):
                 "current_active": os.path.basename(str(Grasshopper.Instances.ActiveCanvas.Document.FilePath)) if Grasshopper.Instances.ActiveCanvas and Grasshopper.Instances.ActiveCanvas.Document and Grasshopper.Instances.ActiveCanvas.Document.FilePath else "Unknown"
             }
         except Exception as e:
-            import traceback
             return {
                 "success": False,
                 "error": f"Error calling OpenDocument: {str(e)}",
-                "traceback": traceback.format_exc(),
+                "traceback": error_traceback(e),
                 "file_name": file_name,
                 "file_path": target_path
             }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error setting active file: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 
@@ -730,16 +1134,13 @@ async def open_all_gh_files(file_names=None) -> Dict[str, Any]:
         "file_names": file_names
     }
 
-    return call_bridge_api("/open_all_gh_files", request_data)
+    return await call_bridge_api_async("/open_all_gh_files", request_data)
 
 @bridge_handler("/open_all_gh_files")
+@holds_doc_lock
 def handle_open_all_gh_files(data):
     """Bridge handler for opening multiple .gh files"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
         import os
 
         file_names = data.get('file_names', None)
@@ -777,13 +1178,12 @@ def handle_open_all_gh_files(data):
             overall_debug_log.append("Grasshopper already running")
 
         # Get the library path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        library_path = os.path.join(script_dir, "Grasshopper File Library")
+        library_path = _LIBRARY_PATH
 
         # Get all .gh files if no specific files requested
         if not file_names:
             file_names = []
-            for root, dirs, files in os.walk(library_path):
+            for root, dirs, files in walk_library(library_path):
                 for file in files:
                     if file.lower().endswith('.gh'):
                         file_names.append(file)
@@ -808,7 +1208,7 @@ def handle_open_all_gh_files(data):
 
             # Find the file
             target_file = None
-            for root, dirs, files in os.walk(library_path):
+            for root, dirs, files in walk_library(library_path):
                 for file in files:
                     if file.lower() == file_name.lower():
                         target_file = os.path.join(root, file)
@@ -879,9 +1279,10 @@ def handle_open_all_gh_files(data):
                 overall_debug_log.extend(debug_log)
 
             except Exception as e:
-                import traceback
                 debug_log.append(f"Exception: {str(e)}")
-                debug_log.append(f"Traceback: {traceback.format_exc()[:300]}")
+                tb = error_traceback(e)
+                if tb:
+                    debug_log.append(f"Traceback: {tb[:300]}")
                 results.append({
                     "file_name": file_name,
                     "success": False,
@@ -903,11 +1304,10 @@ def handle_open_all_gh_files(data):
         return filter_debug_response(result)
 
     except Exception as e:
-        import traceback
         result = {
             "success": False,
             "error": f"Error opening files: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
         return filter_debug_response(result)
 
@@ -915,359 +1315,1187 @@ def handle_open_all_gh_files(data):
     name="close_gh_file",
     description=(
         "Close a specific Grasshopper file by name. "
+        "The file is activated first if another file is currently active, so any open file can be closed. "
         "If the file has unsaved changes, you can specify whether to save or discard them.\n\n"
         "**Parameters:**\n"
         "- **file_name** (str): Name of the .gh file to close\n"
         "- **save_changes** (bool, optional): If True, saves changes before closing. Default False\n"
+        "- **await_save** (bool, optional): If False, the save runs in the background and the "
+        "response includes a save_id to poll with get_gh_save_status. Default True\n"
         "\n**Returns:**\n"
         "Dictionary containing the operation status."
     )
 )
-async def close_gh_file(file_name: str, save_changes: bool = False) -> Dict[str, Any]:
+async def close_gh_file(file_name: str, save_changes: bool = False, await_save: bool = True) -> Dict[str, Any]:
     """
     Close a Grasshopper file.
 
     Args:
         file_name: Name of the .gh file to close
         save_changes: Whether to save changes before closing
+        await_save: Whether to wait for the save to finish before returning
 
     Returns:
         Dict containing operation results
     """
-    request_data = {
-        "file_name": file_name,
-        "save_changes": save_changes
-    }
+    return await _close_coalesced(file_name, save_changes, await_save)
+
+class CloseGhFileRequest:
+    """
+    /close_gh_file payload, coerced once on either side of the bridge.
+    Slots keep per-field access cheap and reject unexpected attributes.
+    """
+    __slots__ = ('file_name', 'save_changes', 'await_save', 'debug')
+
+    def __init__(self, file_name: str = '', save_changes: bool = False, await_save: bool = True, debug: bool = False):
+        self.file_name = str(file_name or '')
+        self.save_changes = bool(save_changes)
+        self.await_save = bool(await_save)
+        self.debug = bool(debug)
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "CloseGhFileRequest":
+        """Build from a decoded request dict, ignoring unknown keys"""
+        return cls(
+            data.get('file_name', ''),
+            data.get('save_changes', False),
+            data.get('await_save', True),
+            data.get('debug', False)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "file_name": self.file_name,
+            "save_changes": self.save_changes,
+            "await_save": self.await_save,
+            "debug": self.debug
+        }
+
+# Flush tasks for coalesced batches, held so they aren't garbage-collected mid-send
+_BATCH_FLUSH_TASKS = set()
+
+def _start_batch_flush(coro):
+    """
+    Send a coalesced batch in its own task, so cancelling the caller that
+    gathered it never strands the other callers waiting on the same batch.
+    """
+    task = asyncio.ensure_future(coro)
+    _BATCH_FLUSH_TASKS.add(task)
+    task.add_done_callback(_BATCH_FLUSH_TASKS.discard)
+    return task
+
+# close_gh_file calls issued in the same event-loop tick, keyed by save options
+_pending_closes = {}
+
+async def _flush_close_batch(batch, save_changes: bool, await_save: bool):
+    """Send a batch of close requests and resolve every caller's future, whatever happens"""
+    # Callers cancelled while the batch was gathering are left out
+    batch = [(name, pending) for name, pending in batch if not pending.done()]
+    try:
+        if len(batch) == 1:
+            name, pending = batch[0]
+            request_data = CloseGhFileRequest(name, save_changes, await_save).to_dict()
+            response = await call_bridge_api_async("/close_gh_file", request_data)
+            if not pending.done():
+                pending.set_result(response)
+        elif batch:
+            response = await call_bridge_api_async("/close_gh_files", {
+                "file_names": [name for name, _ in batch],
+                "save_changes": save_changes,
+                "await_save": await_save
+            })
+            results = response.get("results") or []
+            for i, (_, pending) in enumerate(batch):
+                if not pending.done():
+                    pending.set_result(results[i] if i < len(results) else response)
+    except Exception as e:
+        for _, pending in batch:
+            if not pending.done():
+                pending.set_exception(e)
+    finally:
+        # Only reached with open futures if this task itself was cancelled
+        for _, pending in batch:
+            if not pending.done():
+                pending.cancel()
+
+async def _close_coalesced(file_name: str, save_changes: bool, await_save: bool = True) -> Dict[str, Any]:
+    """
+    Fuse close_gh_file calls made concurrently into one /close_gh_files round-trip.
+
+    The first caller yields once to the event loop so concurrent callers can join
+    its batch, then sends the batch and hands each caller its own result. Both
+    routes activate each file before closing it, so batching never changes the
+    outcome of a call. The batch is always taken down and sent, even if the first
+    caller is cancelled while it gathers.
+    """
+    future = asyncio.get_running_loop().create_future()
+    batch_key = (save_changes, await_save)
+    batch = _pending_closes.setdefault(batch_key, [])
+    batch.append((file_name, future))
+
+    if len(batch) == 1:
+        try:
+            await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            if _pending_closes.get(batch_key) is batch:
+                del _pending_closes[batch_key]
+            _start_batch_flush(_flush_close_batch(batch, save_changes, await_save))
 
-    return call_bridge_api("/close_gh_file", request_data)
+    return await future
 
 @bridge_handler("/close_gh_file")
 def handle_close_gh_file(data):
     """Bridge handler for closing .gh files"""
+    if Rhino is None:
+        return {
+            "success": False,
+            "error": "Rhino not available"
+        }
+
+    req = CloseGhFileRequest.from_data(data)
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import os
+        file_name = req.file_name
+        save_changes = req.save_changes
+        await_save = req.await_save
+        file_name_lc = file_name.lower()
 
-        file_name = data.get('file_name', '')
-        save_changes = data.get('save_changes', False)
+        # Closing a file that isn't open is a no-op (common for idempotent teardown)
+        if file_name_lc != "untitled" and file_name_lc not in get_open_docs():
+            return {
+                "success": True,
+                "message": f"'{file_name}' is not open",
+                "file_name": file_name,
+                "noop": True
+            }
 
         # Get the Grasshopper plugin
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
+        gh = get_gh_plugin()
         if not gh:
             return {
                 "success": False,
                 "error": "Grasshopper plugin not available"
             }
 
-        # Get the active document
-        if not Grasshopper.Instances.ActiveCanvas:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document"
-            }
+        with _GH_DOC_LOCK:
+            # Bring the file to the front first, the same whether this call
+            # arrives alone or fused into a /close_gh_files batch
+            if file_name_lc != "untitled":
+                activation_result = ensure_file_is_active(file_name)
+                if not activation_result.get("success", False):
+                    return {
+                        "success": False,
+                        "error": activation_result.get("error", "Failed to activate file"),
+                        "file_name": file_name
+                    }
 
-        active_doc = Grasshopper.Instances.ActiveCanvas.Document
-        if not active_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document"
-            }
+            # Get the active document
+            if not Grasshopper.Instances.ActiveCanvas:
+                return {
+                    "success": False,
+                    "error": "No active Grasshopper document"
+                }
 
-        # Check if this is the file to close
-        current_path = str(active_doc.FilePath) if active_doc.FilePath else ""
-        current_name = os.path.basename(current_path) if current_path else "Untitled"
+            active_doc = Grasshopper.Instances.ActiveCanvas.Document
+            if not active_doc:
+                return {
+                    "success": False,
+                    "error": "No active Grasshopper document"
+                }
 
-        if current_name.lower() != file_name.lower() and file_name.lower() != "untitled":
-            return {
-                "success": False,
-                "error": f"File '{file_name}' is not the active document. Currently active: '{current_name}'"
-            }
+            # Check if this is the file to close (snapshot the path so the
+            # save below targets this document even if the canvas switches)
+            current_path = str(active_doc.FilePath) if active_doc.FilePath else ""
+            current_name = os.path.basename(current_path) if current_path else "Untitled"
 
-        # Save if requested
-        if save_changes and active_doc.IsModified:
-            if active_doc.FilePath:
-                success = active_doc.Write(active_doc.FilePath)
-                if not success:
-                    return {
-                        "success": False,
-                        "error": "Failed to save file before closing"
-                    }
+            if current_name.lower() != file_name_lc and file_name_lc != "untitled":
+                return {
+                    "success": False,
+                    "error": f"File '{file_name}' is not the active document. Currently active: '{current_name}'"
+                }
 
-        # Close using Rhino command
-        Rhino.RhinoApp.RunScript("_GrasshopperClose", False)
+            # Save if requested (on the writer pool; wait for it unless told not to)
+            save_id = None
+            if save_changes and active_doc.IsModified:
+                if current_path:
+                    save_id, save_future = submit_document_write(active_doc, current_path)
+                    if await_save:
+                        _SAVE_FUTURES.pop(save_id, None)
+                        save_id = None
+                        if not save_future.result():
+                            return {
+                                "success": False,
+                                "error": "Failed to save file before closing"
+                            }
+
+            close_method = close_gh_document(active_doc)
 
-        return {
+        result = {
             "success": True,
             "message": f"Closed Grasshopper file: {file_name}",
             "file_name": file_name,
-            "changes_saved": save_changes
+            "changes_saved": save_changes,
+            "method": close_method
         }
+        if save_id:
+            result["save_pending"] = True
+            result["save_id"] = save_id
+        return result
 
     except Exception as e:
-        import traceback
-        return {
+        logger.exception("close_gh_file failed")
+        result = {
             "success": False,
-            "error": f"Error closing file: {str(e)}",
-            "traceback": traceback.format_exc()
+            "error": f"Error closing file: {str(e)}"
         }
-
-# ============================================================================
-# EML PARAMETER DISCOVERY AND MANAGEMENT
-# ============================================================================
+        if req.debug:
+            result["traceback"] = traceback.format_exc()
+        return result
 
 @gh_tool(
-    name="list_eml_parameters",
+    name="close_gh_files",
     description=(
-        "Discover all EML (eml_) prefixed parameters in the active Grasshopper file. "
-        "The eml_ naming convention is used to mark components for automated interaction "
-        "and cross-file data exchange. This tool finds all components with names starting "
-        "with 'eml_' including:\n\n"
-        "- **Sliders**: Number sliders for numeric input\n"
-        "- **Panels**: Text panels for output or input\n"
-        "- **Boolean Toggles**: True/False switches\n"
-        "- **Value Lists**: Dropdown selection components\n"
-        "- **Number Primitives**: Number containers\n"
-        "- **Text Primitives**: Text containers\n"
-        "- **Integer Primitives**: Integer containers\n"
-        "- **Geometry Parameters**: Curve, Brep, Line, Surface, Point, etc.\n\n"
-        "Each parameter includes metadata about its type, current value, direction (input/output), "
-        "and connection status to help with cross-file data exchange.\n\n"
-        "**Returns:**\n"
-        "Dictionary containing categorized lists of all eml_ parameters."
+        "Close several Grasshopper files in one call. "
+        "Each file is activated and closed in turn; unsaved changes are saved or discarded "
+        "according to save_changes.\n\n"
+        "**Parameters:**\n"
+        "- **file_names** (list): Names of the .gh files to close\n"
+        "- **save_changes** (bool, optional): If True, saves changes before closing. Default False\n"
+        "- **await_save** (bool, optional): If False, saves run in the background (see get_gh_save_status). Default True\n"
+        "\n**Returns:**\n"
+        "Dictionary containing the result for each file."
     )
 )
-async def list_eml_parameters() -> Dict[str, Any]:
+async def close_gh_files(file_names: list, save_changes: bool = False, await_save: bool = True) -> Dict[str, Any]:
     """
-    List all eml_ prefixed parameters in the Grasshopper document.
+    Close multiple Grasshopper files in a single bridge round-trip.
+
+    Args:
+        file_names: Names of the .gh files to close
+        save_changes: Whether to save changes before closing
+        await_save: Whether to wait for each save to finish before closing
 
     Returns:
-        Dict containing categorized eml_ parameters
+        Dict containing per-file results
     """
-    return call_bridge_api("/list_eml_parameters", {})
+    request_data = {
+        "file_names": file_names,
+        "save_changes": save_changes,
+        "await_save": await_save
+    }
 
-@bridge_handler("/list_eml_parameters")
-def handle_list_eml_parameters(data):
-    """Bridge handler for discovering all eml_ prefixed parameters"""
+    return await call_bridge_api_async("/close_gh_files", request_data)
+
+@bridge_handler("/close_gh_files")
+def handle_close_gh_files(data):
+    """Bridge handler for closing several .gh files at once"""
+    if Rhino is None:
+        return {
+            "success": False,
+            "error": "Rhino not available",
+            "results": []
+        }
+
+    options = CloseGhFileRequest.from_data(data)
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        file_names = data.get('file_names') or []
 
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available"
-            }
+        # One result per requested name, in request order (close_gh_file callers
+        # fused into this batch pick theirs up by position)
+        results = []
+        closed_results = {}
+        with _GH_DOC_LOCK:
+            for file_name in file_names:
+                # The same file listed twice (in any case) is only closed once;
+                # later entries repeat the first result
+                file_name_lc = file_name.lower()
+                if file_name_lc in closed_results:
+                    results.append(closed_results[file_name_lc])
+                    continue
 
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found"
-            }
+                # The single-file handler activates, saves and closes each file
+                options.file_name = file_name
+                result = handle_close_gh_file(options.to_dict())
+                closed_results[file_name_lc] = result
+                results.append(result)
 
-        # Storage for categorized parameters
-        eml_params = {
-            "sliders": [],
-            "panels": [],
-            "boolean_toggles": [],
-            "value_lists": [],
-            "number_primitives": [],
-            "text_primitives": [],
-            "integer_primitives": [],
-            "geometry_params": []
+        closed_count = sum(1 for r in closed_results.values() if r.get("success", False))
+
+        return {
+            "success": closed_count == len(closed_results),
+            "results": results,
+            "count": closed_count,
+            "message": f"Closed {closed_count} of {len(closed_results)} file(s)"
         }
 
-        # Scan all objects in the document
-        for obj in gh_doc.Objects:
-            try:
-                nick_name = obj.NickName or ""
-                if not nick_name.lower().startswith("eml_"):
-                    continue
+    except Exception as e:
+        logger.exception("close_gh_files failed")
+        result = {
+            "success": False,
+            "error": f"Error closing files: {str(e)}",
+            "results": []
+        }
+        if options.debug:
+            result["traceback"] = traceback.format_exc()
+        return result
 
-                # Get common properties
-                obj_guid = str(obj.InstanceGuid)
-                has_sources = hasattr(obj, 'SourceCount') and obj.SourceCount > 0
-                has_recipients = hasattr(obj, 'Recipients') and obj.Recipients.Count > 0
+@gh_tool(
+    name="get_gh_save_status",
+    description=(
+        "Check on a background save started by close_gh_file or close_gh_files with await_save=False.\n\n"
+        "**Parameters:**\n"
+        "- **save_id** (str): The save_id returned by the close call\n"
+        "\n**Returns:**\n"
+        "Dictionary with the save status: 'pending', 'saved' or 'failed'."
+    )
+)
+async def get_gh_save_status(save_id: str) -> Dict[str, Any]:
+    """
+    Poll the status of a background document save.
 
-                # Determine direction
-                if has_sources and has_recipients:
-                    direction = "passthrough"
-                elif has_sources:
-                    direction = "output"
-                elif has_recipients:
-                    direction = "input"
-                else:
-                    direction = "isolated"
+    Args:
+        save_id: Identifier returned by close_gh_file when await_save is False
+
+    Returns:
+        Dict containing the save status
+    """
+    request_data = {
+        "save_id": save_id
+    }
+
+    return await call_bridge_api_async("/save_status", request_data)
+
+@bridge_handler("/save_status")
+def handle_save_status(data):
+    """Bridge handler for polling background document saves"""
+    save_id = data.get('save_id', '')
+    entry = _SAVE_FUTURES.get(save_id)
+    if entry is None:
+        return {
+            "success": False,
+            "error": f"Unknown or expired save_id '{save_id}'",
+            "save_id": save_id
+        }
+
+    file_path, future = entry
+    if not future.done():
+        return {
+            "success": True,
+            "save_id": save_id,
+            "file_path": file_path,
+            "status": "pending"
+        }
+
+    # Finished saves are reported once, then forgotten
+    _SAVE_FUTURES.pop(save_id, None)
+    error = future.exception()
+    saved = error is None and bool(future.result())
+    result = {
+        "success": saved,
+        "save_id": save_id,
+        "file_path": file_path,
+        "status": "saved" if saved else "failed"
+    }
+    if not saved:
+        result["error"] = str(error) if error else "Failed to save file"
+    return result
+
+# ============================================================================
+# EML PARAMETER DISCOVERY AND MANAGEMENT
+# ============================================================================
+
+def _extract_slider(obj, base, max_values):
+    """Slider info for list_eml_parameters"""
+    name, guid, direction, has_sources, has_recipients, description = base
+    return {
+        "name": name,
+        "guid": guid,
+        "direction": direction,
+        "has_sources": has_sources,
+        "has_recipients": has_recipients,
+        "description": description,
+        "current_value": System.Decimal.ToDouble(obj.Slider.Value),
+        "min_value": System.Decimal.ToDouble(obj.Slider.Minimum),
+        "max_value": System.Decimal.ToDouble(obj.Slider.Maximum),
+        "precision": obj.Slider.DecimalPlaces,
+        "slider_type": obj.Slider.Type.ToString()
+    }
+
+def _extract_panel(obj, base, max_values):
+    """Panel info for list_eml_parameters"""
+    name, guid, direction, has_sources, has_recipients, description = base
+    properties = getattr(obj, 'Properties', None)
+    user_text = getattr(properties, 'UserText', None) if properties is not None else None
+    panel_text = str(user_text) if user_text is not None else ""
+
+    return {
+        "name": name,
+        "guid": guid,
+        "direction": direction,
+        "has_sources": has_sources,
+        "has_recipients": has_recipients,
+        "description": description,
+        "text": panel_text,
+        "multiline": properties.Multiline if properties is not None else True
+    }
+
+def _extract_boolean_toggle(obj, base, max_values):
+    """Boolean toggle info for list_eml_parameters"""
+    name, guid, direction, has_sources, has_recipients, description = base
+    return {
+        "name": name,
+        "guid": guid,
+        "direction": direction,
+        "has_sources": has_sources,
+        "has_recipients": has_recipients,
+        "description": description,
+        "value": bool(getattr(obj, 'Value', False))
+    }
+
+def _extract_value_list(obj, base, max_values):
+    """Value list info for list_eml_parameters"""
+    name, guid, direction, has_sources, has_recipients, description = base
+    selected_items = []
+    all_items = []
+
+    for item in getattr(obj, 'ListItems', None) or ():
+        item_name = str(getattr(item, 'Name', item))
+        all_items.append(item_name)
+        if getattr(item, 'Selected', False):
+            selected_items.append(item_name)
+
+    return {
+        "name": name,
+        "guid": guid,
+        "direction": direction,
+        "has_sources": has_sources,
+        "has_recipients": has_recipients,
+        "description": description,
+        "selected_items": selected_items,
+        "all_items": all_items
+    }
+
+def _primitive_values(obj, convert, max_values):
+    """
+    Read up to max_values items from a primitive's VolatileData.
+    Uses the goo's typed .Value instead of round-tripping through str().
+
+    Returns:
+        Tuple of (converted values, total item count)
+    """
+    volatile_data = getattr(obj, 'VolatileData', None)
+    if volatile_data is None:
+        return [], 0
+
+    values = []
+    for item in volatile_data.AllData(True):
+        if len(values) >= max_values:
+            break
+        try:
+            value = getattr(item, 'Value', None)
+            values.append(convert(value if value is not None else str(item)))
+        except:
+            pass
+
+    return values, volatile_data.DataCount
+
+def _primitive_info(obj, base, type_label, convert, max_values):
+    """Shared response shape for Number/Integer/Text primitives"""
+    name, guid, direction, has_sources, has_recipients, description = base
+    values, total_count = _primitive_values(obj, convert, max_values)
+    return {
+        "name": name,
+        "guid": guid,
+        "direction": direction,
+        "has_sources": has_sources,
+        "has_recipients": has_recipients,
+        "description": description,
+        "type": type_label,
+        "values": values,
+        "value_count": len(values),
+        "total_count": total_count,
+        "truncated": total_count > max_values
+    }
+
+def _extract_number_primitive(obj, base, max_values):
+    """Number primitive info for list_eml_parameters"""
+    return _primitive_info(obj, base, "Number", float, max_values)
+
+def _extract_integer_primitive(obj, base, max_values):
+    """Integer primitive info for list_eml_parameters"""
+    return _primitive_info(obj, base, "Integer", int, max_values)
+
+def _extract_text_primitive(obj, base, max_values):
+    """Text primitive info for list_eml_parameters"""
+    return _primitive_info(obj, base, "Text", str, max_values)
+
+def _extract_geometry_param(obj, base, max_values):
+    """Geometry parameter info for list_eml_parameters"""
+    name, guid, direction, has_sources, has_recipients, description = base
+    geom_count = getattr(obj, 'VolatileDataCount', 0)
+
+    return {
+        "name": name,
+        "guid": guid,
+        "direction": direction,
+        "has_sources": has_sources,
+        "has_recipients": has_recipients,
+        "description": description,
+        "geometry_type": type(obj).__name__.replace('Param_', '').replace('GH_', ''),
+        "geometry_count": geom_count,
+        "has_geometry": geom_count > 0
+    }
+
+def is_eml_name(nick_name):
+    """Case-insensitive eml_ prefix test without lowering the whole nickname"""
+    if not nick_name:
+        return False
+    return nick_name.startswith("eml_") or nick_name.startswith("EML_") or nick_name[:4].lower() == "eml_"
+
+# DocumentID -> (object count, {nickname_lower: obj}) for O(1) get/set lookups
+_NAME_INDEX_CACHE = {}
+
+def get_name_index(gh_doc, rebuild=False):
+    """
+    Nickname index for a Grasshopper document, rebuilt when the object count changes.
+
+    Args:
+        gh_doc: Grasshopper document to index
+        rebuild: Force a rebuild even if the cached index looks current
+
+    Returns:
+        Dict mapping lowercase nickname to the first object carrying it
+    """
+    doc_key = str(gh_doc.DocumentID)
+    object_count = gh_doc.ObjectCount
+    cached = _NAME_INDEX_CACHE.get(doc_key)
+    if not rebuild and cached is not None and cached[0] == object_count:
+        return cached[1]
+
+    index = {}
+    for obj in gh_doc.Objects:
+        nick_name = obj.NickName
+        if nick_name:
+            index.setdefault(nick_name.lower(), obj)
+
+    _NAME_INDEX_CACHE[doc_key] = (object_count, index)
+    return index
+
+def find_object_by_name(gh_doc, name):
+    """
+    Look up a document object by nickname (case-insensitive).
+    Renames don't change the object count, so a miss or stale hit rebuilds once.
+    """
+    key = (name or "").lower()
+    obj = get_name_index(gh_doc).get(key)
+    if obj is not None and (obj.NickName or "").lower() == key:
+        return obj
+    return get_name_index(gh_doc, rebuild=True).get(key)
+
+# DocumentID -> count of ObjectsAdded/ObjectsDeleted events seen (None if unhooked)
+_STRUCTURE_SERIALS = {}
+
+# DocumentID -> (structure revision, {special class: [objects]}) from one pass over Objects
+_SPECIAL_OBJECTS_CACHE = {}
+
+# CLR type -> special class its objects are bucketed under (None for everything else)
+_SPECIAL_BUCKET_CACHE = {}
+
+# (DocumentID, special class) -> (structure revision, [objects], {nickname: object})
+_SPECIAL_INDEX_CACHE = {}
+
+def _structure_revision(gh_doc):
+    """Revision stamp that changes whenever objects are added to or removed from a document"""
+    doc_key = str(gh_doc.DocumentID)
+    if doc_key not in _STRUCTURE_SERIALS:
+        _STRUCTURE_SERIALS[doc_key] = 0
+
+        def on_objects_changed(added):
+            def handler(sender, e):
+                serial = _STRUCTURE_SERIALS.get(doc_key, 0) + 1
+                _STRUCTURE_SERIALS[doc_key] = serial
+                _patch_special_objects(doc_key, sender, e, added, serial)
+            return handler
+
+        try:
+            _hook_document_event(gh_doc, 'ObjectsAdded', on_objects_changed(True))
+            _hook_document_event(gh_doc, 'ObjectsDeleted', on_objects_changed(False))
+        except Exception:
+            # Fall back to the object count alone
+            _STRUCTURE_SERIALS[doc_key] = None
+
+    return (gh_doc.ObjectCount, _STRUCTURE_SERIALS[doc_key])
+
+def _special_bucket(obj_type):
+    """Special class an object type is collected under; subclass checks run once per type"""
+    try:
+        return _SPECIAL_BUCKET_CACHE[obj_type]
+    except KeyError:
+        bucket = next((cls for cls in (GH_NumberSlider, GH_ValueList, GH_Panel) if issubclass(obj_type, cls)), None)
+        _SPECIAL_BUCKET_CACHE[obj_type] = bucket
+        return bucket
+
+def _patch_special_objects(doc_key, gh_doc, e, added, serial):
+    """
+    Apply an ObjectsAdded/ObjectsDeleted event to the cached buckets so the next
+    lookup doesn't rescan the document. Anything unexpected drops the cache instead.
+    """
+    cached = _SPECIAL_OBJECTS_CACHE.get(doc_key)
+    if cached is None:
+        return
+    try:
+        if cached[0][1] != serial - 1:
+            raise ValueError("cached buckets predate the previous event")
+
+        # Copy-on-write: readers on bridge threads may be iterating the old lists
+        buckets = {cls: list(objects) for cls, objects in cached[1].items()}
+        removed = defaultdict(set)
+        for obj in e.Objects:
+            bucket = _special_bucket(type(obj))
+            if bucket is None:
+                continue
+            if added:
+                buckets[bucket].append(obj)
+            else:
+                removed[bucket].add(obj.InstanceGuid)
+        for bucket, guids in removed.items():
+            buckets[bucket] = [obj for obj in buckets[bucket] if obj.InstanceGuid not in guids]
+
+        _SPECIAL_OBJECTS_CACHE[doc_key] = ((gh_doc.ObjectCount, serial), buckets)
+    except Exception:
+        _SPECIAL_OBJECTS_CACHE.pop(doc_key, None)
+
+def get_special_objects(gh_doc, rebuild=False):
+    """
+    Number sliders, value lists and panels of a document, collected in a single pass
+    over Objects and afterwards kept current from the document's add/delete events.
+
+    Returns:
+        Dict mapping GH_NumberSlider, GH_ValueList and GH_Panel to their objects in document order
+    """
+    doc_key = str(gh_doc.DocumentID)
+    revision = _structure_revision(gh_doc)
+    cached = _SPECIAL_OBJECTS_CACHE.get(doc_key)
+    if not rebuild and cached is not None and cached[0] == revision:
+        return cached[1]
+
+    buckets = {GH_NumberSlider: [], GH_ValueList: [], GH_Panel: []}
+    for obj in gh_doc.Objects:
+        bucket = _special_bucket(type(obj))
+        if bucket is not None:
+            buckets[bucket].append(obj)
+
+    _SPECIAL_OBJECTS_CACHE[doc_key] = (revision, buckets)
+    return buckets
+
+def get_special_index(gh_doc, special_class, rebuild=False):
+    """
+    Objects of one special class with a nickname map, rebuilt only when objects are added or removed.
+
+    Returns:
+        Tuple of (objects in document order, dict mapping nickname to the first object carrying it)
+    """
+    cache_key = (str(gh_doc.DocumentID), special_class)
+    revision = _structure_revision(gh_doc)
+    cached = _SPECIAL_INDEX_CACHE.get(cache_key)
+    if not rebuild and cached is not None and cached[0] == revision:
+        return cached[1], cached[2]
 
-                base_info = {
+    objects = get_special_objects(gh_doc, rebuild)[special_class]
+    by_name = {}
+    for obj in objects:
+        by_name.setdefault(obj.NickName or "Unnamed", obj)
+
+    _SPECIAL_INDEX_CACHE[cache_key] = (revision, objects, by_name)
+    return objects, by_name
+
+def find_special(gh_doc, special_class, name):
+    """
+    Look up a slider, value list or panel by nickname.
+    Renames don't add or remove objects, so a miss or stale hit rebuilds once.
+    """
+    obj = get_special_index(gh_doc, special_class)[1].get(name)
+    if obj is not None and (obj.NickName or "Unnamed") == name:
+        return obj
+    return get_special_index(gh_doc, special_class, rebuild=True)[1].get(name)
+
+def get_slider_index(gh_doc, rebuild=False):
+    """Number sliders of a document and their nickname map (see get_special_index)"""
+    return get_special_index(gh_doc, GH_NumberSlider, rebuild)
+
+def find_slider(gh_doc, slider_name):
+    """Look up a number slider by nickname"""
+    return find_special(gh_doc, GH_NumberSlider, slider_name)
+
+def list_item_snapshot(valuelist):
+    """(name, value string) for each item of a value list, read across the CLR boundary once"""
+    return [(item.Name, str(item.Value)) for item in valuelist.ListItems]
+
+def clamp_to_slider(slider, value):
+    """Clamp a float to a slider's bounds; Maximum is only read when Minimum doesn't decide it"""
+    minimum = System.Decimal.ToDouble(slider.Minimum)
+    if value < minimum:
+        return minimum
+    maximum = System.Decimal.ToDouble(slider.Maximum)
+    return maximum if value > maximum else value
+
+def find_slider_by_id(gh_doc, slider_id):
+    """Look up a number slider by InstanceGuid string; None if malformed or not a slider"""
+    try:
+        obj = gh_doc.FindObject(System.Guid.Parse(str(slider_id)), True)
+    except Exception:
+        return None
+    return obj if isinstance(obj, GH_NumberSlider) else None
+
+_GUID_PATTERN = re.compile(r"^\{?[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}\}?$")
+
+def resolve_slider(gh_doc, slider_key):
+    """Find a slider by instance id if the key looks like a GUID, otherwise by name"""
+    if _GUID_PATTERN.match(slider_key):
+        obj = find_slider_by_id(gh_doc, slider_key)
+        if obj is not None:
+            return obj
+    return find_slider(gh_doc, slider_key)
+
+# CLR type -> (eml_params category, extractor); (None, None) for unsupported types
+_TYPE_CATEGORY_CACHE = {}
+
+# Special components dispatch on the exact CLR type
+_SPECIAL_TYPE_EXTRACTORS = {
+    GH_NumberSlider: ("sliders", _extract_slider),
+    GH_Panel: ("panels", _extract_panel),
+    GH_BooleanToggle: ("boolean_toggles", _extract_boolean_toggle),
+    GH_ValueList: ("value_lists", _extract_value_list),
+} if Grasshopper is not None else {}
+
+# Primitive parameters dispatch on the CLR type name
+_PRIMITIVE_NAME_EXTRACTORS = {
+    'Param_Number': ("number_primitives", _extract_number_primitive),
+    'GH_NumberParameter': ("number_primitives", _extract_number_primitive),
+    'Param_Integer': ("integer_primitives", _extract_integer_primitive),
+    'GH_IntegerParameter': ("integer_primitives", _extract_integer_primitive),
+    'Param_String': ("text_primitives", _extract_text_primitive),
+    'GH_StringParameter': ("text_primitives", _extract_text_primitive),
+}
+
+# Geometry parameter type names (exact CLR names, matched with one hash lookup)
+_GEOM_PARAM_TYPES = frozenset({
+    'Param_Curve', 'Param_Surface', 'Param_Brep', 'Param_Geometry',
+    'Param_Line', 'Param_Circle', 'Param_Arc', 'Param_Point',
+    'Param_Mesh', 'Param_MeshFace', 'Param_Plane', 'Param_Vector'
+})
+
+def _classify_eml_type(obj_type):
+    """
+    Work out which list_eml_parameters category a component type belongs to.
+    Runs the lookups once per type; results are kept in _TYPE_CATEGORY_CACHE.
+    """
+    # Exact type first, then base classes so subclassed specials still match
+    for base in obj_type.__mro__:
+        entry = _SPECIAL_TYPE_EXTRACTORS.get(base)
+        if entry is not None:
+            return entry
+
+    type_name = obj_type.__name__
+    entry = _PRIMITIVE_NAME_EXTRACTORS.get(type_name)
+    if entry is not None:
+        return entry
+
+    # Geometry Parameters
+    if type_name in _GEOM_PARAM_TYPES:
+        return "geometry_params", _extract_geometry_param
+
+    return None, None
+
+# Connection type label used by suggest_eml_connections, cached per CLR type
+_CONNECTION_TYPE_CACHE = {}
+
+def _connection_type(obj_type):
+    """Map a component type to the suggest_eml_connections type label"""
+    param_type = _CONNECTION_TYPE_CACHE.get(obj_type)
+    if param_type is not None:
+        return param_type
+
+    type_name = obj_type.__name__
+    param_type = "unknown"
+    if issubclass(obj_type, GH_NumberSlider):
+        param_type = "slider_number"
+    elif issubclass(obj_type, GH_Panel):
+        param_type = "panel_text"
+    elif issubclass(obj_type, GH_BooleanToggle):
+        param_type = "boolean"
+    elif issubclass(obj_type, GH_ValueList):
+        param_type = "value_list"
+    elif 'Number' in type_name:
+        param_type = "number"
+    elif 'Integer' in type_name:
+        param_type = "integer"
+    elif 'String' in type_name:
+        param_type = "text"
+    elif 'Curve' in type_name:
+        param_type = "curve"
+    elif 'Brep' in type_name:
+        param_type = "brep"
+    elif 'Surface' in type_name:
+        param_type = "surface"
+    elif 'Point' in type_name:
+        param_type = "point"
+    elif 'Line' in type_name:
+        param_type = "line"
+    elif 'Mesh' in type_name:
+        param_type = "mesh"
+
+    _CONNECTION_TYPE_CACHE[obj_type] = param_type
+    return param_type
+
+# Bound once to skip the sys attribute lookup in the scan loop
+_intern = sys.intern
+
+# Direction indexed by (has_sources << 1) | has_recipients
+_DIRECTIONS = ("isolated", "input", "output", "passthrough")
+
+# suggest_eml_connections bucket for parameters without data, same index as _DIRECTIONS.
+# Anything holding data is an output; a data-less passthrough is left out.
+_EMPTY_CONNECTION_BUCKETS = ("isolated", "inputs", "isolated", None)
+
+# Component types that always carry a value, whatever their VolatileData says
+_ALWAYS_HAS_DATA = frozenset({"slider_number", "boolean", "value_list"})
+
+# DocumentID -> solution counter, bumped from each document's SolutionEnd event
+_SOLUTION_SERIALS = {}
+
+# DocumentID -> (content revision, max_values, records) from the last eml_ scan
+_EML_SCAN_CACHE = {}
+
+def _document_revision(gh_doc):
+    """Cheap revision stamp for a document: object count plus completed solutions"""
+    doc_key = str(gh_doc.DocumentID)
+    if doc_key not in _SOLUTION_SERIALS:
+        _SOLUTION_SERIALS[doc_key] = 0
+
+        def on_solution_end(sender, e):
+            _SOLUTION_SERIALS[doc_key] = _SOLUTION_SERIALS.get(doc_key, 0) + 1
+
+        try:
+            _hook_document_event(gh_doc, 'SolutionEnd', on_solution_end)
+        except Exception:
+            # Without the event every call rescans; mark the serial as unusable
+            _SOLUTION_SERIALS[doc_key] = None
+
+    serial = _SOLUTION_SERIALS[doc_key]
+    if serial is None:
+        return None
+    return (gh_doc.ObjectCount, serial)
+
+def _last_undo_record(gh_doc):
+    """Id of the newest undo record; changes on edits that don't solve (moves, renames, panel text)"""
+    undo_server = gh_doc.UndoServer
+    try:
+        return str(undo_server.UndoGuids[0]) if undo_server.UndoCount else ""
+    except Exception:
+        return f"{undo_server.UndoCount}:{undo_server.FirstUndoName}"
+
+def _content_revision(gh_doc):
+    """_document_revision plus the newest undo record, so renames also change the stamp"""
+    revision = _document_revision(gh_doc)
+    if revision is None:
+        return None
+    return revision + (_last_undo_record(gh_doc),)
+
+def scan_eml_objects(gh_doc, max_values=None):
+    """
+    Walk gh_doc.Objects once and describe every eml_ object for both
+    list_eml_parameters and suggest_eml_connections.
+
+    Args:
+        gh_doc: Grasshopper document to scan
+        max_values: Value cap for primitive entries; None accepts any cached scan
+
+    Returns:
+        List of records with category/entry (list view) and
+        bucket/connection_info (suggest view)
+    """
+    doc_key = str(gh_doc.DocumentID)
+    revision = _content_revision(gh_doc)
+    cached = _EML_SCAN_CACHE.get(doc_key)
+    if (revision is not None and cached is not None and cached[0] == revision
+            and (max_values is None or cached[1] == max_values)):
+        return cached[2]
+
+    if max_values is None:
+        max_values = 256
+
+    records = []
+    for obj in gh_doc.Objects:
+        try:
+            nick_name = obj.NickName
+            if not is_eml_name(nick_name):
+                continue
+            # Names recur across records and suggestions; share one string object
+            nick_name = _intern(str(nick_name))
+
+            # Get common properties
+            obj_guid = str(obj.InstanceGuid)
+            # getattr with a default is one probe; hasattr + access is two
+            has_sources = getattr(obj, 'SourceCount', 0) > 0
+            recipients = getattr(obj, 'Recipients', None)
+            has_recipients = recipients is not None and recipients.Count > 0
+
+            # Determine direction
+            direction_index = (has_sources << 1) | has_recipients
+            direction = _DIRECTIONS[direction_index]
+
+            # Common fields as a tuple; extractors build the final dict with literal keys
+            base = (nick_name, obj_guid, direction, has_sources, has_recipients,
+                    getattr(obj, 'Description', ""))
+
+            # Resolve category + extractor once per CLR type
+            obj_type = type(obj)
+            entry = _TYPE_CATEGORY_CACHE.get(obj_type)
+            if entry is None:
+                entry = _classify_eml_type(obj_type)
+                _TYPE_CATEGORY_CACHE[obj_type] = entry
+
+            category, extractor = entry
+            param_type = _connection_type(obj_type)
+            data_count = getattr(obj, 'VolatileDataCount', 0)
+            has_data = param_type in _ALWAYS_HAS_DATA or data_count > 0
+
+            records.append({
+                "category": category,
+                "entry": extractor(obj, base, max_values) if category is not None else None,
+                "bucket": "outputs" if has_data else _EMPTY_CONNECTION_BUCKETS[direction_index],
+                "connection_info": {
                     "name": nick_name,
+                    "type": param_type,
                     "guid": obj_guid,
-                    "direction": direction,
-                    "has_sources": has_sources,
-                    "has_recipients": has_recipients,
-                    "description": obj.Description if hasattr(obj, 'Description') else ""
+                    "has_data": has_data,
+                    "data_count": data_count
                 }
+            })
 
-                # 1. Number Sliders
-                if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                    eml_params["sliders"].append({
-                        **base_info,
-                        "current_value": float(str(obj.Slider.Value)),
-                        "min_value": float(str(obj.Slider.Minimum)),
-                        "max_value": float(str(obj.Slider.Maximum)),
-                        "precision": obj.Slider.DecimalPlaces,
-                        "slider_type": obj.Slider.Type.ToString()
-                    })
+        except Exception as e:
+            # Skip components that cause errors
+            continue
 
-                # 2. Panels
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                    panel_text = ""
-                    if hasattr(obj, 'Properties') and hasattr(obj.Properties, 'UserText'):
-                        panel_text = str(obj.Properties.UserText)
+    if revision is not None:
+        _EML_SCAN_CACHE[doc_key] = (revision, max_values, records)
+    return records
 
-                    eml_params["panels"].append({
-                        **base_info,
-                        "text": panel_text,
-                        "multiline": obj.Properties.Multiline if hasattr(obj, 'Properties') else True
-                    })
+def to_columns(entries):
+    """
+    Convert a list of same-shaped dicts into columnar form so repeated keys
+    are sent once: {"columns": [...], "rows": [[...], ...]}
+    """
+    columns = list(entries[0].keys()) if entries else []
+    return {
+        "columns": columns,
+        "rows": [[entry.get(column) for column in columns] for entry in entries]
+    }
 
-                # 3. Boolean Toggles
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_BooleanToggle):
-                    eml_params["boolean_toggles"].append({
-                        **base_info,
-                        "value": bool(obj.Value) if hasattr(obj, 'Value') else False
-                    })
+@gh_tool(
+    name="list_eml_parameters",
+    description=(
+        "Discover all EML (eml_) prefixed parameters in the active Grasshopper file. "
+        "The eml_ naming convention is used to mark components for automated interaction "
+        "and cross-file data exchange. This tool finds all components with names starting "
+        "with 'eml_' including:\n\n"
+        "- **Sliders**: Number sliders for numeric input\n"
+        "- **Panels**: Text panels for output or input\n"
+        "- **Boolean Toggles**: True/False switches\n"
+        "- **Value Lists**: Dropdown selection components\n"
+        "- **Number Primitives**: Number containers\n"
+        "- **Text Primitives**: Text containers\n"
+        "- **Integer Primitives**: Integer containers\n"
+        "- **Geometry Parameters**: Curve, Brep, Line, Surface, Point, etc.\n\n"
+        "Each parameter includes metadata about its type, current value, direction (input/output), "
+        "and connection status to help with cross-file data exchange.\n\n"
+        "**Parameters:**\n"
+        "- **max_values** (int, optional): Maximum values returned per primitive (default: 256). "
+        "Primitives holding more report truncated=true and their total_count\n"
+        "- **compact** (bool, optional): Return each category as {columns, rows} instead of a list "
+        "of dicts, which keeps large documents' responses much smaller (default: False)\n"
+        "\n**Returns:**\n"
+        "Dictionary containing categorized lists of all eml_ parameters."
+    )
+)
+async def list_eml_parameters(max_values: int = 256, compact: bool = False) -> Dict[str, Any]:
+    """
+    List all eml_ prefixed parameters in the Grasshopper document.
 
-                # 4. Value Lists
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                    selected_items = []
-                    all_items = []
-
-                    if hasattr(obj, 'ListItems'):
-                        for item in obj.ListItems:
-                            item_name = str(item.Name) if hasattr(item, 'Name') else str(item)
-                            all_items.append(item_name)
-                            if hasattr(item, 'Selected') and item.Selected:
-                                selected_items.append(item_name)
-
-                    eml_params["value_lists"].append({
-                        **base_info,
-                        "selected_items": selected_items,
-                        "all_items": all_items
-                    })
+    Args:
+        max_values: Maximum number of values returned per primitive parameter
+        compact: Return categories in columnar {columns, rows} form
 
-                # 5. Number Primitives
-                elif type(obj).__name__ == 'GH_NumberParameter' or 'Param_Number' in type(obj).__name__:
-                    values = []
-                    if hasattr(obj, 'VolatileData'):
-                        for branch in obj.VolatileData.Branches:
-                            for item in branch:
-                                try:
-                                    values.append(float(str(item)))
-                                except:
-                                    pass
-
-                    eml_params["number_primitives"].append({
-                        **base_info,
-                        "type": "Number",
-                        "values": values,
-                        "value_count": len(values)
-                    })
+    Returns:
+        Dict containing categorized eml_ parameters
+    """
+    request_data = {
+        "max_values": max_values,
+        "compact": compact
+    }
 
-                # 6. Integer Primitives
-                elif type(obj).__name__ == 'GH_IntegerParameter' or 'Param_Integer' in type(obj).__name__:
-                    values = []
-                    if hasattr(obj, 'VolatileData'):
-                        for branch in obj.VolatileData.Branches:
-                            for item in branch:
-                                try:
-                                    values.append(int(str(item)))
-                                except:
-                                    pass
-
-                    eml_params["integer_primitives"].append({
-                        **base_info,
-                        "type": "Integer",
-                        "values": values,
-                        "value_count": len(values)
-                    })
+    return await call_bridge_api_async("/list_eml_parameters", request_data)
 
-                # 7. Text/String Primitives
-                elif type(obj).__name__ == 'GH_StringParameter' or 'Param_String' in type(obj).__name__:
-                    values = []
-                    if hasattr(obj, 'VolatileData'):
-                        for branch in obj.VolatileData.Branches:
-                            for item in branch:
-                                values.append(str(item))
+@bridge_handler("/list_eml_parameters")
+@requires_grasshopper
+def handle_list_eml_parameters(data):
+    """Bridge handler for discovering all eml_ prefixed parameters"""
+    try:
+        # Get the Grasshopper plugin and document
+        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
+        if not gh:
+            return {
+                "success": False,
+                "error": "Grasshopper plugin not available"
+            }
 
-                    eml_params["text_primitives"].append({
-                        **base_info,
-                        "type": "Text",
-                        "values": values,
-                        "value_count": len(values)
-                    })
+        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
+        if not gh_doc:
+            return {
+                "success": False,
+                "error": "No active Grasshopper document found"
+            }
 
-                # 8. Geometry Parameters
-                elif any(geom_type in type(obj).__name__ for geom_type in [
-                    'Param_Curve', 'Param_Surface', 'Param_Brep', 'Param_Geometry',
-                    'Param_Line', 'Param_Circle', 'Param_Arc', 'Param_Point',
-                    'Param_Mesh', 'Param_Plane', 'Param_Vector'
-                ]):
-                    geom_count = 0
-                    if hasattr(obj, 'VolatileDataCount'):
-                        geom_count = obj.VolatileDataCount
+        max_values = int(data.get('max_values', 256))
 
-                    eml_params["geometry_params"].append({
-                        **base_info,
-                        "geometry_type": type(obj).__name__.replace('Param_', '').replace('GH_', ''),
-                        "geometry_count": geom_count,
-                        "has_geometry": geom_count > 0
-                    })
+        # Storage for categorized parameters
+        eml_params = {
+            "sliders": [],
+            "panels": [],
+            "boolean_toggles": [],
+            "value_lists": [],
+            "number_primitives": [],
+            "text_primitives": [],
+            "integer_primitives": [],
+            "geometry_params": []
+        }
 
-            except Exception as e:
-                # Skip components that cause errors
-                continue
+        # Shared scan with suggest_eml_connections, cached per document revision
+        for record in scan_eml_objects(gh_doc, max_values):
+            if record["category"] is not None:
+                eml_params[record["category"]].append(record["entry"])
 
         # Calculate totals
         total_count = sum(len(v) for v in eml_params.values())
 
+        summary = {
+            "total_count": total_count,
+            "sliders": len(eml_params["sliders"]),
+            "panels": len(eml_params["panels"]),
+            "boolean_toggles": len(eml_params["boolean_toggles"]),
+            "value_lists": len(eml_params["value_lists"]),
+            "number_primitives": len(eml_params["number_primitives"]),
+            "text_primitives": len(eml_params["text_primitives"]),
+            "integer_primitives": len(eml_params["integer_primitives"]),
+            "geometry_params": len(eml_params["geometry_params"])
+        }
+
+        if data.get('compact', False):
+            eml_params = {category: to_columns(entries) for category, entries in eml_params.items()}
+
         return {
             "success": True,
             "eml_parameters": eml_params,
-            "summary": {
-                "total_count": total_count,
-                "sliders": len(eml_params["sliders"]),
-                "panels": len(eml_params["panels"]),
-                "boolean_toggles": len(eml_params["boolean_toggles"]),
-                "value_lists": len(eml_params["value_lists"]),
-                "number_primitives": len(eml_params["number_primitives"]),
-                "text_primitives": len(eml_params["text_primitives"]),
-                "integer_primitives": len(eml_params["integer_primitives"]),
-                "geometry_params": len(eml_params["geometry_params"])
-            },
+            "summary": summary,
             "message": f"Found {total_count} eml_ prefixed parameters"
         }
 
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error discovering eml_ parameters: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
+        }
+
+def read_eml_parameter(obj):
+    """
+    Build the get_eml_parameter_value response for a single document object.
+
+    Args:
+        obj: Grasshopper document object
+
+    Returns:
+        Response dict, or None if the object type has no readable value
+    """
+    nick_name = obj.NickName or ""
+    # Slider
+    if isinstance(obj, GH_NumberSlider):
+        return {
+            "success": True,
+            "parameter_name": nick_name,
+            "type": "slider",
+            "value": System.Decimal.ToDouble(obj.Slider.Value)
+        }
+
+    # Panel
+    elif isinstance(obj, GH_Panel):
+        panel_text = ""
+        if hasattr(obj, 'Properties') and hasattr(obj.Properties, 'UserText'):
+            panel_text = str(obj.Properties.UserText)
+        return {
+            "success": True,
+            "parameter_name": nick_name,
+            "type": "panel",
+            "value": panel_text
+        }
+
+    # Boolean Toggle
+    elif isinstance(obj, GH_BooleanToggle):
+        return {
+            "success": True,
+            "parameter_name": nick_name,
+            "type": "boolean_toggle",
+            "value": bool(obj.Value) if hasattr(obj, 'Value') else False
         }
 
+    # Value List
+    elif isinstance(obj, GH_ValueList):
+        selected_items = []
+        if hasattr(obj, 'ListItems'):
+            for item in obj.ListItems:
+                if hasattr(item, 'Selected') and item.Selected:
+                    selected_items.append(str(item.Name) if hasattr(item, 'Name') else str(item))
+        return {
+            "success": True,
+            "parameter_name": nick_name,
+            "type": "value_list",
+            "value": selected_items
+        }
+
+    # Primitives (Number, Integer, Text)
+    elif hasattr(obj, 'VolatileData'):
+        values = []
+        for branch in obj.VolatileData.Branches:
+            for item in branch:
+                values.append(str(item))
+
+        param_type = "unknown"
+        cls_name = type(obj).__name__
+        if 'Number' in cls_name:
+            param_type = "number"
+            values = [float(v) for v in values]
+        elif 'Integer' in cls_name:
+            param_type = "integer"
+            values = [int(v) for v in values]
+        elif 'String' in cls_name:
+            param_type = "text"
+        elif any(g in cls_name for g in ['Curve', 'Brep', 'Surface', 'Point', 'Line']):
+            param_type = "geometry"
+            values = [f"{type(item).__name__}" for item in obj.VolatileData.AllData(True)]
+
+        return {
+            "success": True,
+            "parameter_name": nick_name,
+            "type": param_type,
+            "values": values,
+            "value_count": len(values)
+        }
+
+    return None
+
 @gh_tool(
     name="get_eml_parameter_value",
     description=(
@@ -1295,17 +2523,12 @@ async def get_eml_parameter_value(parameter_name: str) -> Dict[str, Any]:
         "parameter_name": parameter_name
     }
 
-    return call_bridge_api("/get_eml_parameter_value", request_data)
+    return await call_bridge_api_async("/get_eml_parameter_value", request_data)
 
 @bridge_handler("/get_eml_parameter_value")
 def handle_get_eml_parameter_value(data):
     """Bridge handler for getting eml_ parameter values"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-
         parameter_name = data.get('parameter_name', '')
 
         # Get the Grasshopper plugin and document
@@ -1324,93 +2547,167 @@ def handle_get_eml_parameter_value(data):
             }
 
         # Find the parameter
-        for obj in gh_doc.Objects:
-            nick_name = obj.NickName or ""
-            if nick_name.lower() == parameter_name.lower():
-                # Slider
-                if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                    return {
-                        "success": True,
-                        "parameter_name": nick_name,
-                        "type": "slider",
-                        "value": float(str(obj.Slider.Value))
-                    }
+        obj = find_object_by_name(gh_doc, parameter_name)
+        result = read_eml_parameter(obj) if obj is not None else None
+        if result is not None:
+            return result
 
-                # Panel
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                    panel_text = ""
-                    if hasattr(obj, 'Properties') and hasattr(obj.Properties, 'UserText'):
-                        panel_text = str(obj.Properties.UserText)
-                    return {
-                        "success": True,
-                        "parameter_name": nick_name,
-                        "type": "panel",
-                        "value": panel_text
-                    }
+        return {
+            "success": False,
+            "error": f"Parameter '{parameter_name}' not found",
+            "parameter_name": parameter_name
+        }
 
-                # Boolean Toggle
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_BooleanToggle):
-                    return {
-                        "success": True,
-                        "parameter_name": nick_name,
-                        "type": "boolean_toggle",
-                        "value": bool(obj.Value) if hasattr(obj, 'Value') else False
-                    }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error getting parameter value: {str(e)}",
+            "traceback": error_traceback(e)
+        }
 
-                # Value List
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                    selected_items = []
-                    if hasattr(obj, 'ListItems'):
-                        for item in obj.ListItems:
-                            if hasattr(item, 'Selected') and item.Selected:
-                                selected_items.append(str(item.Name) if hasattr(item, 'Name') else str(item))
-                    return {
-                        "success": True,
-                        "parameter_name": nick_name,
-                        "type": "value_list",
-                        "value": selected_items
-                    }
+@gh_tool(
+    name="batch_get_eml_parameter_values",
+    description=(
+        "Get the values of several eml_ prefixed parameters in a single call. "
+        "Equivalent to calling get_eml_parameter_value for each name, but with one bridge round-trip.\n\n"
+        "**Parameters:**\n"
+        "- **parameter_names** (list): Names of the eml_ parameters to read\n"
+        "\n**Returns:**\n"
+        "Dictionary mapping each requested name to its value and metadata."
+    )
+)
+async def batch_get_eml_parameter_values(parameter_names: list) -> Dict[str, Any]:
+    """
+    Get values for several eml_ parameters at once.
 
-                # Primitives (Number, Integer, Text)
-                elif hasattr(obj, 'VolatileData'):
-                    values = []
-                    for branch in obj.VolatileData.Branches:
-                        for item in branch:
-                            values.append(str(item))
-
-                    param_type = "unknown"
-                    if 'Number' in type(obj).__name__:
-                        param_type = "number"
-                        values = [float(v) for v in values]
-                    elif 'Integer' in type(obj).__name__:
-                        param_type = "integer"
-                        values = [int(v) for v in values]
-                    elif 'String' in type(obj).__name__:
-                        param_type = "text"
-                    elif any(g in type(obj).__name__ for g in ['Curve', 'Brep', 'Surface', 'Point', 'Line']):
-                        param_type = "geometry"
-                        values = [f"{type(item).__name__}" for item in obj.VolatileData.AllData(True)]
+    Args:
+        parameter_names: Names of the eml_ parameters
 
-                    return {
-                        "success": True,
-                        "parameter_name": nick_name,
-                        "type": param_type,
-                        "values": values,
-                        "value_count": len(values)
-                    }
+    Returns:
+        Dict mapping each name to its parameter value and metadata
+    """
+    request_data = {
+        "parameter_names": parameter_names
+    }
+
+    return await call_bridge_api_async("/batch_get_eml_parameter_values", request_data)
+
+@bridge_handler("/batch_get_eml_parameter_values")
+@requires_grasshopper
+def handle_batch_get_eml_parameter_values(data):
+    """Bridge handler for reading several eml_ parameter values in one call"""
+    try:
+        parameter_names = data.get('parameter_names') or []
+
+        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
+        if not gh_doc:
+            return {
+                "success": False,
+                "error": "No active Grasshopper document found"
+            }
+
+        values = {}
+        found_count = 0
+        for parameter_name in parameter_names:
+            obj = find_object_by_name(gh_doc, parameter_name)
+            result = read_eml_parameter(obj) if obj is not None else None
+            if result is None:
+                result = {
+                    "success": False,
+                    "error": f"Parameter '{parameter_name}' not found",
+                    "parameter_name": parameter_name
+                }
+            else:
+                found_count += 1
+            values[parameter_name] = result
 
         return {
-            "success": False,
-            "error": f"Parameter '{parameter_name}' not found",
-            "parameter_name": parameter_name
+            "success": True,
+            "values": values,
+            "requested_count": len(parameter_names),
+            "found_count": found_count
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
-            "error": f"Error getting parameter value: {str(e)}",
-            "traceback": traceback.format_exc()
+            "error": f"Error getting parameter values: {str(e)}",
+            "traceback": error_traceback(e)
+        }
+
+def apply_eml_parameter(obj, value):
+    """
+    Write a value into a single eml_ parameter without recomputing the solution.
+    Callers trigger gh_doc.NewSolution once after all writes are applied.
+
+    Args:
+        obj: Grasshopper document object
+        value: Value to set
+
+    Returns:
+        Result dict for the write
+    """
+
+    nick_name = obj.NickName or ""
+    # Slider
+    if isinstance(obj, GH_NumberSlider):
+        new_value = float(value)
+        # Convert Decimal <-> double directly rather than through strings
+        slider = obj.Slider
+        clamped_value = clamp_to_slider(slider, new_value)
+        slider.Value = System.Decimal(clamped_value)
+        return {
+            "success": True,
+            "parameter_name": nick_name,
+            "type": "slider",
+            "old_value": None,
+            "new_value": clamped_value
+        }
+
+    # Panel
+    elif isinstance(obj, GH_Panel):
+        if hasattr(obj, 'Properties'):
+            obj.Properties.UserText = str(value)
+        return {
+            "success": True,
+            "parameter_name": nick_name,
+            "type": "panel",
+            "new_value": str(value)
+        }
+
+    # Boolean Toggle
+    elif isinstance(obj, GH_BooleanToggle):
+        obj.Value = bool(value)
+        return {
+            "success": True,
+            "parameter_name": nick_name,
+            "type": "boolean_toggle",
+            "new_value": bool(value)
+        }
+
+    # Value List
+    elif isinstance(obj, GH_ValueList):
+        if hasattr(obj, 'ListItems'):
+            to_select = str(value).lower()
+            for item in obj.ListItems:
+                item_name = str(item.Name) if hasattr(item, 'Name') else str(item)
+                new_selected = item_name.lower() == to_select
+                # Only write items whose state actually changes
+                if item.Selected != new_selected:
+                    item.Selected = new_selected
+        return {
+            "success": True,
+            "parameter_name": nick_name,
+            "type": "value_list",
+            "new_value": str(value)
+        }
+
+    # For primitives, we can't directly set values as they receive from upstream
+    else:
+        return {
+            "success": False,
+            "error": f"Parameter type '{type(obj).__name__}' does not support direct value setting (primitives receive values from connected components)",
+            "parameter_name": nick_name
         }
 
 @gh_tool(
@@ -1448,18 +2745,13 @@ async def set_eml_parameter_value(parameter_name: str, value: Any) -> Dict[str,
         "value": value
     }
 
-    return call_bridge_api("/set_eml_parameter_value", request_data)
+    return await call_bridge_api_async("/set_eml_parameter_value", request_data)
 
 @bridge_handler("/set_eml_parameter_value")
+@holds_doc_lock
 def handle_set_eml_parameter_value(data):
     """Bridge handler for setting eml_ parameter values"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import System
-
         parameter_name = data.get('parameter_name', '')
         value = data.get('value')
 
@@ -1479,71 +2771,12 @@ def handle_set_eml_parameter_value(data):
             }
 
         # Find and set the parameter
-        for obj in gh_doc.Objects:
-            nick_name = obj.NickName or ""
-            if nick_name.lower() == parameter_name.lower():
-                # Slider
-                if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                    new_value = float(value)
-                    clamped_value = max(float(str(obj.Slider.Minimum)),
-                                      min(float(str(obj.Slider.Maximum)), new_value))
-                    obj.Slider.Value = System.Decimal.Parse(str(clamped_value))
-                    gh_doc.NewSolution(True)
-                    return {
-                        "success": True,
-                        "parameter_name": nick_name,
-                        "type": "slider",
-                        "old_value": None,
-                        "new_value": clamped_value
-                    }
-
-                # Panel
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                    if hasattr(obj, 'Properties'):
-                        obj.Properties.UserText = str(value)
-                    gh_doc.NewSolution(True)
-                    return {
-                        "success": True,
-                        "parameter_name": nick_name,
-                        "type": "panel",
-                        "new_value": str(value)
-                    }
-
-                # Boolean Toggle
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_BooleanToggle):
-                    obj.Value = bool(value)
-                    gh_doc.NewSolution(True)
-                    return {
-                        "success": True,
-                        "parameter_name": nick_name,
-                        "type": "boolean_toggle",
-                        "new_value": bool(value)
-                    }
-
-                # Value List
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                    if hasattr(obj, 'ListItems'):
-                        for item in obj.ListItems:
-                            item_name = str(item.Name) if hasattr(item, 'Name') else str(item)
-                            if item_name.lower() == str(value).lower():
-                                item.Selected = True
-                            else:
-                                item.Selected = False
-                    gh_doc.NewSolution(True)
-                    return {
-                        "success": True,
-                        "parameter_name": nick_name,
-                        "type": "value_list",
-                        "new_value": str(value)
-                    }
-
-                # For primitives, we can't directly set values as they receive from upstream
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Parameter type '{type(obj).__name__}' does not support direct value setting (primitives receive values from connected components)",
-                        "parameter_name": nick_name
-                    }
+        obj = find_object_by_name(gh_doc, parameter_name)
+        if obj is not None:
+            result = apply_eml_parameter(obj, value)
+            if result["success"]:
+                gh_doc.NewSolution(True)
+            return result
 
         return {
             "success": False,
@@ -1552,13 +2785,245 @@ def handle_set_eml_parameter_value(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error setting parameter value: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
+        }
+
+@gh_tool(
+    name="set_eml_parameter_values",
+    description=(
+        "Set several eml_ prefixed parameters and recompute the Grasshopper solution once. "
+        "Use this instead of repeated set_eml_parameter_value calls, each of which triggers a full recompute.\n\n"
+        "**Parameters:**\n"
+        "- **updates** (dict): Mapping of eml_ parameter name to the value to set "
+        "(same value rules as set_eml_parameter_value)\n"
+        "\n**Returns:**\n"
+        "Dictionary containing a result for each parameter and whether a solution was run."
+    )
+)
+async def set_eml_parameter_values(updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Set values for several eml_ parameters with a single recompute.
+
+    Args:
+        updates: Mapping of parameter name to value
+
+    Returns:
+        Dict containing per-parameter results
+    """
+    request_data = {
+        "updates": updates
+    }
+
+    return await call_bridge_api_async("/set_eml_parameter_values", request_data)
+
+@bridge_handler("/set_eml_parameter_values")
+@requires_grasshopper
+@holds_doc_lock
+def handle_set_eml_parameter_values(data):
+    """Bridge handler for setting several eml_ parameters with one NewSolution"""
+    try:
+        updates = data.get('updates') or {}
+
+        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
+        if not gh_doc:
+            return {
+                "success": False,
+                "error": "No active Grasshopper document found"
+            }
+
+        # Apply every write first, then recompute once
+        results = {}
+        applied_count = 0
+        for parameter_name, value in updates.items():
+            obj = find_object_by_name(gh_doc, parameter_name)
+            if obj is None:
+                results[parameter_name] = {
+                    "success": False,
+                    "error": f"Parameter '{parameter_name}' not found",
+                    "parameter_name": parameter_name
+                }
+                continue
+
+            try:
+                result = apply_eml_parameter(obj, value)
+            except Exception as e:
+                result = {
+                    "success": False,
+                    "error": f"Error setting parameter value: {str(e)}",
+                    "parameter_name": parameter_name
+                }
+            if result["success"]:
+                applied_count += 1
+            results[parameter_name] = result
+
+        if applied_count:
+            gh_doc.NewSolution(True)
+
+        return {
+            "success": applied_count == len(updates),
+            "results": results,
+            "applied_count": applied_count,
+            "failed_count": len(updates) - applied_count,
+            "solution_recomputed": applied_count > 0
         }
 
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error setting parameter values: {str(e)}",
+            "traceback": error_traceback(e)
+        }
+
+# (output type, input type) -> reason for suggest_eml_connections; exact matches are handled inline
+_EML_TYPE_COMPAT = {
+    # Numeric compatibility
+    **{(out_t, in_t): "Numeric types are compatible"
+       for out_t in ("slider_number", "number", "integer") for in_t in ("number", "integer")},
+    # Text compatibility
+    **{(out_t, in_t): "Text types are compatible"
+       for out_t in ("panel_text", "text", "value_list") for in_t in ("text", "panel_text")},
+    # Geometry compatibility (broader)
+    **{(out_t, in_t): f"{out_t.capitalize()} can be used as curve input"
+       for out_t in ("curve", "line") for in_t in ("curve", "geometry")},
+    **{(out_t, in_t): f"{out_t.capitalize()} can be used as surface/brep input"
+       for out_t in ("brep", "surface") for in_t in ("brep", "surface", "geometry")},
+}
+
+# output type -> input types it is compatible with (besides an exact match)
+_EML_COMPAT_INPUTS = defaultdict(set)
+for _out_t, _in_t in _EML_TYPE_COMPAT:
+    _EML_COMPAT_INPUTS[_out_t].add(_in_t)
+_EML_COMPAT_INPUTS = dict(_EML_COMPAT_INPUTS)
+
+@lru_cache(maxsize=1024)
+def related_names_reason(reason, common_words):
+    """Suggestion reason with the shared-name suffix, built once per (reason, words) pair"""
+    return reason + f" (names suggest related purpose: {', '.join(common_words)})"
+
+# (DocumentID, revision, file path, max_suggestions) -> last suggest_eml_connections response
+_SUGGEST_CACHE = OrderedDict()
+_SUGGEST_CACHE_SIZE = 16
+
+# Suggestion confidence is an int while ranking; names are only used in the response
+CONFIDENCE_NAMES = ("low", "medium", "high")
+MEDIUM_CONFIDENCE, HIGH_CONFIDENCE = 1, 2
+
+class EmlSuggestion(NamedTuple):
+    """One suggested eml_ connection; converted to a dict only when the response is built"""
+    from_parameter: str
+    from_type: str
+    to_parameter: str
+    to_type: str
+    reason: str
+    confidence: int  # index into CONFIDENCE_NAMES
+
+def iter_eml_suggestions(outputs, inputs):
+    """
+    Lazily yield EmlSuggestion tuples for output -> input pairs that are
+    type compatible or whose names share enough words.
+
+    Args:
+        outputs: connection_info dicts of parameters holding data
+        inputs: connection_info dicts of parameters waiting for data
+    """
+    # Unpack name/type and split each name into words once, not once per
+    # (output, input) pair
+    def entry(param_info):
+        name = param_info["name"]
+        words = name.lower().replace("eml_", "").split("_")
+        return name, param_info["type"], set(words), len(words)
+
+    output_entries = [entry(param_info) for param_info in outputs]
+    input_entries = [entry(param_info) for param_info in inputs]
+
+    # Index inputs by type and by name word so each output only visits
+    # inputs that can actually match, instead of every input
+    inputs_by_type = defaultdict(list)
+    inputs_by_word = defaultdict(list)
+    for index, (_, input_type, input_words, _) in enumerate(input_entries):
+        inputs_by_type[input_type].append(index)
+        for word in input_words:
+            inputs_by_word[word].append(index)
+
+    def name_match(output_words, output_word_count, input_words, input_word_count):
+        """Shared name words if the names suggest related purpose, else None"""
+        common_words = output_words & input_words
+        if common_words and len(common_words) / max(output_word_count, input_word_count) > 0.3:
+            return frozenset(common_words)
+        return None
+
+    # Parameters sharing a name would otherwise produce identical suggestions
+    seen = set()
+
+    # Suggest connections based on type compatibility
+    for output_name, output_type, output_words, output_word_count in output_entries:
+        # Exact type matches come straight from the type bucket: always
+        # compatible and always "high", no per-pair compatibility check
+        exact = inputs_by_type.get(output_type, ())
+        exact_reason = f"Exact type match: {output_type}"
+        for index in exact:
+            input_name, input_type, input_words, input_word_count = input_entries[index]
+            reason = exact_reason
+            common_words = name_match(output_words, output_word_count, input_words, input_word_count)
+            if common_words:
+                reason = related_names_reason(reason, common_words)
+            suggestion = EmlSuggestion(output_name, output_type, input_name, input_type, reason, HIGH_CONFIDENCE)
+            if suggestion not in seen:
+                seen.add(suggestion)
+                yield suggestion
+
+        # Remaining candidates: compatible types and name-word overlaps, "medium"
+        candidates = set()
+        for input_type in _EML_COMPAT_INPUTS.get(output_type, ()):
+            candidates.update(inputs_by_type.get(input_type, ()))
+        for word in output_words:
+            candidates.update(inputs_by_word.get(word, ()))
+        candidates.difference_update(exact)
+
+        # Sorted to keep suggestions in document order
+        for index in sorted(candidates):
+            input_name, input_type, input_words, input_word_count = input_entries[index]
+            reason = _EML_TYPE_COMPAT.get((output_type, input_type))
+            common_words = name_match(output_words, output_word_count, input_words, input_word_count)
+            if common_words:
+                reason = related_names_reason(reason or "", common_words)
+            if reason is not None:
+                suggestion = EmlSuggestion(output_name, output_type, input_name, input_type, reason, MEDIUM_CONFIDENCE)
+                if suggestion not in seen:
+                    seen.add(suggestion)
+                    yield suggestion
+
+def top_eml_suggestions(suggestions, limit):
+    """
+    Keep the best `limit` suggestions (highest confidence first, then generation order)
+    using a bounded heap, so memory stays O(limit) however many pairs match.
+
+    Returns:
+        Tuple of (ranked suggestions, True if any suggestion was dropped)
+    """
+    if limit <= 0:
+        return [], next(iter(suggestions), None) is not None
+
+    heap = []  # (score, -sequence, suggestion); heap[0] is the weakest kept
+    truncated = False
+    for sequence, suggestion in enumerate(suggestions):
+        item = (suggestion.confidence, -sequence, suggestion)
+        if len(heap) < limit:
+            heapq.heappush(heap, item)
+            continue
+        truncated = True
+        if heap[0][0] == HIGH_CONFIDENCE:
+            # Full of top-confidence picks; later suggestions can only tie and lose on order
+            break
+        if item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    heap.sort(key=lambda entry: entry[:2], reverse=True)
+    return [suggestion for _, _, suggestion in heap], truncated
+
 @gh_tool(
     name="suggest_eml_connections",
     description=(
@@ -1571,28 +3036,35 @@ def handle_set_eml_parameter_value(data):
         "- **Inputs**: Parameters waiting for data input\n"
         "- **Isolated**: Parameters with no connections\n\n"
         "It then suggests compatible connections based on data types.\n\n"
-        "**Returns:**\n"
+        "**Parameters:**\n"
+        "- **max_suggestions** (int, optional): Maximum suggestions returned (default: 1000); "
+        "when more match, the highest-confidence ones are kept and "
+        "summary.suggestions_truncated is true\n"
+        "\n**Returns:**\n"
         "Dictionary containing parameter categorization and suggested connections."
     )
 )
-async def suggest_eml_connections() -> Dict[str, Any]:
+async def suggest_eml_connections(max_suggestions: int = 1000) -> Dict[str, Any]:
     """
     Analyze and suggest connections between eml_ parameters.
 
+    Args:
+        max_suggestions: Maximum number of suggestions to return
+
     Returns:
         Dict containing connection suggestions
     """
-    return call_bridge_api("/suggest_eml_connections", {})
+    request_data = {
+        "max_suggestions": max_suggestions
+    }
+
+    return await call_bridge_api_async("/suggest_eml_connections", request_data)
 
 @bridge_handler("/suggest_eml_connections")
+@requires_grasshopper
 def handle_suggest_eml_connections(data):
     """Bridge handler for suggesting eml_ parameter connections"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-
         # Get the Grasshopper plugin and document
         gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
         if not gh:
@@ -1611,182 +3083,121 @@ def handle_suggest_eml_connections(data):
         # Get file information
         file_path = str(gh_doc.FilePath) if gh_doc.FilePath else "Untitled"
         file_name = os.path.basename(file_path) if file_path != "Untitled" else "Untitled"
+        max_suggestions = int(data.get('max_suggestions', 1000))
+
+        # Unchanged document (same object count, solution serial and undo record) -> reuse the last analysis
+        revision = _content_revision(gh_doc)
+        cache_key = (str(gh_doc.DocumentID), revision, file_path, max_suggestions)
+        cached = _SUGGEST_CACHE.get(cache_key) if revision is not None else None
+        if cached is not None:
+            _SUGGEST_CACHE.move_to_end(cache_key)
+            return dict(cached)
 
         # Categorize parameters
         outputs = []  # Has data, could export
         inputs = []   # Waiting for data
         isolated = [] # No connections
 
-        for obj in gh_doc.Objects:
-            try:
-                nick_name = obj.NickName or ""
-                if not nick_name.lower().startswith("eml_"):
-                    continue
-
-                obj_guid = str(obj.InstanceGuid)
-                has_sources = hasattr(obj, 'SourceCount') and obj.SourceCount > 0
-                has_recipients = hasattr(obj, 'Recipients') and obj.Recipients.Count > 0
-                has_data = False
-                data_count = 0
-
-                # Check for data
-                if hasattr(obj, 'VolatileDataCount'):
-                    data_count = obj.VolatileDataCount
-                    has_data = data_count > 0
-
-                # Determine parameter type
-                param_type = "unknown"
-                if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                    param_type = "slider_number"
-                    has_data = True
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                    param_type = "panel_text"
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_BooleanToggle):
-                    param_type = "boolean"
-                    has_data = True
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                    param_type = "value_list"
-                    has_data = True
-                elif 'Number' in type(obj).__name__:
-                    param_type = "number"
-                elif 'Integer' in type(obj).__name__:
-                    param_type = "integer"
-                elif 'String' in type(obj).__name__:
-                    param_type = "text"
-                elif 'Curve' in type(obj).__name__:
-                    param_type = "curve"
-                elif 'Brep' in type(obj).__name__:
-                    param_type = "brep"
-                elif 'Surface' in type(obj).__name__:
-                    param_type = "surface"
-                elif 'Point' in type(obj).__name__:
-                    param_type = "point"
-                elif 'Line' in type(obj).__name__:
-                    param_type = "line"
-                elif 'Mesh' in type(obj).__name__:
-                    param_type = "mesh"
-
-                param_info = {
-                    "name": nick_name,
-                    "type": param_type,
-                    "guid": obj_guid,
-                    "has_data": has_data,
-                    "data_count": data_count
-                }
-
-                # Categorize by connection status
-                if has_sources and not has_recipients:
-                    # Has input but no output = terminal/output
-                    if has_data:
-                        outputs.append(param_info)
-                    else:
-                        isolated.append(param_info)
-                elif has_recipients and not has_sources:
-                    # Has output but no input = source/input
-                    if has_data:
-                        outputs.append(param_info)
-                    else:
-                        inputs.append(param_info)
-                elif not has_sources and not has_recipients:
-                    # No connections
-                    if has_data:
-                        outputs.append(param_info)
-                    else:
-                        isolated.append(param_info)
-                else:
-                    # Has both = passthrough
-                    if has_data:
-                        outputs.append(param_info)
-
-            except Exception as e:
-                continue
+        # Buckets are decided during the scan; this is a single dispatch pass
+        buckets = {"outputs": outputs, "inputs": inputs, "isolated": isolated}
+        for record in scan_eml_objects(gh_doc):
+            bucket = record["bucket"]
+            if bucket is not None:
+                buckets[bucket].append(record["connection_info"])
+
+        # Nothing to pair when either side is empty (e.g. a document without eml_ params)
+        if outputs and inputs:
+            suggestions, suggestions_truncated = top_eml_suggestions(
+                iter_eml_suggestions(outputs, inputs), max_suggestions
+            )
+        else:
+            suggestions, suggestions_truncated = [], False
 
-        # Suggest connections based on type compatibility
-        suggestions = []
-        for output_param in outputs:
-            for input_param in inputs:
-                # Check type compatibility
-                compatible = False
-                reason = ""
-
-                output_type = output_param["type"]
-                input_type = input_param["type"]
-
-                # Exact type match
-                if output_type == input_type:
-                    compatible = True
-                    reason = f"Exact type match: {output_type}"
-
-                # Numeric compatibility
-                elif output_type in ["slider_number", "number", "integer"] and input_type in ["number", "integer"]:
-                    compatible = True
-                    reason = "Numeric types are compatible"
-
-                # Text compatibility
-                elif output_type in ["panel_text", "text", "value_list"] and input_type in ["text", "panel_text"]:
-                    compatible = True
-                    reason = "Text types are compatible"
-
-                # Geometry compatibility (broader)
-                elif output_type in ["curve", "line"] and input_type in ["curve", "geometry"]:
-                    compatible = True
-                    reason = f"{output_type.capitalize()} can be used as curve input"
-                elif output_type in ["brep", "surface"] and input_type in ["brep", "surface", "geometry"]:
-                    compatible = True
-                    reason = f"{output_type.capitalize()} can be used as surface/brep input"
-
-                # Name similarity (suggests intent)
-                name_similarity = 0
-                output_words = output_param["name"].lower().replace("eml_", "").split("_")
-                input_words = input_param["name"].lower().replace("eml_", "").split("_")
-                common_words = set(output_words) & set(input_words)
-                if common_words:
-                    name_similarity = len(common_words) / max(len(output_words), len(input_words))
-                    if name_similarity > 0.3:
-                        compatible = True
-                        reason += f" (names suggest related purpose: {', '.join(common_words)})"
-
-                if compatible:
-                    suggestions.append({
-                        "from_parameter": output_param["name"],
-                        "from_type": output_type,
-                        "to_parameter": input_param["name"],
-                        "to_type": input_type,
-                        "reason": reason,
-                        "confidence": "high" if output_type == input_type else "medium"
-                    })
+        output_count, input_count, isolated_count = len(outputs), len(inputs), len(isolated)
+        suggestion_count = len(suggestions)
+        total_count = output_count + input_count + isolated_count
 
-        return {
+        response = {
             "success": True,
             "file_name": file_name,
             "file_path": file_path,
             "outputs": outputs,
             "inputs": inputs,
             "isolated": isolated,
-            "suggestions": suggestions,
+            "suggestions": [
+                suggestion._replace(confidence=CONFIDENCE_NAMES[suggestion.confidence])._asdict()
+                for suggestion in suggestions
+            ],
             "summary": {
-                "total_eml_params": len(outputs) + len(inputs) + len(isolated),
-                "output_params": len(outputs),
-                "input_params": len(inputs),
-                "isolated_params": len(isolated),
-                "suggested_connections": len(suggestions)
+                "total_eml_params": total_count,
+                "output_params": output_count,
+                "input_params": input_count,
+                "isolated_params": isolated_count,
+                "suggested_connections": suggestion_count,
+                "suggestions_truncated": suggestions_truncated
             },
-            "message": f"Analyzed {len(outputs) + len(inputs) + len(isolated)} eml_ parameters and found {len(suggestions)} potential connections"
+            "message": f"Analyzed {total_count} eml_ parameters and found {suggestion_count} potential connections"
         }
 
-    except ImportError as e:
+        if revision is not None:
+            _SUGGEST_CACHE[cache_key] = response
+            while len(_SUGGEST_CACHE) > _SUGGEST_CACHE_SIZE:
+                _SUGGEST_CACHE.popitem(last=False)
+        return dict(response)
+
+    except (AttributeError, KeyError, TypeError) as e:
+        # Expected when the document or a component is in an unexpected state
+        remember_exception(e)
         return {
             "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
+            "error": f"Error analyzing connections: {str(e)}",
+            "error_type": type(e).__name__
         }
     except Exception as e:
-        import traceback
+        logger.exception("Unexpected error analyzing eml_ connections")
+        remember_exception(e)
         return {
             "success": False,
             "error": f"Error analyzing connections: {str(e)}",
-            "traceback": traceback.format_exc()
+            "error_type": type(e).__name__,
+            "debug_hint": "Call get_last_traceback for the full traceback."
+        }
+
+@gh_tool(
+    name="get_last_traceback",
+    description=(
+        "Get the full Python traceback of the most recent error reported by a "
+        "Grasshopper bridge handler that returns errors without a traceback "
+        "(for example suggest_eml_connections). Tracebacks are formatted only when requested.\n\n"
+        "**Returns:**\n"
+        "Dictionary containing the error type, message and formatted traceback."
+    )
+)
+async def get_last_traceback() -> Dict[str, Any]:
+    """
+    Get the traceback of the last recorded bridge handler error.
+
+    Returns:
+        Dict containing the formatted traceback
+    """
+    return await call_bridge_api_async("/last_traceback", {})
+
+@bridge_handler("/last_traceback")
+def handle_last_traceback(data):
+    """Bridge handler for formatting the last recorded exception on demand"""
+    if _LAST_EXCEPTION is None:
+        return {
+            "success": False,
+            "error": "No error has been recorded"
         }
 
+    return {
+        "success": True,
+        "error_type": _LAST_EXCEPTION.exc_type.__name__,
+        "error": str(_LAST_EXCEPTION),
+        "traceback": "".join(_LAST_EXCEPTION.format())
+    }
+
 # ============================================================================
 # EXISTING GRASSHOPPER TOOLS
 # ============================================================================
@@ -1796,7 +3207,7 @@ def handle_suggest_eml_connections(data):
     description=(
         "List all available slider components in a specific Grasshopper file. "
         "This tool will activate the specified file (making it visible to the user), "
-        "then scan it to find all number slider components and return their names and current values.\n\n"
+        "then scan it to find all number slider components and return their names, instance ids and current values.\n\n"
         "**Parameters:**\n"
         "- **file_name** (str, required): Name of the .gh file to list sliders from (e.g., 'Primary Truss Generator.gh')\n"
         "\n**Returns:**\n"
@@ -1818,17 +3229,13 @@ async def list_grasshopper_sliders(file_name: str) -> Dict[str, Any]:
         "file_name": file_name
     }
 
-    return call_bridge_api("/list_sliders", request_data)
+    return await call_bridge_api_async("/list_sliders", request_data)
 
 @bridge_handler("/list_sliders")
+@requires_grasshopper
 def handle_list_sliders(data):
     """Bridge handler for list sliders requests"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-
         file_name = data.get('file_name', '')
 
         # Ensure the correct file is active first
@@ -1862,17 +3269,17 @@ def handle_list_sliders(data):
         
         sliders = []
         
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                slider_info = {
-                    "name": obj.NickName or "Unnamed",
-                    "current_value": float(str(obj.Slider.Value)),
-                    "min_value": float(str(obj.Slider.Minimum)),
-                    "max_value": float(str(obj.Slider.Maximum)),
-                    "precision": obj.Slider.DecimalPlaces,
-                    "type": obj.Slider.Type.ToString()
-                }
-                sliders.append(slider_info)
+        for obj in get_slider_index(gh_doc)[0]:
+            slider_info = {
+                "name": obj.NickName or "Unnamed",
+                "instance_id": str(obj.InstanceGuid),
+                "current_value": System.Decimal.ToDouble(obj.Slider.Value),
+                "min_value": System.Decimal.ToDouble(obj.Slider.Minimum),
+                "max_value": System.Decimal.ToDouble(obj.Slider.Maximum),
+                "precision": obj.Slider.DecimalPlaces,
+                "type": obj.Slider.Type.ToString()
+            }
+            sliders.append(slider_info)
         
         return {
             "success": True,
@@ -1881,18 +3288,11 @@ def handle_list_sliders(data):
             "message": f"Found {len(sliders)} slider components"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "sliders": []
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error listing sliders: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": error_traceback(e),
             "sliders": []
         }
 
@@ -1902,46 +3302,127 @@ def handle_list_sliders(data):
         "Change the value of a Grasshopper slider component by name in a specific Grasshopper file. "
         "This tool will activate the specified file (making it visible to the user), "
         "then find the slider component and update its value. "
+        "Calls arriving within a few milliseconds of each other (e.g. while dragging) are "
+        "applied together as one batch with a single recompute. "
         "Use 'get_active_gh_files' to see all open files and 'list_grasshopper_sliders' to see available sliders.\n\n"
         "**Parameters:**\n"
         "- **file_name** (str, required): Name of the .gh file containing the slider (e.g., 'Primary Truss Generator.gh')\n"
         "- **slider_name** (str): The name/nickname of the slider component to modify\n"
         "- **new_value** (float): The new value to set for the slider\n"
+        "- **slider_id** (str, optional): The slider's instance_id from 'list_grasshopper_sliders'; "
+        "takes precedence over slider_name and survives renames\n"
         "\n**Returns:**\n"
         "Dictionary containing the operation status and updated slider information."
     )
 )
-async def set_grasshopper_slider(file_name: str, slider_name: str, new_value: float) -> Dict[str, Any]:
+async def set_grasshopper_slider(file_name: str, slider_name: str, new_value: float, slider_id: str = None) -> Dict[str, Any]:
     """
-    Set the value of a Grasshopper slider by name via HTTP bridge.
+    Set the value of a Grasshopper slider by name or instance id via HTTP bridge.
 
     Args:
         file_name: Name of the .gh file containing the slider
         slider_name: Name of the slider component
         new_value: New value to set
+        slider_id: Optional InstanceGuid of the slider, used instead of the name
 
     Returns:
         Dict containing operation results
     """
 
-    request_data = {
-        "file_name": file_name,
-        "slider_name": slider_name,
-        "new_value": new_value
-    }
+    return await _set_slider_coalesced(file_name, slider_id or slider_name, new_value)
+
+# set_grasshopper_slider calls waiting to be fused, keyed by file name
+_pending_slider_sets = {}
+_SLIDER_BATCH_WINDOW = 0.01  # seconds the first caller waits for others to join
+_SLIDER_BATCH_MAX = 10       # flush early once this many updates are queued
+
+async def _flush_slider_batch(file_name: str, updates):
+    """Send a batch of slider updates and resolve every caller's future, whatever happens"""
+    # Callers cancelled while the batch was gathering (e.g. superseded drag steps) are left out
+    updates = [update for update in updates if not update[2].done()]
+    try:
+        if len(updates) == 1:
+            slider_name, new_value, pending = updates[0]
+            request_data = {
+                "file_name": file_name,
+                "slider_name": slider_name,
+                "new_value": new_value
+            }
+            response = await call_bridge_api_async("/set_slider", request_data)
+            if not pending.done():
+                pending.set_result(response)
+        elif updates:
+            # The last value queued for a slider wins
+            slider_updates = {name: value for name, value, _ in updates}
+            response = await call_bridge_api_async("/set_multiple_sliders", {
+                "file_name": file_name,
+                "slider_updates": slider_updates
+            })
+            results = {result.get("slider_name"): result for result in response.get("results") or []}
+            for name, _, pending in updates:
+                if pending.done():
+                    continue
+                result = results.get(name)
+                if result is None:
+                    pending.set_result(response)
+                elif result.get("success"):
+                    pending.set_result(dict(
+                        result,
+                        message=f"Slider '{name}' updated to {result['new_value']} (batched with {len(updates) - 1} other update(s))"
+                    ))
+                else:
+                    pending.set_result(result)
+    except Exception as e:
+        for _, _, pending in updates:
+            if not pending.done():
+                pending.set_exception(e)
+    finally:
+        # Only reached with open futures if this task itself was cancelled
+        for _, _, pending in updates:
+            if not pending.done():
+                pending.cancel()
+
+async def _set_slider_coalesced(file_name: str, slider_name: str, new_value: float) -> Dict[str, Any]:
+    """
+    Fuse set_grasshopper_slider calls arriving within a few milliseconds (e.g. a
+    slider drag) into one /set_multiple_sliders round-trip and one solution.
+    slider_name may also be a slider instance id; both handlers accept either.
+
+    The first caller waits up to _SLIDER_BATCH_WINDOW (or until _SLIDER_BATCH_MAX
+    updates are queued), then the batch is sent and each caller gets its slider's
+    result. The batch is always taken down and sent, even if the first caller is
+    cancelled while it gathers.
+    """
+    future = asyncio.get_running_loop().create_future()
+    batch = _pending_slider_sets.get(file_name)
+    is_leader = batch is None
+    if is_leader:
+        batch = _pending_slider_sets[file_name] = {"updates": [], "full": asyncio.Event()}
+    batch["updates"].append((slider_name, new_value, future))
+    if len(batch["updates"]) >= _SLIDER_BATCH_MAX:
+        batch["full"].set()
+
+    if is_leader:
+        try:
+            await asyncio.wait_for(batch["full"].wait(), _SLIDER_BATCH_WINDOW)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            if _pending_slider_sets.get(file_name) is batch:
+                del _pending_slider_sets[file_name]
+            _start_batch_flush(_flush_slider_batch(file_name, batch["updates"]))
 
-    return call_bridge_api("/set_slider", request_data)
+    return await future
 
 @bridge_handler("/set_slider")
+@requires_grasshopper
+@holds_doc_lock
 def handle_set_slider(data):
     """Bridge handler for set slider requests"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import System
-
         file_name = data.get('file_name', '')
         slider_name = data.get('slider_name', '')
         new_value = float(data.get('new_value', 0))
@@ -1978,37 +3459,33 @@ def handle_set_slider(data):
                 "new_value": new_value
             }
         
-        # Find the slider component
-        slider_found = False
-        old_value = None
-        clamped_value = new_value
-        
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                if (obj.NickName or "Unnamed") == slider_name:
-                    slider_found = True
-                    old_value = float(str(obj.Slider.Value))
-                    
-                    # Clamp value to slider bounds
-                    clamped_value = max(float(str(obj.Slider.Minimum)), 
-                                      min(float(str(obj.Slider.Maximum)), new_value))
-                    
-                    # Set the new value
-                    obj.Slider.Value = System.Decimal.Parse(str(clamped_value))
-                    
-                    # Trigger solution recompute
-                    gh_doc.NewSolution(True)
-                    
-                    break
+        # Find the slider component: by instance id when given (O(1), rename-proof), else by name
+        slider_id = data.get('slider_id')
+        if slider_id:
+            obj = find_slider_by_id(gh_doc, slider_id)
+        else:
+            # Coalesced callers may pass an instance id in place of the name
+            obj = resolve_slider(gh_doc, slider_name)
         
-        if not slider_found:
+        if obj is None:
             return {
                 "success": False,
-                "error": f"Slider '{slider_name}' not found",
+                "error": f"Slider '{slider_id or slider_name}' not found",
                 "slider_name": slider_name,
                 "new_value": new_value
             }
         
+        old_value = System.Decimal.ToDouble(obj.Slider.Value)
+        
+        # Clamp value to slider bounds
+        clamped_value = clamp_to_slider(obj.Slider, new_value)
+        
+        # Set the new value
+        obj.Slider.Value = System.Decimal(clamped_value)
+        
+        # Trigger solution recompute
+        gh_doc.NewSolution(True)
+        
         return {
             "success": True,
             "slider_name": slider_name,
@@ -2019,23 +3496,31 @@ def handle_set_slider(data):
                       (f" (clamped from {new_value})" if clamped_value != new_value else "")
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "slider_name": data.get('slider_name', ''),
-            "new_value": data.get('new_value', 0)
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error setting slider: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": error_traceback(e),
             "slider_name": data.get('slider_name', ''),
             "new_value": data.get('new_value', 0)
         }
 
+# CLR type -> (type name, "slider" | "panel" | "param" | None) for the overview counts
+_OVERVIEW_TYPE_CACHE = {}
+
+def _overview_type_info(obj_type, obj):
+    """Classify an object's type once; Category is fixed per component type"""
+    if issubclass(obj_type, GH_NumberSlider):
+        kind = "slider"
+    elif issubclass(obj_type, GH_Panel):
+        kind = "panel"
+    elif getattr(obj, 'Category', None) == "Params":
+        kind = "param"
+    else:
+        kind = None
+    type_info = _OVERVIEW_TYPE_CACHE[obj_type] = (obj_type.__name__, kind)
+    return type_info
+
 @gh_tool(
     name="get_grasshopper_overview",
     description=(
@@ -2054,17 +3539,13 @@ async def get_grasshopper_overview() -> Dict[str, Any]:
         Dict containing file overview information
     """
     
-    return call_bridge_api("/grasshopper_overview", {})
+    return await call_bridge_api_async("/grasshopper_overview", {})
 
 @bridge_handler("/grasshopper_overview")
+@requires_grasshopper
 def handle_grasshopper_overview(data):
     """Bridge handler for grasshopper overview requests"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        
         # Get the Grasshopper plugin and document
         gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
         if not gh:
@@ -2080,24 +3561,28 @@ def handle_grasshopper_overview(data):
                 "error": "No active Grasshopper document found"
             }
         
-        # Count different component types
+        # Count objects per CLR type with Counter, then classify each distinct type once
+        objects = list(gh_doc.Objects)
+        type_counts = Counter(map(type, objects))
         component_counts = {}
-        slider_count = 0
-        panel_count = 0
-        param_count = 0
-        total_objects = 0
+        kind_counts = {"slider": 0, "panel": 0, "param": 0, None: 0}
+        total_objects = len(objects)
         
-        for obj in gh_doc.Objects:
-            total_objects += 1
-            obj_type = type(obj).__name__
-            component_counts[obj_type] = component_counts.get(obj_type, 0) + 1
-            
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                slider_count += 1
-            elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                panel_count += 1
-            elif hasattr(obj, 'Category') and obj.Category == "Params":
-                param_count += 1
+        samples = None
+        for obj_type, count in type_counts.items():
+            type_info = _OVERVIEW_TYPE_CACHE.get(obj_type)
+            if type_info is None:
+                # Category is read off an instance, so classify using one of them
+                if samples is None:
+                    samples = {type(obj): obj for obj in objects}
+                type_info = _overview_type_info(obj_type, samples[obj_type])
+            type_name, kind = type_info
+            component_counts[type_name] = component_counts.get(type_name, 0) + count
+            kind_counts[kind] += count
+        
+        slider_count = kind_counts["slider"]
+        panel_count = kind_counts["panel"]
+        param_count = kind_counts["param"]
         
         # Get document properties
         doc_properties = {
@@ -2122,48 +3607,109 @@ def handle_grasshopper_overview(data):
             "summary": f"Document contains {total_objects} total objects including {slider_count} sliders and {panel_count} panels"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error getting overview: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
+# Name keywords -> slider purpose, checked in priority order (first rule that matches wins)
+_SLIDER_PURPOSE_RULES = tuple(
+    (re.compile("|".join(keywords), re.IGNORECASE), purpose)
+    for keywords, purpose in (
+        (("width", "w", "x"), "Width/X-dimension control"),
+        (("height", "h", "y"), "Height/Y-dimension control"),
+        (("depth", "d", "z"), "Depth/Z-dimension control"),
+        (("count", "num", "n"), "Count/quantity control"),
+        (("angle", "rot", "rotation"), "Angle/rotation control"),
+        (("scale", "size"), "Scale/size control"),
+        (("offset", "shift"), "Offset/position control"),
+    )
+)
+
+# Connected component types that imply a slider's purpose when its name doesn't
+_TRANSFORM_COMPONENT_TYPES = frozenset({"GH_Move", "Transform"})
+_DIVISION_COMPONENT_TYPES = frozenset({"GH_Divide", "Division"})
+
+def infer_slider_purpose(slider_name):
+    """Purpose suggested by a slider's name, or None if no keyword appears in it"""
+    for pattern, purpose in _SLIDER_PURPOSE_RULES:
+        if pattern.search(slider_name):
+            return purpose
+    return None
+
+# Below this many sliders the thread hand-off costs more than it saves
+_PARALLEL_SLIDER_THRESHOLD = 32
+
+def slider_connections(obj, max_connections=None):
+    """
+    Components fed by a slider. Only reads the document, so it can run on _READ_POOL.
+    Sliders have Recipients directly, not through Params.
+
+    Args:
+        obj: The number slider
+        max_connections: Stop after this many recipients (None for all)
+
+    Returns:
+        Tuple of (connected component dicts, True if recipients were left out)
+    """
+    connected_components = []
+    truncated = False
+    try:
+        recipients = obj.Recipients if hasattr(obj, 'Recipients') else None
+        recipient_count = recipients.Count if recipients is not None else 0
+        if recipient_count > 0:
+            limit = recipient_count if max_connections is None else min(recipient_count, max_connections)
+            truncated = limit < recipient_count
+            for i in range(limit):
+                recipient = recipients[i]
+                try:
+                    component = recipient.Attributes.GetTopLevel.DocObject if hasattr(recipient.Attributes, 'GetTopLevel') else None
+                    if component:
+                        connected_components.append({
+                            "component_name": component.NickName or type(component).__name__,
+                            "component_type": type(component).__name__,
+                            "parameter_name": recipient.NickName or recipient.Name if hasattr(recipient, 'NickName') else "Unknown",
+                            "parameter_description": recipient.Description if hasattr(recipient, 'Description') else ""
+                        })
+                except:
+                    continue
+    except:
+        pass  # If we can't get connections, just skip
+    return connected_components, truncated
+
 @gh_tool(
     name="analyze_grasshopper_sliders",
     description=(
         "Analyze all sliders in the current Grasshopper definition, including their connections "
         "and inferred purposes. This provides detailed information about what each slider controls "
         "based on connected components and naming patterns.\n\n"
-        "**Returns:**\n"
+        "**Parameters:**\n"
+        "- **max_connections** (int, optional): Maximum connections listed per slider (default: 32); "
+        "connections_truncated is true on sliders that have more\n"
+        "\n**Returns:**\n"
         "Dictionary containing detailed slider analysis with connections and purposes."
     )
 )
-async def analyze_grasshopper_sliders() -> Dict[str, Any]:
+async def analyze_grasshopper_sliders(max_connections: int = 32) -> Dict[str, Any]:
     """
     Analyze sliders with connection details and purpose inference via HTTP bridge.
     
+    Args:
+        max_connections: Maximum connections listed per slider
+    
     Returns:
         Dict containing detailed slider analysis
     """
     
-    return call_bridge_api("/analyze_sliders", {})
+    return await call_bridge_api_async("/analyze_sliders", {"max_connections": max_connections})
 
 @bridge_handler("/analyze_sliders")
+@requires_grasshopper
 def handle_analyze_sliders(data):
     """Bridge handler for slider analysis requests"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        
         # Get the Grasshopper plugin and document
         gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
         if not gh:
@@ -2181,65 +3727,46 @@ def handle_analyze_sliders(data):
         
         sliders = []
         
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                slider_info = {
-                    "name": obj.NickName or "Unnamed",
-                    "current_value": float(str(obj.Slider.Value)),
-                    "min_value": float(str(obj.Slider.Minimum)),
-                    "max_value": float(str(obj.Slider.Maximum)),
-                    "precision": obj.Slider.DecimalPlaces,
-                    "type": obj.Slider.Type.ToString(),
-                    "connected_components": [],
-                    "inferred_purpose": "Unknown",
-                    "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)}
-                }
-                
-                # Analyze connections - Sliders have Recipients directly, not through Params
-                try:
-                    if hasattr(obj, 'Recipients') and obj.Recipients.Count > 0:
-                        for recipient in obj.Recipients:
-                            try:
-                                component = recipient.Attributes.GetTopLevel.DocObject if hasattr(recipient.Attributes, 'GetTopLevel') else None
-                                if component:
-                                    connected_info = {
-                                        "component_name": component.NickName or type(component).__name__,
-                                        "component_type": type(component).__name__,
-                                        "parameter_name": recipient.NickName or recipient.Name if hasattr(recipient, 'NickName') else "Unknown",
-                                        "parameter_description": recipient.Description if hasattr(recipient, 'Description') else ""
-                                    }
-                                    slider_info["connected_components"].append(connected_info)
-                            except:
-                                continue
-                except:
-                    pass  # If we can't get connections, just skip
-                
-                # Infer purpose based on name and connections
-                slider_name_lower = slider_info["name"].lower()
-                connected_types = [conn["component_type"] for conn in slider_info["connected_components"]]
-                
-                if any(keyword in slider_name_lower for keyword in ["width", "w", "x"]):
-                    slider_info["inferred_purpose"] = "Width/X-dimension control"
-                elif any(keyword in slider_name_lower for keyword in ["height", "h", "y"]):
-                    slider_info["inferred_purpose"] = "Height/Y-dimension control"
-                elif any(keyword in slider_name_lower for keyword in ["depth", "d", "z"]):
-                    slider_info["inferred_purpose"] = "Depth/Z-dimension control"
-                elif any(keyword in slider_name_lower for keyword in ["count", "num", "n"]):
-                    slider_info["inferred_purpose"] = "Count/quantity control"
-                elif any(keyword in slider_name_lower for keyword in ["angle", "rot", "rotation"]):
-                    slider_info["inferred_purpose"] = "Angle/rotation control"
-                elif any(keyword in slider_name_lower for keyword in ["scale", "size"]):
-                    slider_info["inferred_purpose"] = "Scale/size control"
-                elif any(keyword in slider_name_lower for keyword in ["offset", "shift"]):
-                    slider_info["inferred_purpose"] = "Offset/position control"
-                elif "GH_Move" in connected_types or "Transform" in connected_types:
+        max_connections = int(data.get('max_connections', 32))
+        
+        slider_objects = get_slider_index(gh_doc)[0]
+        
+        # Recipient traversal is read-only; spread it over the reader pool on large definitions
+        if len(slider_objects) >= _PARALLEL_SLIDER_THRESHOLD:
+            connections = list(_READ_POOL.map(slider_connections, slider_objects, itertools.repeat(max_connections)))
+        else:
+            connections = [slider_connections(obj, max_connections) for obj in slider_objects]
+        
+        for obj, (connected_components, connections_truncated) in zip(slider_objects, connections):
+            slider_info = {
+                "name": obj.NickName or "Unnamed",
+                "current_value": System.Decimal.ToDouble(obj.Slider.Value),
+                "min_value": System.Decimal.ToDouble(obj.Slider.Minimum),
+                "max_value": System.Decimal.ToDouble(obj.Slider.Maximum),
+                "precision": obj.Slider.DecimalPlaces,
+                "type": obj.Slider.Type.ToString(),
+                "connected_components": connected_components,
+                "connections_truncated": connections_truncated,
+                "inferred_purpose": "Unknown",
+                "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)}
+            }
+            
+            # Infer purpose based on name and connections; the name is checked first,
+            # so connection types are only collected when it says nothing
+            name_purpose = infer_slider_purpose(slider_info["name"])
+            
+            if name_purpose is not None:
+                slider_info["inferred_purpose"] = name_purpose
+            elif connected_components:
+                connected_types = {conn["component_type"] for conn in connected_components}
+                if not connected_types.isdisjoint(_TRANSFORM_COMPONENT_TYPES):
                     slider_info["inferred_purpose"] = "Transformation parameter"
-                elif "GH_Divide" in connected_types or "Division" in connected_types:
+                elif not connected_types.isdisjoint(_DIVISION_COMPONENT_TYPES):
                     slider_info["inferred_purpose"] = "Division/array parameter"
-                elif len(slider_info["connected_components"]) > 0:
-                    slider_info["inferred_purpose"] = f"Parameter for {slider_info['connected_components'][0]['component_name']}"
-                
-                sliders.append(slider_info)
+                else:
+                    slider_info["inferred_purpose"] = f"Parameter for {connected_components[0]['component_name']}"
+            
+            sliders.append(slider_info)
         
         return {
             "success": True,
@@ -2248,48 +3775,100 @@ def handle_analyze_sliders(data):
             "summary": f"Found {len(sliders)} sliders with connection analysis"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error analyzing sliders: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
+class ComponentCaps(NamedTuple):
+    """Which optional members a CLR type exposes, probed once per type instead of per object"""
+    type_name: str
+    special_type: Any  # "NumberSlider", "Panel", "ValueList" or None
+    has_category: bool
+    has_subcategory: bool
+    has_params: bool
+    has_description: bool
+    has_user_text: bool
+    has_list_items: bool
+    has_runtime_messages: bool
+    has_volatile_data: bool
+
+# CLR type -> ComponentCaps
+_COMPONENT_CAPS_CACHE = {}
+
+def _component_caps(obj_type):
+    """Probe and cache the capabilities of a document object or parameter type"""
+    if issubclass(obj_type, GH_NumberSlider):
+        special_type = "NumberSlider"
+    elif issubclass(obj_type, GH_Panel):
+        special_type = "Panel"
+    elif issubclass(obj_type, GH_ValueList):
+        special_type = "ValueList"
+    else:
+        special_type = None
+
+    caps = _COMPONENT_CAPS_CACHE[obj_type] = ComponentCaps(
+        obj_type.__name__,
+        special_type,
+        hasattr(obj_type, 'Category'),
+        hasattr(obj_type, 'SubCategory'),
+        hasattr(obj_type, 'Params'),
+        hasattr(obj_type, 'Description'),
+        hasattr(obj_type, 'UserText'),
+        hasattr(obj_type, 'ListItems'),
+        hasattr(obj_type, 'RuntimeMessages'),
+        hasattr(obj_type, 'VolatileData')
+    )
+    return caps
+
 @gh_tool(
     name="get_grasshopper_components",
     description=(
         "Get a comprehensive list of all components in the current Grasshopper definition, "
         "including their types, parameters, and connections. This provides a complete map "
         "of the grasshopper definition structure.\n\n"
-        "**Returns:**\n"
-        "Dictionary containing all components with their details and connections."
+        "**Parameters:**\n"
+        "- **if_none_match** (str, optional): The etag from a previous call; if the definition "
+        "hasn't changed since, only {success, not_modified: true, etag} is returned\n"
+        "\n**Returns:**\n"
+        "Dictionary containing all components with their details and connections, plus an etag."
     )
 )
-async def get_grasshopper_components() -> Dict[str, Any]:
+async def get_grasshopper_components(if_none_match: str = None) -> Dict[str, Any]:
     """
     Get all components in the current Grasshopper definition via HTTP bridge.
     
+    Args:
+        if_none_match: etag of a previous response the caller still holds
+    
     Returns:
         Dict containing all component information
     """
     
-    return call_bridge_api("/get_components", {})
+    return await call_bridge_api_async("/get_components", {"if_none_match": if_none_match})
+
+# etag -> last get_components response, most recently used last
+_COMPONENTS_CACHE = OrderedDict()
+_COMPONENTS_CACHE_SIZE = 8
+
+def components_etag(gh_doc):
+    """
+    Revision tag for the component dump: object count and solution serial (values,
+    wiring) plus the newest undo record (moves, renames, panel edits).
+    None when the document's solutions can't be tracked.
+    """
+    revision = _content_revision(gh_doc)
+    if revision is None:
+        return None
+    return f"{gh_doc.DocumentID}:{revision[0]}:{revision[1]}:{revision[2]}"
 
 @bridge_handler("/get_components")
+@requires_grasshopper
 def handle_get_components(data):
     """Bridge handler for getting all components"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        
         # Get the Grasshopper plugin and document
         gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
         if not gh:
@@ -2305,70 +3884,82 @@ def handle_get_components(data):
                 "error": "No active Grasshopper document found"
             }
         
+        # Unchanged since the caller's copy, or since the last dump -> skip the walk
+        etag = components_etag(gh_doc)
+        if etag is not None:
+            if data.get('if_none_match') == etag:
+                return {"success": True, "not_modified": True, "etag": etag}
+            cached = _COMPONENTS_CACHE.get(etag)
+            if cached is not None:
+                _COMPONENTS_CACHE.move_to_end(etag)
+                return dict(cached)
+        
         components = []
         
         for obj in gh_doc.Objects:
+            obj_type = type(obj)
+            caps = _COMPONENT_CAPS_CACHE.get(obj_type) or _component_caps(obj_type)
             component_info = {
                 "name": obj.NickName or "Unnamed",
-                "type": type(obj).__name__,
-                "category": obj.Category if hasattr(obj, 'Category') else "Unknown",
-                "subcategory": obj.SubCategory if hasattr(obj, 'SubCategory') else "Unknown",
+                "type": caps.type_name,
+                "category": obj.Category if caps.has_category else "Unknown",
+                "subcategory": obj.SubCategory if caps.has_subcategory else "Unknown",
                 "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)},
                 "inputs": [],
                 "outputs": [],
-                "is_special": False,
-                "special_type": None
+                "is_special": caps.special_type is not None,
+                "special_type": caps.special_type
             }
             
             # Check for special component types
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                component_info["is_special"] = True
-                component_info["special_type"] = "NumberSlider"
+            special_type = caps.special_type
+            if special_type == "NumberSlider":
                 component_info["slider_info"] = {
-                    "current_value": float(str(obj.Slider.Value)),
-                    "min_value": float(str(obj.Slider.Minimum)),
-                    "max_value": float(str(obj.Slider.Maximum)),
+                    "current_value": System.Decimal.ToDouble(obj.Slider.Value),
+                    "min_value": System.Decimal.ToDouble(obj.Slider.Minimum),
+                    "max_value": System.Decimal.ToDouble(obj.Slider.Maximum),
                     "precision": obj.Slider.DecimalPlaces
                 }
-            elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                component_info["is_special"] = True
-                component_info["special_type"] = "Panel"
-                component_info["panel_text"] = obj.UserText if hasattr(obj, 'UserText') else ""
-            elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                component_info["is_special"] = True
-                component_info["special_type"] = "ValueList"
+            elif special_type == "Panel":
+                component_info["panel_text"] = obj.UserText if caps.has_user_text else ""
+            elif special_type == "ValueList":
                 component_info["list_items"] = []
-                if hasattr(obj, 'ListItems'):
+                if caps.has_list_items:
                     for item in obj.ListItems:
                         component_info["list_items"].append({
                             "name": item.Name,
                             "value": str(item.Value)
                         })
             
-            # Get input parameters
-            if hasattr(obj, 'Params') and obj.Params.Input:
-                for i in range(obj.Params.Input.Count):
-                    param = obj.Params.Input[i]
-                    param_info = {
-                        "name": param.NickName or param.Name,
-                        "description": param.Description if hasattr(param, 'Description') else "",
-                        "type": type(param).__name__,
-                        "optional": param.Optional,
-                        "source_count": param.SourceCount
-                    }
-                    component_info["inputs"].append(param_info)
-            
-            # Get output parameters
-            if hasattr(obj, 'Params') and obj.Params.Output:
-                for i in range(obj.Params.Output.Count):
-                    param = obj.Params.Output[i]
-                    param_info = {
-                        "name": param.NickName or param.Name,
-                        "description": param.Description if hasattr(param, 'Description') else "",
-                        "type": type(param).__name__,
-                        "recipient_count": param.Recipients.Count
-                    }
-                    component_info["outputs"].append(param_info)
+            if caps.has_params:
+                params = obj.Params
+                
+                # Get input parameters
+                if params.Input:
+                    for param in params.Input:
+                        param_type = type(param)
+                        param_caps = _COMPONENT_CAPS_CACHE.get(param_type) or _component_caps(param_type)
+                        param_info = {
+                            "name": param.NickName or param.Name,
+                            "description": param.Description if param_caps.has_description else "",
+                            "type": param_caps.type_name,
+                            "optional": param.Optional,
+                            "source_count": param.SourceCount
+                        }
+                        component_info["inputs"].append(param_info)
+                
+                # Get output parameters
+                if params.Output:
+                    for param in params.Output:
+                        param_type = type(param)
+                        param_caps = _COMPONENT_CAPS_CACHE.get(param_type) or _component_caps(param_type)
+                        param_info = {
+                            "name": param.NickName or param.Name,
+                            "description": param.Description if param_caps.has_description else "",
+                            "type": param_caps.type_name,
+                            "recipient_count": param.Recipients.Count
+                        }
+                        component_info["outputs"].append(param_info)
             
             components.append(component_info)
         
@@ -2380,26 +3971,27 @@ def handle_get_components(data):
                 categories[cat] = []
             categories[cat].append(comp["name"])
         
-        return {
+        response = {
             "success": True,
             "components": components,
             "total_count": len(components),
             "categories": categories,
             "special_components": [comp for comp in components if comp["is_special"]],
+            "etag": etag,
             "summary": f"Found {len(components)} total components across {len(categories)} categories"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
+        if etag is not None:
+            _COMPONENTS_CACHE[etag] = response
+            while len(_COMPONENTS_CACHE) > _COMPONENTS_CACHE_SIZE:
+                _COMPONENTS_CACHE.popitem(last=False)
+        return dict(response)
+        
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error getting components: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 @gh_tool(
@@ -2410,7 +4002,7 @@ def handle_get_components(data):
         "then efficiently update multiple parameters simultaneously.\n\n"
         "**Parameters:**\n"
         "- **file_name** (str, required): Name of the .gh file containing the sliders (e.g., 'Primary Truss Generator.gh')\n"
-        "- **slider_updates** (dict): Dictionary mapping slider names to new values\n"
+        "- **slider_updates** (dict): Dictionary mapping slider names (or instance ids) to new values\n"
         "\n**Returns:**\n"
         "Dictionary containing the results of all slider updates."
     )
@@ -2432,18 +4024,14 @@ async def set_multiple_grasshopper_sliders(file_name: str, slider_updates: Dict[
         "slider_updates": slider_updates
     }
 
-    return call_bridge_api("/set_multiple_sliders", request_data)
+    return await call_bridge_api_async("/set_multiple_sliders", request_data)
 
 @bridge_handler("/set_multiple_sliders")
+@requires_grasshopper
+@holds_doc_lock
 def handle_set_multiple_sliders(data):
     """Bridge handler for setting multiple sliders at once"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import System
-
         file_name = data.get('file_name', '')
         slider_updates = data.get('slider_updates', {})
 
@@ -2480,62 +4068,74 @@ def handle_set_multiple_sliders(data):
                 "file_name": file_name
             }
         
-        # Cache slider components for efficient batch processing
+        # Resolve every requested slider up front (cached index, rebuilt on a stale name);
+        # keys that aren't slider names may be slider instance ids
         slider_components = {}
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                slider_name = obj.NickName or "Unnamed"
+        for slider_name in slider_updates:
+            obj = resolve_slider(gh_doc, slider_name)
+            if obj is not None:
                 slider_components[slider_name] = obj
         
-        results = []
-        success_count = 0
+        def apply_batch():
+            """Every document mutation for the batch, run together on the UI thread"""
+            results = []
+            success_count = 0
         
-        # Disable solver during batch updates
-        gh.DisableSolver()
+            # Disable the solver and the document during batch updates so no
+            # slider write triggers a solution of its own
+            gh.DisableSolver()
+            doc_was_enabled = gh_doc.Enabled
+            gh_doc.Enabled = False
         
-        try:
-            for slider_name, new_value in slider_updates.items():
-                try:
-                    if slider_name in slider_components:
-                        obj = slider_components[slider_name]
-                        old_value = float(str(obj.Slider.Value))
+            try:
+                for slider_name, new_value in slider_updates.items():
+                    try:
+                        if slider_name in slider_components:
+                            obj = slider_components[slider_name]
+                            slider = obj.Slider
+                            requested_value = float(new_value)
+                            old_value = System.Decimal.ToDouble(slider.Value)
                         
-                        # Clamp value to slider bounds
-                        clamped_value = max(float(str(obj.Slider.Minimum)), 
-                                          min(float(str(obj.Slider.Maximum)), float(new_value)))
+                            # Clamp value to slider bounds
+                            clamped_value = clamp_to_slider(slider, requested_value)
                         
-                        obj.Slider.Value = System.Decimal.Parse(str(clamped_value))
+                            slider.Value = System.Decimal(clamped_value)
+                            # Mark downstream objects expired without recomputing yet
+                            obj.ExpireSolution(False)
                         
-                        results.append({
-                            "slider_name": slider_name,
-                            "success": True,
-                            "old_value": old_value,
-                            "new_value": float(clamped_value),
-                            "clamped": clamped_value != float(new_value)
-                        })
-                        success_count += 1
-                    else:
+                            results.append({
+                                "slider_name": slider_name,
+                                "success": True,
+                                "old_value": old_value,
+                                "new_value": clamped_value,
+                                "clamped": clamped_value != requested_value
+                            })
+                            success_count += 1
+                        else:
+                            results.append({
+                                "slider_name": slider_name,
+                                "success": False,
+                                "error": f"Slider '{slider_name}' not found"
+                            })
+                        
+                    except Exception as e:
                         results.append({
                             "slider_name": slider_name,
                             "success": False,
-                            "error": f"Slider '{slider_name}' not found"
+                            "error": f"Error setting slider: {str(e)}"
                         })
-                        
-                except Exception as e:
-                    results.append({
-                        "slider_name": slider_name,
-                        "success": False,
-                        "error": f"Error setting slider: {str(e)}"
-                    })
-            
-            # Re-enable solver and compute solution
-            gh.EnableSolver()
-            gh_doc.NewSolution(True)
-            
-        except Exception as e:
-            # Ensure solver is re-enabled even if batch update fails
-            gh.EnableSolver()
-            raise e
+            finally:
+                # Always restore the solver and document state, even if the batch fails
+                gh_doc.Enabled = doc_was_enabled
+                gh.EnableSolver()
+        
+            # One solution for the whole batch; only the expired objects recompute
+            if success_count:
+                gh_doc.NewSolution(False)
+            return results, success_count
+
+        # All writes and the solve cross to Rhino's UI thread once, not per slider
+        results, success_count = run_on_ui_thread(apply_batch)
         
         return {
             "success": True,
@@ -2546,17 +4146,11 @@ def handle_set_multiple_sliders(data):
             "summary": f"Successfully updated {success_count} of {len(slider_updates)} sliders"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error in batch slider update: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 @gh_tool(
@@ -2577,16 +4171,28 @@ async def debug_grasshopper_state() -> Dict[str, Any]:
         Dict containing detailed debugging information
     """
     
-    return call_bridge_api("/debug_state", {})
+    return await call_bridge_api_async("/debug_state", {})
+
+# str(GH_RuntimeMessageLevel) values debug_state reports as errors / warnings
+_ERROR_LEVELS = frozenset({"Error"})
+_WARNING_LEVELS = frozenset({"Warning"})
+
+# (reference count, [assembly names]) for debug_state; references are only ever added
+_ASSEMBLY_NAMES = (-1, [])
+
+def loaded_assembly_names():
+    """Names of the CLR references, re-stringified only when the reference count changes"""
+    global _ASSEMBLY_NAMES
+    references = clr.References
+    count = len(references)
+    if _ASSEMBLY_NAMES[0] != count:
+        _ASSEMBLY_NAMES = (count, [str(assembly) for assembly in references])
+    return list(_ASSEMBLY_NAMES[1])
 
 @bridge_handler("/debug_state")
 def handle_debug_state(data):
     """Bridge handler for debugging state requests"""
     try:
-        import clr
-        import sys
-        import os
-        
         debug_info = {
             "system_info": {
                 "python_version": sys.version,
@@ -2602,19 +4208,16 @@ def handle_debug_state(data):
         
         # Check loaded assemblies
         try:
-            for assembly in clr.References:
-                debug_info["assemblies_loaded"].append(str(assembly))
+            debug_info["assemblies_loaded"] = loaded_assembly_names()
         except Exception as e:
             debug_info["warnings"].append(f"Could not enumerate assemblies: {str(e)}")
         
         try:
-            clr.AddReference('Grasshopper')
-            clr.AddReference('RhinoCommon')
-            import Grasshopper
-            import Rhino
-            
+            if _GH_IMPORT_ERROR is not None:
+                raise ImportError(_GH_IMPORT_ERROR)
+
             # Check Grasshopper plugin status
-            gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
+            gh = get_gh_plugin()
             if gh:
                 debug_info["grasshopper_status"] = {
                     "plugin_available": True,
@@ -2623,8 +4226,9 @@ def handle_debug_state(data):
                 }
                 
                 # Check document status
-                if Grasshopper.Instances.ActiveCanvas:
-                    gh_doc = Grasshopper.Instances.ActiveCanvas.Document
+                canvas = Grasshopper.Instances.ActiveCanvas
+                if canvas:
+                    gh_doc = canvas.Document
                     if gh_doc:
                         debug_info["document_status"] = {
                             "document_available": True,
@@ -2635,30 +4239,39 @@ def handle_debug_state(data):
                             "solver_status": "Unknown"
                         }
                         
-                        # Count component types and check for errors
+                        # Count component types per CLR type, then check for errors
+                        objects = list(gh_doc.Objects)
                         component_summary = {}
+                        for obj_type, count in Counter(map(type, objects)).items():
+                            type_name = obj_type.__name__
+                            component_summary[type_name] = component_summary.get(type_name, 0) + count
                         error_count = 0
                         warning_count = 0
+                        errors_append = debug_info["component_errors"].append
+                        warnings_append = debug_info["warnings"].append
                         
-                        for obj in gh_doc.Objects:
-                            obj_type = type(obj).__name__
-                            component_summary[obj_type] = component_summary.get(obj_type, 0) + 1
-                            
+                        for obj in objects:
                             # Check for component runtime messages (errors/warnings)
-                            if hasattr(obj, 'RuntimeMessages'):
+                            obj_type = type(obj)
+                            caps = _COMPONENT_CAPS_CACHE.get(obj_type) or _component_caps(obj_type)
+                            if caps.has_runtime_messages:
+                                component_name = None
                                 for message in obj.RuntimeMessages:
+                                    if component_name is None:
+                                        component_name = obj.NickName or caps.type_name
+                                    level = str(message.Level)
                                     message_info = {
-                                        "component": obj.NickName or obj_type,
-                                        "level": str(message.Level),
+                                        "component": component_name,
+                                        "level": level,
                                         "message": str(message.Text)
                                     }
                                     
-                                    if "Error" in str(message.Level):
+                                    if level in _ERROR_LEVELS:
                                         error_count += 1
-                                        debug_info["component_errors"].append(message_info)
-                                    elif "Warning" in str(message.Level):
+                                        errors_append(message_info)
+                                    elif level in _WARNING_LEVELS:
                                         warning_count += 1
-                                        debug_info["warnings"].append(message_info)
+                                        warnings_append(message_info)
                         
                         debug_info["document_status"]["component_summary"] = component_summary
                         debug_info["document_status"]["error_count"] = error_count
@@ -2698,13 +4311,11 @@ def handle_debug_state(data):
         }
         
         try:
-            import Rhino
             debug_info["environment"]["rhino_version"] = str(Rhino.RhinoApp.Version)
         except:
             pass
             
         try:
-            import Grasshopper
             if hasattr(Grasshopper, 'Versioning'):
                 debug_info["environment"]["grasshopper_version"] = str(Grasshopper.Versioning.Version)
         except:
@@ -2717,11 +4328,10 @@ def handle_debug_state(data):
         }
         
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error collecting debug info: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 @gh_tool(
@@ -2752,76 +4362,47 @@ async def list_grasshopper_valuelist_components(file_name: str) -> Dict[str, Any
         "file_name": file_name
     }
 
-    return call_bridge_api("/list_valuelists", request_data)
+    return await call_bridge_api_async("/list_valuelists", request_data)
 
 @bridge_handler("/list_valuelists")
+@requires_grasshopper
 def handle_list_valuelists(data):
     """Bridge handler for listing ValueList components"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-
         file_name = data.get('file_name', '')
-
-        # Ensure the correct file is active first
-        activation_result = ensure_file_is_active(file_name)
-        if not activation_result.get("success", False):
-            return {
-                "success": False,
-                "error": activation_result.get("error", "Failed to activate file"),
-                "file_name": file_name,
-                "valuelist_components": []
-            }
-
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available",
-                "file_name": file_name,
-                "valuelist_components": []
-            }
-
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found",
-                "file_name": file_name,
-                "valuelist_components": []
-            }
+
+        gh_doc, error = get_active_gh_doc(file_name)
+        if error:
+            return error_response(error, file_name=file_name, valuelist_components=[])
         
         valuelist_components = []
         
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                valuelist_info = {
-                    "name": obj.NickName or "Unnamed",
-                    "current_selection_index": obj.SelectionIndex,
-                    "current_selection_name": None,
-                    "current_selection_value": None,
-                    "list_items": []
-                }
+        for obj in get_special_objects(gh_doc)[GH_ValueList]:
+            valuelist_info = {
+                "name": obj.NickName or "Unnamed",
+                "current_selection_index": obj.SelectionIndex,
+                "current_selection_name": None,
+                "current_selection_value": None,
+                "list_items": []
+            }
                 
-                # Get all available items
-                if hasattr(obj, 'ListItems'):
-                    for i, item in enumerate(obj.ListItems):
-                        item_info = {
-                            "index": i,
-                            "name": item.Name,
-                            "value": str(item.Value)
-                        }
-                        valuelist_info["list_items"].append(item_info)
+            # Get all available items
+            if hasattr(obj, 'ListItems'):
+                selection_index = valuelist_info["current_selection_index"]
+                for i, (item_name, item_value) in enumerate(list_item_snapshot(obj)):
+                    item_info = {
+                        "index": i,
+                        "name": item_name,
+                        "value": item_value
+                    }
+                    valuelist_info["list_items"].append(item_info)
                         
-                        # Mark current selection
-                        if i == obj.SelectionIndex:
-                            valuelist_info["current_selection_name"] = item.Name
-                            valuelist_info["current_selection_value"] = str(item.Value)
+                    # Mark current selection
+                    if i == selection_index:
+                        valuelist_info["current_selection_name"] = item_name
+                        valuelist_info["current_selection_value"] = item_value
                 
-                valuelist_components.append(valuelist_info)
+            valuelist_components.append(valuelist_info)
         
         return {
             "success": True,
@@ -2830,20 +4411,12 @@ def handle_list_valuelists(data):
             "message": f"Found {len(valuelist_components)} ValueList components"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "valuelist_components": []
-        }
     except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error listing ValueList components: {str(e)}",
-            "traceback": traceback.format_exc(),
-            "valuelist_components": []
-        }
+        return error_response(
+            f"Error listing ValueList components: {str(e)}",
+            traceback=error_traceback(e),
+            valuelist_components=[]
+        )
 
 @gh_tool(
     name="set_grasshopper_valuelist_selection",
@@ -2856,11 +4429,12 @@ def handle_list_valuelists(data):
         "- **file_name** (str, required): Name of the .gh file containing the ValueList (e.g., 'Primary Truss Generator.gh')\n"
         "- **valuelist_name** (str): The name/nickname of the ValueList component to modify\n"
         "- **selection** (str or int): Either the name of the item to select or its index number\n"
+        "- **defer** (bool, optional): Skip the recompute; call 'commit_grasshopper_recompute' once after a series of edits\n"
         "\n**Returns:**\n"
         "Dictionary containing the operation status and updated ValueList information."
     )
 )
-async def set_grasshopper_valuelist_selection(file_name: str, valuelist_name: str, selection: str) -> Dict[str, Any]:
+async def set_grasshopper_valuelist_selection(file_name: str, valuelist_name: str, selection: str, defer: bool = False) -> Dict[str, Any]:
     """
     Set the selected item in a Grasshopper ValueList component via HTTP bridge.
 
@@ -2868,6 +4442,7 @@ async def set_grasshopper_valuelist_selection(file_name: str, valuelist_name: st
         file_name: Name of the .gh file containing the ValueList
         valuelist_name: Name of the ValueList component
         selection: Name or index of the item to select
+        defer: Leave the recompute to commit_grasshopper_recompute
 
     Returns:
         Dict containing operation results
@@ -2876,117 +4451,89 @@ async def set_grasshopper_valuelist_selection(file_name: str, valuelist_name: st
     request_data = {
         "file_name": file_name,
         "valuelist_name": valuelist_name,
-        "selection": selection
+        "selection": selection,
+        "defer": defer
     }
 
-    return call_bridge_api("/set_valuelist_selection", request_data)
+    return await call_bridge_api_async("/set_valuelist_selection", request_data)
 
 @bridge_handler("/set_valuelist_selection")
+@requires_grasshopper
+@holds_doc_lock
 def handle_set_valuelist_selection(data):
     """Bridge handler for setting ValueList selection"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-
         file_name = data.get('file_name', '')
         valuelist_name = data.get('valuelist_name', '')
         selection = data.get('selection', '')
 
-        # Ensure the correct file is active first
-        activation_result = ensure_file_is_active(file_name)
-        if not activation_result.get("success", False):
-            return {
-                "success": False,
-                "error": activation_result.get("error", "Failed to activate file"),
-                "file_name": file_name,
-                "valuelist_name": valuelist_name,
-                "selection": selection
-            }
-
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available",
-                "file_name": file_name,
-                "valuelist_name": valuelist_name,
-                "selection": selection
-            }
-
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found",
-                "file_name": file_name,
-                "valuelist_name": valuelist_name,
-                "selection": selection
-            }
+        gh_doc, error = get_active_gh_doc(file_name)
+        if error:
+            return error_response(
+                error,
+                file_name=file_name,
+                valuelist_name=valuelist_name,
+                selection=selection
+            )
         
         # Find the ValueList component
-        valuelist_found = False
-        old_selection = None
+        obj = find_special(gh_doc, GH_ValueList, valuelist_name)
+        if obj is None:
+            return error_response(
+                f"ValueList '{valuelist_name}' not found",
+                valuelist_name=valuelist_name,
+                selection=selection
+            )
+        
+        items = list_item_snapshot(obj)
+        old_index = obj.SelectionIndex
+        # SelectionIndex is -1 when nothing is selected
+        has_old = 0 <= old_index < len(items)
+        old_selection = {
+            "index": old_index,
+            "name": items[old_index][0] if has_old else None,
+            "value": items[old_index][1] if has_old else None
+        }
         new_selection_index = None
         new_selection_name = None
         new_selection_value = None
         
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                if (obj.NickName or "Unnamed") == valuelist_name:
-                    valuelist_found = True
-                    old_selection = {
-                        "index": obj.SelectionIndex,
-                        "name": obj.ListItems[obj.SelectionIndex].Name if obj.SelectionIndex < len(obj.ListItems) else None,
-                        "value": str(obj.ListItems[obj.SelectionIndex].Value) if obj.SelectionIndex < len(obj.ListItems) else None
-                    }
-                    
-                    # Try to find the selection by name or index
-                    selection_found = False
-                    
-                    # Try as index first
-                    try:
-                        index = int(selection)
-                        if 0 <= index < len(obj.ListItems):
-                            obj.SelectItem(index)
-                            new_selection_index = index
-                            new_selection_name = obj.ListItems[index].Name
-                            new_selection_value = str(obj.ListItems[index].Value)
-                            selection_found = True
-                    except ValueError:
-                        # Not an integer, try as name or value
-                        for i, item in enumerate(obj.ListItems):
-                            if item.Name == selection or str(item.Value) == selection:
-                                obj.SelectItem(i)
-                                new_selection_index = i
-                                new_selection_name = item.Name
-                                new_selection_value = str(item.Value)
-                                selection_found = True
-                                break
-                    
-                    if not selection_found:
-                        available_options = [f"{i}: {item.Name} ({item.Value})" for i, item in enumerate(obj.ListItems)]
-                        return {
-                            "success": False,
-                            "error": f"Selection '{selection}' not found in ValueList '{valuelist_name}'",
-                            "available_options": available_options,
-                            "valuelist_name": valuelist_name,
-                            "selection": selection
-                        }
-                    
-                    # Trigger solution recompute
-                    gh_doc.NewSolution(True)
+        # Try to find the selection by name or index
+        selection_found = False
+        
+        # Try as index first
+        try:
+            index = int(selection)
+            if 0 <= index < len(items):
+                obj.SelectItem(index)
+                new_selection_index = index
+                new_selection_name, new_selection_value = items[index]
+                selection_found = True
+        except ValueError:
+            # Not an integer, try as name or value
+            for i, (item_name, item_value) in enumerate(items):
+                if item_name == selection or item_value == selection:
+                    obj.SelectItem(i)
+                    new_selection_index = i
+                    new_selection_name, new_selection_value = item_name, item_value
+                    selection_found = True
                     break
         
-        if not valuelist_found:
-            return {
-                "success": False,
-                "error": f"ValueList '{valuelist_name}' not found",
-                "valuelist_name": valuelist_name,
-                "selection": selection
-            }
+        if not selection_found:
+            available_options = [f"{i}: {item_name} ({item_value})" for i, (item_name, item_value) in enumerate(items)]
+            return error_response(
+                f"Selection '{selection}' not found in ValueList '{valuelist_name}'",
+                available_options=available_options,
+                valuelist_name=valuelist_name,
+                selection=selection
+            )
+        
+        # Trigger solution recompute, or leave it to commit_recompute
+        if data.get('defer'):
+            _PENDING_RECOMPUTE.add(str(gh_doc.DocumentID))
+        else:
+            _PENDING_RECOMPUTE.discard(str(gh_doc.DocumentID))
+            gh_doc.NewSolution(True)
         
         return {
             "success": True,
@@ -3000,22 +4547,41 @@ def handle_set_valuelist_selection(data):
             "message": f"ValueList '{valuelist_name}' updated to '{new_selection_name}'"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "valuelist_name": data.get('valuelist_name', ''),
-            "selection": data.get('selection', '')
-        }
     except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error setting ValueList selection: {str(e)}",
-            "traceback": traceback.format_exc(),
-            "valuelist_name": data.get('valuelist_name', ''),
-            "selection": data.get('selection', '')
-        }
+        return error_response(
+            f"Error setting ValueList selection: {str(e)}",
+            traceback=error_traceback(e),
+            valuelist_name=data.get('valuelist_name', ''),
+            selection=data.get('selection', '')
+        )
+
+# DocumentIDs edited with defer=True and not yet recomputed
+_PENDING_RECOMPUTE = set()
+
+# Goo type -> whether its items expose .Value
+_GOO_VALUE_CACHE = {}
+
+def append_volatile_strings(volatile_data, values):
+    """
+    Append str(item.Value), or str(item) for goo without a Value, for every item of a data tree.
+    Each branch is pulled across the CLR boundary with a single enumeration.
+    """
+    append = values.append
+    for path in volatile_data.Paths:
+        branch = volatile_data.get_Branch(path)
+        if not branch:
+            continue
+        for item in list(branch):
+            if item is None:
+                continue
+            item_type = type(item)
+            has_value = _GOO_VALUE_CACHE.get(item_type)
+            if has_value is None:
+                has_value = _GOO_VALUE_CACHE[item_type] = hasattr(item_type, 'Value')
+            try:
+                append(str(item.Value) if has_value else str(item))
+            except Exception:
+                continue
 
 @gh_tool(
     name="list_grasshopper_panels",
@@ -3035,89 +4601,48 @@ async def list_grasshopper_panels() -> Dict[str, Any]:
         Dict containing Panel information
     """
     
-    return call_bridge_api("/list_panels", {})
+    return await call_bridge_api_async("/list_panels", {})
 
 @bridge_handler("/list_panels")
+@requires_grasshopper
 def handle_list_panels(data):
     """Bridge handler for listing Panel components"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available",
-                "panels": []
-            }
-        
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found",
-                "panels": []
-            }
+        gh_doc, error = get_active_gh_doc()
+        if error:
+            return error_response(error, panels=[])
         
         panels = []
         
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                panel_info = {
-                    "name": obj.NickName or "Unnamed",
-                    "user_text": obj.UserText if hasattr(obj, 'UserText') else "",
-                    "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)},
-                    "volatile_data": []
-                }
+        for obj in get_special_objects(gh_doc)[GH_Panel]:
+            obj_type = type(obj)
+            caps = _COMPONENT_CAPS_CACHE.get(obj_type) or _component_caps(obj_type)
+            panel_info = {
+                "name": obj.NickName or "Unnamed",
+                "user_text": obj.UserText if caps.has_user_text else "",
+                "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)},
+                "volatile_data": []
+            }
                 
-                # Try to extract volatile data (computed values)
-                try:
-                    if hasattr(obj, 'VolatileData') and obj.VolatileData:
-                        vd = obj.VolatileData
-                        # Try multiple ways to access the data
-                        for path in vd.Paths:
-                            branch = vd.get_Branch(path)
-                            if branch:
-                                for i in range(branch.Count):
-                                    try:
-                                        item = branch[i]
-                                        if item is not None:
-                                            # Try to get the actual value
-                                            if hasattr(item, 'Value'):
-                                                panel_info["volatile_data"].append(str(item.Value))
-                                            else:
-                                                panel_info["volatile_data"].append(str(item))
-                                    except Exception:
-                                        continue
+            # Try to extract volatile data (computed values)
+            try:
+                if caps.has_volatile_data and obj.VolatileData:
+                    append_volatile_strings(obj.VolatileData, panel_info["volatile_data"])
                     
-                    # Also try to get values from input parameters if panel is displaying input data
-                    if hasattr(obj, 'Params') and obj.Params.Input and obj.Params.Input.Count > 0:
-                        for i in range(obj.Params.Input.Count):
-                            input_param = obj.Params.Input[i]
-                            if hasattr(input_param, 'VolatileData') and input_param.VolatileData:
-                                input_vd = input_param.VolatileData
-                                for path in input_vd.Paths:
-                                    branch = input_vd.get_Branch(path)
-                                    if branch:
-                                        for j in range(branch.Count):
-                                            try:
-                                                item = branch[j]
-                                                if item is not None:
-                                                    if hasattr(item, 'Value'):
-                                                        panel_info["volatile_data"].append(str(item.Value))
-                                                    else:
-                                                        panel_info["volatile_data"].append(str(item))
-                                            except Exception:
-                                                continue
+                # Fall back to input parameters when the panel holds no data of its own;
+                # otherwise they carry the same values and would be listed twice
+                if not panel_info["volatile_data"] and caps.has_params and obj.Params.Input and obj.Params.Input.Count > 0:
+                    for i in range(obj.Params.Input.Count):
+                        input_param = obj.Params.Input[i]
+                        param_type = type(input_param)
+                        param_caps = _COMPONENT_CAPS_CACHE.get(param_type) or _component_caps(param_type)
+                        if param_caps.has_volatile_data and input_param.VolatileData:
+                            append_volatile_strings(input_param.VolatileData, panel_info["volatile_data"])
                                 
-                except Exception as e:
-                    panel_info["volatile_data_error"] = f"Error extracting data: {str(e)}"
+            except Exception as e:
+                panel_info["volatile_data_error"] = f"Error extracting data: {str(e)}"
                 
-                panels.append(panel_info)
+            panels.append(panel_info)
         
         return {
             "success": True,
@@ -3126,20 +4651,12 @@ def handle_list_panels(data):
             "message": f"Found {len(panels)} Panel components"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "panels": []
-        }
     except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error listing Panel components: {str(e)}",
-            "traceback": traceback.format_exc(),
-            "panels": []
-        }
+        return error_response(
+            f"Error listing Panel components: {str(e)}",
+            traceback=error_traceback(e),
+            panels=[]
+        )
 
 @gh_tool(
     name="set_grasshopper_panel_text",
@@ -3152,11 +4669,12 @@ def handle_list_panels(data):
         "- **file_name** (str, required): Name of the .gh file containing the Panel (e.g., 'Primary Truss Generator.gh')\n"
         "- **panel_name** (str): The name/nickname of the Panel component to modify\n"
         "- **new_text** (str): The new text content to set for the panel\n"
+        "- **defer** (bool, optional): Skip the recompute; call 'commit_grasshopper_recompute' once after a series of edits\n"
         "\n**Returns:**\n"
         "Dictionary containing the operation status and updated Panel information."
     )
 )
-async def set_grasshopper_panel_text(file_name: str, panel_name: str, new_text: str) -> Dict[str, Any]:
+async def set_grasshopper_panel_text(file_name: str, panel_name: str, new_text: str, defer: bool = False) -> Dict[str, Any]:
     """
     Set the text content of a Grasshopper Panel component via HTTP bridge.
 
@@ -3164,6 +4682,7 @@ async def set_grasshopper_panel_text(file_name: str, panel_name: str, new_text:
         file_name: Name of the .gh file containing the Panel
         panel_name: Name of the Panel component
         new_text: New text content to set
+        defer: Leave the recompute to commit_grasshopper_recompute
 
     Returns:
         Dict containing operation results
@@ -3172,81 +4691,44 @@ async def set_grasshopper_panel_text(file_name: str, panel_name: str, new_text:
     request_data = {
         "file_name": file_name,
         "panel_name": panel_name,
-        "new_text": new_text
+        "new_text": new_text,
+        "defer": defer
     }
 
-    return call_bridge_api("/set_panel_text", request_data)
+    return await call_bridge_api_async("/set_panel_text", request_data)
 
 @bridge_handler("/set_panel_text")
+@requires_grasshopper
+@holds_doc_lock
 def handle_set_panel_text(data):
     """Bridge handler for setting Panel text"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-
         file_name = data.get('file_name', '')
         panel_name = data.get('panel_name', '')
         new_text = str(data.get('new_text', ''))
 
-        # Ensure the correct file is active first
-        activation_result = ensure_file_is_active(file_name)
-        if not activation_result.get("success", False):
-            return {
-                "success": False,
-                "error": activation_result.get("error", "Failed to activate file"),
-                "file_name": file_name,
-                "panel_name": panel_name,
-                "new_text": new_text
-            }
-
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available",
-                "file_name": file_name,
-                "panel_name": panel_name,
-                "new_text": new_text
-            }
-
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found",
-                "file_name": file_name,
-                "panel_name": panel_name,
-                "new_text": new_text
-            }
+        gh_doc, error = get_active_gh_doc(file_name)
+        if error:
+            return error_response(error, file_name=file_name, panel_name=panel_name, new_text=new_text)
         
         # Find the Panel component
-        panel_found = False
-        old_text = None
+        obj = find_special(gh_doc, GH_Panel, panel_name)
+        if obj is None:
+            return error_response(f"Panel '{panel_name}' not found", panel_name=panel_name, new_text=new_text)
         
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                if (obj.NickName or "Unnamed") == panel_name:
-                    panel_found = True
-                    old_text = obj.UserText if hasattr(obj, 'UserText') else ""
-                    
-                    # Set the new text
-                    obj.UserText = new_text
-                    obj.ExpireSolution(True)
-                    
-                    # Trigger solution recompute
-                    gh_doc.NewSolution(True)
-                    break
+        old_text = obj.UserText if hasattr(obj, 'UserText') else ""
         
-        if not panel_found:
-            return {
-                "success": False,
-                "error": f"Panel '{panel_name}' not found",
-                "panel_name": panel_name,
-                "new_text": new_text
-            }
+        # Set the new text
+        defer = bool(data.get('defer'))
+        obj.UserText = new_text
+        obj.ExpireSolution(not defer)
+        
+        # Trigger solution recompute, or leave it to commit_recompute
+        if defer:
+            _PENDING_RECOMPUTE.add(str(gh_doc.DocumentID))
+        else:
+            _PENDING_RECOMPUTE.discard(str(gh_doc.DocumentID))
+            gh_doc.NewSolution(True)
         
         return {
             "success": True,
@@ -3256,23 +4738,71 @@ def handle_set_panel_text(data):
             "message": f"Panel '{panel_name}' text updated"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "panel_name": data.get('panel_name', ''),
-            "new_text": data.get('new_text', '')
-        }
     except Exception as e:
-        import traceback
+        return error_response(
+            f"Error setting Panel text: {str(e)}",
+            traceback=error_traceback(e),
+            panel_name=data.get('panel_name', ''),
+            new_text=data.get('new_text', '')
+        )
+
+@gh_tool(
+    name="commit_grasshopper_recompute",
+    description=(
+        "Recompute a Grasshopper definition once after a series of deferred edits. "
+        "Use this after calling 'set_grasshopper_valuelist_selection' or 'set_grasshopper_panel_text' "
+        "with defer=True, so N edits cost a single solver run.\n\n"
+        "**Parameters:**\n"
+        "- **file_name** (str, optional): Name of the .gh file to recompute; defaults to the active file\n"
+        "\n**Returns:**\n"
+        "Dictionary indicating whether a recompute was pending and has run."
+    )
+)
+async def commit_grasshopper_recompute(file_name: str = "") -> Dict[str, Any]:
+    """
+    Run the recompute skipped by deferred edits via HTTP bridge.
+
+    Args:
+        file_name: Name of the .gh file to recompute (optional)
+
+    Returns:
+        Dict containing operation results
+    """
+
+    return await call_bridge_api_async("/commit_recompute", {"file_name": file_name})
+
+@bridge_handler("/commit_recompute")
+@requires_grasshopper
+@holds_doc_lock
+def handle_commit_recompute(data):
+    """Bridge handler for running a deferred recompute"""
+    try:
+        file_name = data.get('file_name', '')
+
+        gh_doc, error = get_active_gh_doc(file_name)
+        if error:
+            return error_response(error, file_name=file_name)
+
+        doc_key = str(gh_doc.DocumentID)
+        if doc_key not in _PENDING_RECOMPUTE:
+            return {
+                "success": True,
+                "recomputed": False,
+                "message": "No deferred edits pending"
+            }
+
+        _PENDING_RECOMPUTE.discard(doc_key)
+        gh_doc.NewSolution(True)
+
         return {
-            "success": False,
-            "error": f"Error setting Panel text: {str(e)}",
-            "traceback": traceback.format_exc(),
-            "panel_name": data.get('panel_name', ''),
-            "new_text": data.get('new_text', '')
+            "success": True,
+            "recomputed": True,
+            "message": "Grasshopper definition recomputed"
         }
 
+    except Exception as e:
+        return error_response(f"Error recomputing definition: {str(e)}", traceback=error_traceback(e))
+
 @gh_tool(
     name="get_grasshopper_panel_data",
     description=(
@@ -3298,17 +4828,13 @@ async def get_grasshopper_panel_data(panel_name: str = "") -> Dict[str, Any]:
     
     request_data = {"panel_name": panel_name}
     
-    return call_bridge_api("/get_panel_data", request_data)
+    return await call_bridge_api_async("/get_panel_data", request_data)
 
 @bridge_handler("/get_panel_data")
+@requires_grasshopper
 def handle_get_panel_data(data):
     """Bridge handler for getting Panel data"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        
         panel_name = data.get('panel_name', '')
         
         # Get the Grasshopper plugin and document
@@ -3328,102 +4854,101 @@ def handle_get_panel_data(data):
         
         panel_data = []
         
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                current_panel_name = obj.NickName or "Unnamed"
+        for obj in get_special_objects(gh_doc)[GH_Panel]:
+            current_panel_name = obj.NickName or "Unnamed"
                 
-                # If specific panel requested, skip others
-                if panel_name and current_panel_name != panel_name:
-                    continue
+            # If specific panel requested, skip others
+            if panel_name and current_panel_name != panel_name:
+                continue
                 
-                panel_info = {
-                    "name": current_panel_name,
-                    "user_text": obj.UserText if hasattr(obj, 'UserText') else "",
-                    "volatile_data_text": "",
-                    "volatile_data_list": [],
-                    "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)},
-                    "computed_values": [],
-                    "display_text": ""
-                }
+            panel_info = {
+                "name": current_panel_name,
+                "user_text": obj.UserText if hasattr(obj, 'UserText') else "",
+                "volatile_data_text": "",
+                "volatile_data_list": [],
+                "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)},
+                "computed_values": [],
+                "display_text": ""
+            }
                 
-                # Extract volatile data (computed values)
-                try:
-                    all_values = []
+            # Extract volatile data (computed values)
+            try:
+                all_values = []
                     
-                    if hasattr(obj, 'VolatileData') and obj.VolatileData:
-                        vd = obj.VolatileData
+                if hasattr(obj, 'VolatileData') and obj.VolatileData:
+                    vd = obj.VolatileData
                         
-                        for path in vd.Paths:
-                            branch = vd.get_Branch(path)
-                            if branch:
-                                for i in range(branch.Count):
-                                    try:
-                                        item = branch[i]
-                                        if item is not None:
-                                            # Try to get the actual value
-                                            if hasattr(item, 'Value'):
-                                                item_str = str(item.Value).replace('"', "'")
-                                                all_values.append(item_str)
-                                            else:
-                                                item_str = str(item).replace('"', "'")
-                                                all_values.append(item_str)
-                                    except Exception:
-                                        continue
+                    for path in vd.Paths:
+                        branch = vd.get_Branch(path)
+                        if branch:
+                            for i in range(branch.Count):
+                                try:
+                                    item = branch[i]
+                                    if item is not None:
+                                        # Try to get the actual value
+                                        if hasattr(item, 'Value'):
+                                            item_str = str(item.Value).replace('"', "'")
+                                            all_values.append(item_str)
+                                        else:
+                                            item_str = str(item).replace('"', "'")
+                                            all_values.append(item_str)
+                                except Exception:
+                                    continue
                     
-                    # Also try to get values from input parameters if panel is displaying input data
-                    if hasattr(obj, 'Params') and obj.Params.Input and obj.Params.Input.Count > 0:
-                        for i in range(obj.Params.Input.Count):
-                            input_param = obj.Params.Input[i]
-                            if hasattr(input_param, 'VolatileData') and input_param.VolatileData:
-                                input_vd = input_param.VolatileData
-                                for path in input_vd.Paths:
-                                    branch = input_vd.get_Branch(path)
-                                    if branch:
-                                        for j in range(branch.Count):
-                                            try:
-                                                item = branch[j]
-                                                if item is not None:
-                                                    if hasattr(item, 'Value'):
-                                                        item_str = str(item.Value).replace('"', "'")
-                                                        all_values.append(item_str)
-                                                    else:
-                                                        item_str = str(item).replace('"', "'")
-                                                        all_values.append(item_str)
-                                            except Exception:
-                                                continue
+                # Also try to get values from input parameters if panel is displaying input data
+                if hasattr(obj, 'Params') and obj.Params.Input and obj.Params.Input.Count > 0:
+                    for i in range(obj.Params.Input.Count):
+                        input_param = obj.Params.Input[i]
+                        if hasattr(input_param, 'VolatileData') and input_param.VolatileData:
+                            input_vd = input_param.VolatileData
+                            for path in input_vd.Paths:
+                                branch = input_vd.get_Branch(path)
+                                if branch:
+                                    for j in range(branch.Count):
+                                        try:
+                                            item = branch[j]
+                                            if item is not None:
+                                                if hasattr(item, 'Value'):
+                                                    item_str = str(item.Value).replace('"', "'")
+                                                    all_values.append(item_str)
+                                                else:
+                                                    item_str = str(item).replace('"', "'")
+                                                    all_values.append(item_str)
+                                        except Exception:
+                                            continue
                     
-                    panel_info["volatile_data_list"] = all_values
-                    panel_info["volatile_data_text"] = ','.join(all_values) if all_values else ""
-                    panel_info["computed_values"] = all_values
+                panel_info["volatile_data_list"] = all_values
+                panel_info["volatile_data_text"] = ','.join(all_values) if all_values else ""
+                panel_info["computed_values"] = all_values
                     
-                    # Try to extract display text from the panel itself
-                    try:
-                        if hasattr(obj, 'ToString'):
-                            panel_info["display_text"] = str(obj.ToString())
-                    except:
-                        pass
+                # Try to extract display text from the panel itself
+                try:
+                    if hasattr(obj, 'ToString'):
+                        panel_info["display_text"] = str(obj.ToString())
+                except:
+                    pass
                         
-                    # Try alternative methods to get the actual displayed content
-                    try:
-                        if hasattr(obj, 'Properties'):
-                            if hasattr(obj.Properties, 'Text'):
-                                panel_info["display_text"] = str(obj.Properties.Text)
-                    except:
-                        pass
+                # Try alternative methods to get the actual displayed content
+                try:
+                    if hasattr(obj, 'Properties'):
+                        if hasattr(obj.Properties, 'Text'):
+                            panel_info["display_text"] = str(obj.Properties.Text)
+                except:
+                    pass
                         
-                    # Try to get text from the panel's visual representation
-                    try:
-                        if hasattr(obj, 'GetValue'):
-                            value = obj.GetValue(0, 0)  # Try to get first value
-                            if value is not None:
-                                panel_info["display_text"] = str(value)
-                    except:
-                        pass
+                # Try to get text from the panel's visual representation
+                try:
+                    if hasattr(obj, 'GetValue'):
+                        value = obj.GetValue(0, 0)  # Try to get first value
+                        if value is not None:
+                            panel_info["display_text"] = str(value)
+                except:
+                    pass
                         
-                except Exception as e:
-                    panel_info["volatile_data_error"] = f"Could not extract volatile data: {str(e)}"
+            except Exception as e:
+                panel_info["volatile_data_error"] = f"Could not extract volatile data: {str(e)}"
                 
-                panel_data.append(panel_info)
+            panel_data.append(panel_info)
         
         if panel_name and not panel_data:
             return {
@@ -3438,17 +4963,11 @@ def handle_get_panel_data(data):
             "message": f"Retrieved data from {len(panel_data)} panel(s)"
         }
         
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error getting Panel data: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 @gh_tool(
@@ -3483,22 +5002,17 @@ async def analyze_grasshopper_inputs_with_context(file_name: str) -> Dict[str, A
         "file_name": file_name
     }
 
-    return call_bridge_api("/analyze_inputs_context", request_data)
+    return await call_bridge_api_async("/analyze_inputs_context", request_data)
 
 @bridge_handler("/analyze_inputs_context")
+@requires_grasshopper
 def handle_analyze_inputs_context(data):
     """Bridge handler for analyzing inputs with context"""
-    import traceback
     debug_log = []
 
     try:
         debug_log.append("Starting analyze_inputs_context handler")
 
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import System
 
         debug_log.append("Imports successful")
 
@@ -3542,11 +5056,14 @@ def handle_analyze_inputs_context(data):
 
         debug_log.append(f"Found Grasshopper document with {gh_doc.ObjectCount} objects")
 
+        # Walk the document once; the loops below all reuse this list
+        objects = list(gh_doc.Objects)
+
         # Build a map of groups and their contained objects
         groups_map = {}
         debug_log.append("Building groups map")
 
-        for obj in gh_doc.Objects:
+        for obj in objects:
             if isinstance(obj, Grasshopper.Kernel.Special.GH_Group):
                 # Get bounds - GH_Group uses Attributes.Bounds not obj.Bounds
                 bounds_rect = obj.Attributes.Bounds if hasattr(obj.Attributes, 'Bounds') else None
@@ -3572,7 +5089,7 @@ def handle_analyze_inputs_context(data):
         scribbles = []
         debug_log.append("Mapping components to groups and finding scribbles")
 
-        for obj in gh_doc.Objects:
+        for obj in objects:
             try:
                 obj_guid = str(obj.InstanceGuid)
 
@@ -3643,51 +5160,50 @@ def handle_analyze_inputs_context(data):
         sliders_with_context = []
         debug_log.append("Analyzing sliders with context")
 
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                try:
-                    obj_guid = str(obj.InstanceGuid)
-                    position = {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)}
+        for obj in get_slider_index(gh_doc)[0]:
+            try:
+                obj_guid = str(obj.InstanceGuid)
+                position = {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)}
 
-                    slider_info = {
-                        "name": obj.NickName or "Unnamed",
-                        "current_value": float(str(obj.Slider.Value)),
-                        "min_value": float(str(obj.Slider.Minimum)),
-                        "max_value": float(str(obj.Slider.Maximum)),
-                        "precision": obj.Slider.DecimalPlaces,
-                        "type": obj.Slider.Type.ToString(),
-                        "position": position,
-                        "group_name": component_group_map.get(obj_guid, None),
-                        "nearby_annotations": find_nearby_annotations(position),
-                        "inferred_purpose": "Unknown"
-                    }
+                slider_info = {
+                    "name": obj.NickName or "Unnamed",
+                    "current_value": System.Decimal.ToDouble(obj.Slider.Value),
+                    "min_value": System.Decimal.ToDouble(obj.Slider.Minimum),
+                    "max_value": System.Decimal.ToDouble(obj.Slider.Maximum),
+                    "precision": obj.Slider.DecimalPlaces,
+                    "type": obj.Slider.Type.ToString(),
+                    "position": position,
+                    "group_name": component_group_map.get(obj_guid, None),
+                    "nearby_annotations": find_nearby_annotations(position),
+                    "inferred_purpose": "Unknown"
+                }
 
-                    # Enhanced purpose inference using group name and annotations
-                    all_context_text = (slider_info["name"] + " " +
-                                       (slider_info["group_name"] or "") + " " +
-                                       " ".join([ann["text"] for ann in slider_info["nearby_annotations"]])).lower()
-
-                    if any(kw in all_context_text for kw in ["length", "distance", "span"]):
-                        slider_info["inferred_purpose"] = "Length/Distance control"
-                    elif any(kw in all_context_text for kw in ["width", "wide"]):
-                        slider_info["inferred_purpose"] = "Width control"
-                    elif any(kw in all_context_text for kw in ["height", "tall", "depth"]):
-                        slider_info["inferred_purpose"] = "Height/Depth control"
-                    elif any(kw in all_context_text for kw in ["count", "number", "quantity", "num"]):
-                        slider_info["inferred_purpose"] = "Count/Quantity control"
-                    elif any(kw in all_context_text for kw in ["angle", "rotation", "rotate"]):
-                        slider_info["inferred_purpose"] = "Angle/Rotation control"
-                    elif any(kw in all_context_text for kw in ["factor", "ratio", "proportion"]):
-                        slider_info["inferred_purpose"] = "Factor/Ratio control"
-                    elif any(kw in all_context_text for kw in ["truss", "structural", "beam"]):
-                        slider_info["inferred_purpose"] = "Structural parameter"
-                    elif slider_info["group_name"]:
-                        slider_info["inferred_purpose"] = f"Parameter for {slider_info['group_name']}"
-
-                    sliders_with_context.append(slider_info)
-                except Exception as slider_error:
-                    debug_log.append(f"Error processing slider {obj.NickName if hasattr(obj, 'NickName') else 'unknown'}: {str(slider_error)}")
-                    continue
+                # Enhanced purpose inference using group name and annotations
+                all_context_text = (slider_info["name"] + " " +
+                                   (slider_info["group_name"] or "") + " " +
+                                   " ".join([ann["text"] for ann in slider_info["nearby_annotations"]])).lower()
+
+                if any(kw in all_context_text for kw in ["length", "distance", "span"]):
+                    slider_info["inferred_purpose"] = "Length/Distance control"
+                elif any(kw in all_context_text for kw in ["width", "wide"]):
+                    slider_info["inferred_purpose"] = "Width control"
+                elif any(kw in all_context_text for kw in ["height", "tall", "depth"]):
+                    slider_info["inferred_purpose"] = "Height/Depth control"
+                elif any(kw in all_context_text for kw in ["count", "number", "quantity", "num"]):
+                    slider_info["inferred_purpose"] = "Count/Quantity control"
+                elif any(kw in all_context_text for kw in ["angle", "rotation", "rotate"]):
+                    slider_info["inferred_purpose"] = "Angle/Rotation control"
+                elif any(kw in all_context_text for kw in ["factor", "ratio", "proportion"]):
+                    slider_info["inferred_purpose"] = "Factor/Ratio control"
+                elif any(kw in all_context_text for kw in ["truss", "structural", "beam"]):
+                    slider_info["inferred_purpose"] = "Structural parameter"
+                elif slider_info["group_name"]:
+                    slider_info["inferred_purpose"] = f"Parameter for {slider_info['group_name']}"
+
+                sliders_with_context.append(slider_info)
+            except Exception as slider_error:
+                debug_log.append(f"Error processing slider {obj.NickName if hasattr(obj, 'NickName') else 'unknown'}: {str(slider_error)}")
+                continue
 
         debug_log.append(f"Found {len(sliders_with_context)} sliders with context")
 
@@ -3706,9 +5222,11 @@ def handle_analyze_inputs_context(data):
             "Grasshopper.Kernel.Parameters.Param_Point"
         ]
 
-        for obj in gh_doc.Objects:
+        for obj in objects:
             try:
-                obj_type = type(obj).__module__ + "." + type(obj).__name__
+                cls = type(obj)
+                cls_name = cls.__name__
+                obj_type = cls.__module__ + "." + cls_name
 
                 # Check if it's a geometry parameter type
                 is_geometry_param = any(geom_type in obj_type for geom_type in geometry_param_types)
@@ -3729,7 +5247,7 @@ def handle_analyze_inputs_context(data):
                     if not has_sources and has_recipients:
                         geom_info = {
                             "name": obj.NickName or "Unnamed",
-                            "type": type(obj).__name__,
+                            "type": cls_name,
                             "full_type": obj_type,
                             "position": position,
                             "group_name": component_group_map.get(obj_guid, None),
@@ -3779,19 +5297,12 @@ def handle_analyze_inputs_context(data):
             "debug_log": debug_log
         }
 
-    except ImportError as e:
-        debug_log.append(f"ImportError: {str(e)}")
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "debug_log": debug_log
-        }
     except Exception as e:
         debug_log.append(f"Exception in main handler: {str(e)}")
         return {
             "success": False,
             "error": f"Error analyzing inputs: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": error_traceback(e),
             "debug_log": debug_log
         }
 
@@ -3826,16 +5337,13 @@ async def analyze_grasshopper_outputs_with_context(file_name: str = None) -> Dic
         "file_name": file_name
     }
 
-    return call_bridge_api("/analyze_outputs_context", request_data)
+    return await call_bridge_api_async("/analyze_outputs_context", request_data)
 
 @bridge_handler("/analyze_outputs_context")
+@requires_grasshopper
 def handle_analyze_outputs_context(data):
     """Bridge handler for analyzing outputs with context"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
         import os
 
         # Get the Grasshopper plugin and document
@@ -3875,9 +5383,12 @@ def handle_analyze_outputs_context(data):
                     "error": "No active Grasshopper document found"
                 }
 
+        # Walk the document once; the loops below all reuse this list
+        objects = list(gh_doc.Objects)
+
         # Build groups map and scribbles (reuse logic from inputs analysis)
         groups_map = {}
-        for obj in gh_doc.Objects:
+        for obj in objects:
             if isinstance(obj, Grasshopper.Kernel.Special.GH_Group):
                 # Get bounds - GH_Group uses Attributes.Bounds not obj.Bounds
                 bounds_rect = obj.Attributes.Bounds if hasattr(obj.Attributes, 'Bounds') else None
@@ -3897,7 +5408,7 @@ def handle_analyze_outputs_context(data):
         component_group_map = {}
         scribbles = []
 
-        for obj in gh_doc.Objects:
+        for obj in objects:
             obj_guid = str(obj.InstanceGuid)
             obj_bounds = {
                 "x": float(obj.Attributes.Pivot.X),
@@ -3954,8 +5465,10 @@ def handle_analyze_outputs_context(data):
             "Grasshopper.Kernel.Parameters.Param_Mesh"
         ]
 
-        for obj in gh_doc.Objects:
-            obj_type = type(obj).__module__ + "." + type(obj).__name__
+        for obj in objects:
+            cls = type(obj)
+            cls_name = cls.__name__
+            obj_type = cls.__module__ + "." + cls_name
 
             # Check if it's a geometry parameter type
             is_geometry_param = any(geom_type in obj_type for geom_type in geometry_param_types)
@@ -3972,7 +5485,7 @@ def handle_analyze_outputs_context(data):
                 if has_sources and not has_recipients:
                     geom_info = {
                         "name": obj.NickName or "Unnamed",
-                        "type": type(obj).__name__,
+                        "type": cls_name,
                         "full_type": obj_type,
                         "position": position,
                         "group_name": component_group_map.get(obj_guid, None),
@@ -4040,17 +5553,11 @@ def handle_analyze_outputs_context(data):
             "summary": f"Found {len(geometry_outputs)} geometry outputs with contextual information"
         }
 
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error analyzing outputs: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 @gh_tool(
@@ -4087,18 +5594,14 @@ async def set_grasshopper_geometry_input(file_name: str, parameter_name: str, rh
         "rhino_object_ids": rhino_object_ids
     }
 
-    return call_bridge_api("/set_geometry_input", request_data)
+    return await call_bridge_api_async("/set_geometry_input", request_data)
 
 @bridge_handler("/set_geometry_input")
+@requires_grasshopper
+@holds_doc_lock
 def handle_set_geometry_input(data):
     """Bridge handler for setting geometry input"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
-        import System
         import scriptcontext as sc
         import os
 
@@ -4289,17 +5792,11 @@ def handle_set_geometry_input(data):
             "message": f"Successfully set {len(geometries_added)} geometry object(s) to parameter '{parameter_name}' (replaced existing data)"
         }
 
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error setting geometry input: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 @gh_tool(
@@ -4344,17 +5841,13 @@ async def extract_grasshopper_geometry_output(
         "layer_name": layer_name
     }
 
-    return call_bridge_api("/extract_geometry_output", request_data)
+    return await call_bridge_api_async("/extract_geometry_output", request_data)
 
 @bridge_handler("/extract_geometry_output")
+@requires_grasshopper
 def handle_extract_geometry_output(data):
     """Bridge handler for extracting geometry output"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
         import rhinoscriptsyntax as rs
         import scriptcontext as sc
 
@@ -4637,17 +6130,11 @@ def handle_extract_geometry_output(data):
 
         return result
 
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error extracting geometry output: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 # ============================================================================
@@ -4659,7 +6146,6 @@ def convert_geometry_to_base(geom, debug_log=None):
     Convert various Rhino geometry types to GeometryBase for adding to document.
     Returns (converted_geometry, original_type_name, converted_type_name, success, error_message)
     """
-    import Rhino
 
     if geom is None:
         return (None, "None", "None", False, "Geometry is None")
@@ -4743,7 +6229,6 @@ def validate_geometry_compatibility(source_types, target_param_obj, debug_log=No
     Validate if source geometry types are compatible with target parameter.
     Returns (is_compatible, warning_message)
     """
-    import Grasshopper
 
     if not target_param_obj:
         return (True, None)  # Can't validate without target
@@ -4846,18 +6331,13 @@ async def transfer_eml_geometry_between_files(
         "auto_open_files": auto_open_files
     }
 
-    return call_bridge_api("/transfer_eml_geometry", request_data)
+    return await call_bridge_api_async("/transfer_eml_geometry", request_data)
 
 @bridge_handler("/transfer_eml_geometry")
+@holds_doc_lock
 def handle_transfer_eml_geometry(data):
     """Bridge handler for transferring geometry between files"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
-        import System
         import scriptcontext as sc
         import os
 
@@ -4883,12 +6363,11 @@ def handle_transfer_eml_geometry(data):
 
         # Helper function to find and open file
         def open_gh_file_if_needed(file_name):
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            library_path = os.path.join(script_dir, "Grasshopper File Library")
+            library_path = _LIBRARY_PATH
 
             # Find the file
             target_file = None
-            for root, dirs, files in os.walk(library_path):
+            for root, dirs, files in walk_library(library_path):
                 for file in files:
                     if file.lower() == file_name.lower():
                         target_file = os.path.join(root, file)
@@ -4962,8 +6441,9 @@ def handle_transfer_eml_geometry(data):
                     debug_info.append(f"WARNING: No active canvas after OpenDocument")
             except Exception as e:
                 debug_info.append(f"ERROR activating source file: {str(e)}")
-                import traceback
-                debug_info.append(f"Traceback: {traceback.format_exc()[:300]}")
+                tb = error_traceback(e)
+                if tb:
+                    debug_info.append(f"Traceback: {tb[:300]}")
 
         # Find source parameter and extract geometry
         source_obj = None
@@ -5030,11 +6510,10 @@ def handle_transfer_eml_geometry(data):
                             else:
                                 debug_info.append(f"WARNING: Failed to add {orig_type} (as {conv_type}) to Rhino document")
         except Exception as e:
-            import traceback
             return {
                 "success": False,
                 "error": f"Error extracting geometry: {str(e)}",
-                "traceback": traceback.format_exc(),
+                "traceback": error_traceback(e),
                 "debug_info": debug_info
             }
 
@@ -5086,8 +6565,9 @@ def handle_transfer_eml_geometry(data):
                     debug_info.append(f"WARNING: No active canvas after OpenDocument")
             except Exception as e:
                 debug_info.append(f"ERROR activating target file: {str(e)}")
-                import traceback
-                debug_info.append(f"Traceback: {traceback.format_exc()[:300]}")
+                tb = error_traceback(e)
+                if tb:
+                    debug_info.append(f"Traceback: {tb[:300]}")
 
         # Find target parameter
         target_obj = None
@@ -5181,9 +6661,10 @@ def handle_transfer_eml_geometry(data):
             return result
 
         except Exception as e:
-            import traceback
             debug_info.append(f"ERROR during injection: {str(e)}")
-            debug_info.append(f"Traceback: {traceback.format_exc()[:500]}")
+            tb = error_traceback(e)
+            if tb:
+                debug_info.append(f"Traceback: {tb[:500]}")
 
             # Clean up temporary Rhino objects
             for obj_id in rhino_object_ids:
@@ -5194,16 +6675,15 @@ def handle_transfer_eml_geometry(data):
             return {
                 "success": False,
                 "error": f"Error injecting geometry: {str(e)}",
-                "traceback": traceback.format_exc(),
+                "traceback": error_traceback(e),
                 "debug_info": debug_info
             }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error in geometry transfer: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": error_traceback(e),
             "debug_info": debug_info if 'debug_info' in locals() else []
         }
 
@@ -5263,18 +6743,13 @@ async def execute_eml_workflow(
         "auto_discover": auto_discover
     }
 
-    return call_bridge_api("/execute_eml_workflow", request_data)
+    return await call_bridge_api_async("/execute_eml_workflow", request_data)
 
 @bridge_handler("/execute_eml_workflow")
+@holds_doc_lock
 def handle_execute_eml_workflow(data):
     """Bridge handler for executing EML workflows"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
-        import System
         import scriptcontext as sc
         import os
         import re
@@ -5318,12 +6793,11 @@ def handle_execute_eml_workflow(data):
 
         # Helper function to open/get file
         def get_gh_document(file_name):
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            library_path = os.path.join(script_dir, "Grasshopper File Library")
+            library_path = _LIBRARY_PATH
 
             # Find the file
             target_file = None
-            for root, dirs, files in os.walk(library_path):
+            for root, dirs, files in walk_library(library_path):
                 for file in files:
                     if file.lower() == file_name.lower():
                         target_file = os.path.join(root, file)
@@ -5523,11 +6997,10 @@ def handle_execute_eml_workflow(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error executing workflow: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 # ============================================================================
@@ -5572,7 +7045,7 @@ async def bake_grasshopper_geometry_to_rhino(
     """
     Handler for explicit geometry baking with user confirmation.
     """
-    return call_bridge_api("/bake_gh_geometry", {
+    return await call_bridge_api_async("/bake_gh_geometry", {
         "file_name": file_name,
         "parameter_names": parameter_names,
         "layer_name": layer_name,
@@ -5586,14 +7059,8 @@ async def bake_grasshopper_geometry_to_rhino(
 def handle_bake_gh_geometry(data):
     """Bridge handler for explicit geometry baking"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
         import rhinoscriptsyntax as rs
         import scriptcontext as sc
-        import System
 
         file_name = data.get('file_name', '')
         parameter_names = data.get('parameter_names', [])
@@ -5804,11 +7271,10 @@ def handle_bake_gh_geometry(data):
                 total_baked += len(baked_ids)
 
             except Exception as e:
-                import traceback
                 baking_results[param_name] = {
                     "success": False,
                     "error": str(e),
-                    "traceback": traceback.format_exc()
+                    "traceback": error_traceback(e)
                 }
 
         return {
@@ -5821,11 +7287,10 @@ def handle_bake_gh_geometry(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error baking geometry: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 
@@ -5867,7 +7332,7 @@ async def execute_custom_python_script(
     """
     Handler for custom script execution with debugging.
     """
-    return call_bridge_api("/execute_custom_script", {
+    return await call_bridge_api_async("/execute_custom_script", {
         "script_code": script_code,
         "script_description": script_description,
         "return_variable": return_variable
@@ -5878,14 +7343,8 @@ async def execute_custom_python_script(
 def handle_execute_custom_script(data):
     """Bridge handler for custom script execution"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
         import rhinoscriptsyntax as rs
         import scriptcontext as sc
-        import System
         import math
         import io
         import sys
@@ -5980,7 +7439,6 @@ def handle_execute_custom_script(data):
             return result
 
         except Exception as e:
-            import traceback
 
             # Restore stdout/stderr
             sys.stdout = old_stdout
@@ -5992,7 +7450,7 @@ def handle_execute_custom_script(data):
             return {
                 "success": False,
                 "error": f"Script execution failed: {str(e)}",
-                "traceback": traceback.format_exc(),
+                "traceback": error_traceback(e),
                 "output": output_text if output_text else None,
                 "errors": error_text if error_text else None,
                 "debug_log": debug_log,
@@ -6000,11 +7458,10 @@ def handle_execute_custom_script(data):
             }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error in script handler: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 
@@ -6039,7 +7496,7 @@ async def suggest_gh_workflow(
     """
     Get workflow suggestions based on metadata.
     """
-    return call_bridge_api("/suggest_workflow", {
+    return await call_bridge_api_async("/suggest_workflow", {
         "goal": goal,
         "category": category,
         "workflow_id": workflow_id
@@ -6057,10 +7514,8 @@ def handle_suggest_workflow(data):
         category = data.get('category', '').lower()
         workflow_id = data.get('workflow_id', '')
 
-        # Get the library path and load metadata
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        library_path = os.path.join(script_dir, "Grasshopper File Library")
-        metadata_path = os.path.join(library_path, "metadata.json")
+        # Load the library metadata
+        metadata_path = _METADATA_PATH
 
         if not os.path.exists(metadata_path):
             return {
@@ -6137,11 +7592,10 @@ def handle_suggest_workflow(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error suggesting workflows: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": error_traceback(e)
         }
 
 
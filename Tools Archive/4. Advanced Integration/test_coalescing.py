@@ -0,0 +1,107 @@
+"""
+Tests for the coalesced bridge calls in gh_tools (slider drags and file closes).
+
+Run from this directory with: python -m unittest test_coalescing
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'MCP'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import gh_tools
+
+
+class FakeBridge:
+    """Stands in for call_bridge_api_async, recording each endpoint it is called with"""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, endpoint, data=None):
+        self.calls.append((endpoint, data))
+        await asyncio.sleep(self.delay)
+        if endpoint == "/set_multiple_sliders":
+            return {"success": True, "results": [
+                {"slider_name": name, "success": True, "new_value": value}
+                for name, value in data["slider_updates"].items()
+            ]}
+        if endpoint == "/close_gh_files":
+            return {"success": True, "results": [
+                {"success": True, "file_name": name} for name in data["file_names"]
+            ]}
+        return {"success": True, "echo": data}
+
+
+class SliderCoalescingTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.bridge = FakeBridge()
+        patcher = mock.patch.object(gh_tools, "call_bridge_api_async", self.bridge)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_follower_completes_when_leader_cancelled_while_gathering(self):
+        leader = asyncio.ensure_future(gh_tools._set_slider_coalesced("a.gh", "Width", 1.0))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(gh_tools._set_slider_coalesced("a.gh", "Height", 2.0))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        result = await asyncio.wait_for(follower, 1)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.bridge.calls[0][0], "/set_slider")
+        self.assertEqual(self.bridge.calls[0][1]["slider_name"], "Height")
+        self.assertNotIn("a.gh", gh_tools._pending_slider_sets)
+
+    async def test_follower_completes_when_leader_cancelled_during_send(self):
+        leader = asyncio.ensure_future(gh_tools._set_slider_coalesced("a.gh", "Width", 1.0))
+        follower = asyncio.ensure_future(gh_tools._set_slider_coalesced("a.gh", "Height", 2.0))
+        await asyncio.sleep(gh_tools._SLIDER_BATCH_WINDOW + 0.005)
+        self.assertEqual(len(self.bridge.calls), 1)
+        leader.cancel()
+
+        result = await asyncio.wait_for(follower, 1)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["new_value"], 2.0)
+
+    async def test_later_calls_are_not_stranded(self):
+        leader = asyncio.ensure_future(gh_tools._set_slider_coalesced("a.gh", "Width", 1.0))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+
+        result = await asyncio.wait_for(gh_tools._set_slider_coalesced("a.gh", "Width", 3.0), 1)
+
+        self.assertTrue(result["success"])
+
+
+class CloseCoalescingTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.bridge = FakeBridge()
+        patcher = mock.patch.object(gh_tools, "call_bridge_api_async", self.bridge)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_follower_completes_when_leader_cancelled(self):
+        leader = asyncio.ensure_future(gh_tools._close_coalesced("a.gh", False))
+        follower = asyncio.ensure_future(gh_tools._close_coalesced("b.gh", False))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        result = await asyncio.wait_for(follower, 1)
+
+        self.assertEqual(result["echo"]["file_name"], "b.gh")
+        self.assertEqual(gh_tools._pending_closes, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ without manually updating registration lists.
 import importlib
 import os
 import sys
+import traceback
 from typing import Dict, Any, List, Callable, Optional
 from functools import wraps
 
@@ -145,9 +146,6 @@ def bridge_handler(endpoint: str):
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            import traceback
-            import sys
-
             try:
                 # Log the handler call for debugging
                 print(f"[BRIDGE] Executing handler for endpoint: {endpoint}")
@@ -298,7 +296,6 @@ def discover_tools() -> Dict[str, List[ToolDefinition]]:
                 os.chdir(original_cwd)
         except Exception as e:
             print(f"[DISCOVERY] Warning: Could not import {module_name}.py: {e}")
-            import traceback
             print(traceback.format_exc())
 
     print(f"[DISCOVERY] Registered {len(_rhino_tools)} Rhino tools, {len(_gh_tools)} Grasshopper tools, {len(_custom_tools)} Custom tools, {len(_bridge_handlers)} bridge handlers")